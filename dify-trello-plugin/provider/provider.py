@@ -7,16 +7,36 @@ from typing import Any, Dict
 from core.tools.provider.base_provider import BaseToolProvider
 from core.tools.errors import ToolProviderCredentialValidationError
 
+from utils.api_client import TrelloAPIClient
+from utils.circuit_breaker import CircuitOpenError
+from utils.tracing import tracer
+
 
 class TrelloProvider(BaseToolProvider):
     """
     Trello provider for DIFY platform
     """
     
+    # Credential checks make a single short attempt so a Trello outage cannot hold the caller
+    VALIDATION_TIMEOUT = 10  # seconds
+    
     def _validate_credentials(self, credentials: Dict[str, Any]) -> None:
         """
         Validate Trello API credentials
         
+        Args:
+            credentials: Dictionary containing API key and token
+            
+        Raises:
+            ToolProviderCredentialValidationError: If credentials are invalid
+        """
+        with tracer.span('trello.validate_credentials', profile=True):
+            self._check_credentials(credentials)
+    
+    def _check_credentials(self, credentials: Dict[str, Any]) -> None:
+        """
+        Check Trello API credentials against the members/me endpoint
+        
         Args:
             credentials: Dictionary containing API key and token
             
@@ -30,30 +50,30 @@ class TrelloProvider(BaseToolProvider):
             if not api_key or not token:
                 raise ToolProviderCredentialValidationError('API key and token are required')
             
-            # Test API connectivity with a simple call
-            url = f"https://api.trello.com/1/members/me"
-            params = {
-                'key': api_key,
-                'token': token
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 401:
-                raise ToolProviderCredentialValidationError('Invalid API key or token')
-            elif response.status_code == 403:
-                raise ToolProviderCredentialValidationError('Access denied. Please check your token permissions')
-            elif response.status_code != 200:
-                raise ToolProviderCredentialValidationError(f'API validation failed: {response.status_code}')
+            # Test API connectivity with a simple call through the shared client,
+            # so validation is subject to the same circuit breakers as the tools
+            client = TrelloAPIClient(api_key, token, timeout=self.VALIDATION_TIMEOUT, max_retries=0)
+            with tracer.span('trello.member_check') as member_span:
+                try:
+                    user_data = client.get_user_info(fields='id')
+                except requests.exceptions.HTTPError as e:
+                    status_code = e.response.status_code if e.response is not None else None
+                    member_span.set_attribute('http.response.status_code', status_code or 0)
+                    if status_code == 401:
+                        raise ToolProviderCredentialValidationError('Invalid API key or token')
+                    elif status_code == 403:
+                        raise ToolProviderCredentialValidationError('Access denied. Please check your token permissions')
+                    raise ToolProviderCredentialValidationError(f'API validation failed: {status_code}')
+                except ValueError:
+                    raise ToolProviderCredentialValidationError('Invalid API response format')
+                member_span.set_attribute('http.response.status_code', 200)
                 
             # Verify the response contains expected user data
-            try:
-                user_data = response.json()
-                if 'id' not in user_data:
-                    raise ToolProviderCredentialValidationError('Invalid API response format')
-            except ValueError:
+            if not isinstance(user_data, dict) or 'id' not in user_data:
                 raise ToolProviderCredentialValidationError('Invalid API response format')
                 
+        except CircuitOpenError as e:
+            raise ToolProviderCredentialValidationError(f'{str(e)}. Please try again later')
         except requests.exceptions.Timeout:
             raise ToolProviderCredentialValidationError('API request timeout. Please check your network connection')
         except requests.exceptions.ConnectionError:
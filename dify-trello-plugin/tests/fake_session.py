@@ -0,0 +1,205 @@
+"""
+In-memory stand-in for requests.Session used by the unit tests
+"""
+import json
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+
+from utils.api_client import TrelloAPIClient
+from utils.circuit_breaker import CircuitBreaker
+
+Handler = Callable[[str, str, Dict[str, Any], Any], Tuple[int, Any]]
+
+
+def make_response(status_code: int, body: Any, url: str = '') -> requests.Response:
+    """
+    Build a real requests.Response carrying a JSON body
+    
+    Args:
+        status_code: HTTP status
+        body: JSON-serializable body, or raw bytes
+        url: Request URL
+        
+    Returns:
+        Response object
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+    response.headers['Content-Type'] = 'application/json'
+    response.url = url
+    return response
+
+
+class FakeSession:
+    """
+    Routes requests to a handler and records every call
+    
+    The handler receives (method, path, params, data) with authentication
+    removed from params, and returns (status_code, body) or raises a
+    requests exception.
+    """
+    
+    def __init__(self, handler: Handler):
+        self.handler = handler
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+    
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                data: Any = None, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[float] = None) -> requests.Response:
+        path = urlparse(url).path
+        params = {k: v for k, v in (params or {}).items() if k not in ('key', 'token')}
+        with self._lock:
+            self.calls.append((method, path, params))
+        status_code, body = self.handler(method, path, params, data)
+        return make_response(status_code, body, url)
+    
+    def paths(self, method: Optional[str] = None) -> List[str]:
+        """
+        Get the paths requested so far, optionally for one method
+        """
+        with self._lock:
+            return [path for m, path, _ in self.calls if method is None or m == method]
+
+
+def make_client(handler: Handler, api_key: Optional[str] = None, token: Optional[str] = None,
+                **kwargs: Any) -> TrelloAPIClient:
+    """
+    Build a client wired to a FakeSession
+    
+    Fresh credentials and private circuit breakers keep the process-wide
+    breakers, rate limiters and coalescers of one test out of the others.
+    
+    Args:
+        handler: Request handler for the FakeSession
+        api_key: API key; random when omitted
+        token: Token; random when omitted
+        **kwargs: Extra TrelloAPIClient arguments
+        
+    Returns:
+        Client whose session is a FakeSession
+    """
+    client = TrelloAPIClient(api_key or uuid.uuid4().hex, token or uuid.uuid4().hex, **kwargs)
+    client.session = FakeSession(handler)
+    client._breakers = [CircuitBreaker('host:test'), CircuitBreaker('credential:test')]
+    return client
+
+class FakeTrello:
+    """
+    Minimal in-memory Trello board serving the routes the utils modules use
+    
+    Card and action IDs follow Trello's layout: 8 hex digits of creation time
+    followed by a counter, so they sort by creation and carry a timestamp.
+    """
+    
+    def __init__(self, board_id: str = 'b' * 24):
+        self.board_id = board_id
+        self.lists: List[Dict[str, Any]] = []
+        self.labels: List[Dict[str, Any]] = []
+        self.members: List[Dict[str, Any]] = []
+        self.cards: Dict[str, Dict[str, Any]] = {}
+        self.actions: List[Dict[str, Any]] = []
+        # Unix seconds stamped into new IDs; tests may move it
+        self.clock = int(time.time())
+        self._counter = 0
+        self._lock = threading.RLock()
+    
+    def new_id(self) -> str:
+        """
+        Get a fresh time-ordered ID
+        """
+        with self._lock:
+            self._counter += 1
+            return f'{self.clock:08x}{self._counter:016x}'
+    
+    def add_list(self, name: str) -> str:
+        list_id = self.new_id()
+        self.lists.append({'id': list_id, 'name': name, 'closed': False, 'pos': len(self.lists)})
+        return list_id
+    
+    def add_label(self, name: str, color: str = 'green') -> str:
+        label_id = self.new_id()
+        self.labels.append({'id': label_id, 'name': name, 'color': color})
+        return label_id
+    
+    def add_member(self, username: str) -> str:
+        member_id = self.new_id()
+        self.members.append({'id': member_id, 'username': username, 'fullName': username.title()})
+        return member_id
+    
+    def add_card(self, name: str, list_id: str, **fields: Any) -> Dict[str, Any]:
+        """
+        Create a card directly, without recording an action
+        """
+        card = {'id': self.new_id(), 'name': name, 'idList': list_id, 'idLabels': [], 'idMembers': [],
+                'due': None, 'closed': False, 'pos': len(self.cards), 'shortLink': 'x', 'desc': '',
+                'url': '', 'idBoard': self.board_id}
+        card.update(fields)
+        card['url'] = f"https://trello.com/c/{card['id'][-8:]}"
+        with self._lock:
+            self.cards[card['id']] = card
+        return card
+    
+    def add_action(self, action_type: str, **data: Any) -> None:
+        """
+        Record a board action, as Trello would for a change made elsewhere
+        """
+        with self._lock:
+            self.actions.append({'id': self.new_id(), 'type': action_type, 'data': data})
+    
+    def __call__(self, method: str, path: str, params: Dict[str, Any], data: Any) -> Tuple[int, Any]:
+        parts = path.split('/')[2:]
+        with self._lock:
+            if method == 'GET' and parts == ['batch']:
+                items = []
+                for route in params['urls'].split(','):
+                    parsed = urlparse(route)
+                    status_code, body = self(method, '/1' + parsed.path, dict(parse_qsl(parsed.query)), None)
+                    items.append({str(status_code): body})
+                return 200, items
+            if parts[:2] == ['boards', self.board_id]:
+                return self._board_route(method, parts[2:], params)
+            if parts[0] == 'cards':
+                return self._card_route(method, parts[1:], params, data)
+        return 404, 'The requested resource was not found.'
+    
+    def _board_route(self, method: str, rest: List[str], params: Dict[str, Any]) -> Tuple[int, Any]:
+        if not rest:
+            return 200, {'id': self.board_id, 'name': 'Board', 'url': '', 'closed': False,
+                         'lists': self.lists, 'labels': self.labels, 'members': self.members}
+        limit = int(params.get('limit', 1000))
+        before = params.get('before')
+        if rest == ['actions']:
+            since = params.get('since')
+            actions = [action for action in reversed(self.actions)
+                       if (not since or len(since) != 24 or action['id'] > since)
+                       and (not before or action['id'] < before)]
+            return 200, actions[:limit]
+        if rest == ['cards']:
+            cards = sorted((card for card in self.cards.values()
+                            if params.get('filter') != 'open' or not card['closed']),
+                           key=lambda card: card['id'], reverse=True)
+            cards = [card for card in cards if not before or card['id'] < before]
+            return 200, cards[:limit]
+        return 404, 'The requested resource was not found.'
+    
+    def _card_route(self, method: str, rest: List[str], params: Dict[str, Any], data: Any) -> Tuple[int, Any]:
+        if method == 'POST' and not rest:
+            fields = dict(data)
+            for key in ('idLabels', 'idMembers'):
+                if isinstance(fields.get(key), str):
+                    fields[key] = fields[key].split(',')
+            card = self.add_card(fields.pop('name'), fields.pop('idList'), **fields)
+            return 200, card
+        card = self.cards.get(rest[0]) if rest else None
+        if card is None:
+            return 404, 'The requested resource was not found.'
+        if method == 'PUT':
+            card.update(data or {})
+        return 200, card
\ No newline at end of file
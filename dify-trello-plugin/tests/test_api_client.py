@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import patch
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from tests.fake_session import make_client
+
+
+def refused():
+    # What requests raises when the TCP connection cannot be opened
+    reason = NewConnectionError(None, 'Failed to establish a new connection: [Errno 111] Connection refused')
+    return requests.exceptions.ConnectionError(MaxRetryError(None, '/1/cards', reason))
+
+
+def failing(*errors, status_code=200, body=None):
+    # Raise each error in turn, then answer normally
+    pending = list(errors)
+    
+    def handler(method, path, params, data):
+        if pending:
+            raise pending.pop(0)
+        return status_code, body if body is not None else {'id': 'c' * 24}
+    return handler
+
+
+@patch('utils.api_client.time.sleep')
+class TestRetries(unittest.TestCase):
+    
+    def test_post_not_retried_after_read_timeout(self, sleep):
+        client = make_client(failing(requests.exceptions.ReadTimeout()))
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            client.create_card('l' * 24, 'Card', max_retries=3)
+        self.assertEqual(len(client.session.calls), 1)
+    
+    def test_post_not_retried_after_broken_response(self, sleep):
+        for error in (requests.exceptions.ChunkedEncodingError(),
+                      requests.exceptions.ConnectionError(ProtocolError('Connection aborted.'))):
+            client = make_client(failing(error))
+            with self.assertRaises(type(error)):
+                client.create_card('l' * 24, 'Card', max_retries=3)
+            self.assertEqual(len(client.session.calls), 1)
+    
+    def test_post_retried_when_never_sent(self, sleep):
+        client = make_client(failing(requests.exceptions.ConnectTimeout(), refused()))
+        card = client.create_card('l' * 24, 'Card', max_retries=3)
+        self.assertEqual(card['id'], 'c' * 24)
+        self.assertEqual(len(client.session.calls), 3)
+    
+    def test_post_retried_on_rate_limit(self, sleep):
+        responses = [(429, {'message': 'rate limited'}), (200, {'id': 'c' * 24})]
+        client = make_client(lambda *args: responses.pop(0))
+        card = client.create_card('l' * 24, 'Card', max_retries=3)
+        self.assertEqual(card['id'], 'c' * 24)
+        self.assertEqual(len(client.session.calls), 2)
+    
+    def test_get_retried_after_read_timeout(self, sleep):
+        client = make_client(failing(requests.exceptions.ReadTimeout(), body={'id': 'b' * 24}))
+        board = client.get_board('b' * 24)
+        self.assertEqual(board['id'], 'b' * 24)
+        self.assertEqual(len(client.session.calls), 2)
+    
+    def test_retry_budget_respected(self, sleep):
+        client = make_client(failing(*[requests.exceptions.ConnectTimeout()] * 5), max_retries=2)
+        with self.assertRaises(requests.exceptions.ConnectTimeout):
+            client.create_card('l' * 24, 'Card')
+        self.assertEqual(len(client.session.calls), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
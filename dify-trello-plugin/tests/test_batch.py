@@ -0,0 +1,165 @@
+import threading
+import unittest
+import uuid
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from tests.fake_session import FakeSession, make_client
+from utils.api_client import TrelloAPIClient
+from utils.batch import BatchCall, BatchCoalescer, BatchResponse
+
+
+def batch_handler(method, path, params, data):
+    # Echo every batched board route back as {"200": {"id": <board id>}},
+    # except boards whose id starts with "missing"
+    if path == '/1/batch':
+        items = []
+        for route in params['urls'].split(','):
+            board_id = urlparse(route).path.rsplit('/', 1)[-1]
+            if board_id.startswith('missing'):
+                items.append({'404': 'The requested resource was not found.'})
+            else:
+                items.append({'200': {'id': board_id, 'fields': parse_qs(urlparse(route).query).get('fields')}})
+        return 200, items
+    board_id = path.rsplit('/', 1)[-1]
+    if board_id.startswith('missing'):
+        return 404, 'The requested resource was not found.'
+    return 200, {'id': board_id}
+
+
+class TestBatchResponse(unittest.TestCase):
+    
+    def test_success_item(self):
+        response = BatchResponse.from_batch_item({'200': {'id': 'abc'}}, '/boards/abc')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.ok)
+        self.assertEqual(response.json(), {'id': 'abc'})
+        response.raise_for_status()
+    
+    def test_status_keyed_error_item(self):
+        response = BatchResponse.from_batch_item({'404': 'The requested resource was not found.'}, '/boards/x')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.ok)
+        with self.assertRaises(requests.HTTPError) as raised:
+            response.raise_for_status()
+        self.assertIn('404', str(raised.exception))
+        self.assertIn('/boards/x', str(raised.exception))
+        self.assertIs(raised.exception.response, response)
+    
+    def test_error_object_item(self):
+        item = {'name': 'ValidationError', 'message': 'invalid id', 'statusCode': 400}
+        response = BatchResponse.from_batch_item(item, '/lists/x')
+        self.assertEqual(response.status_code, 400)
+        with self.assertRaisesRegex(requests.HTTPError, 'invalid id'):
+            response.raise_for_status()
+    
+    def test_error_object_without_status_is_server_error(self):
+        response = BatchResponse.from_batch_item({'message': 'boom', 'error': 'x'}, '/lists/x')
+        self.assertEqual(response.status_code, 500)
+    
+    def test_non_dict_item_is_server_error(self):
+        response = BatchResponse.from_batch_item('unexpected', '/lists/x')
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(response.ok)
+
+
+class TestBatchCoalescer(unittest.TestCase):
+    
+    def test_dispatch_splits_into_chunks_of_max_size(self):
+        chunks = []
+        calls = [BatchCall(f'boards/{i}', execute=chunks.append) for i in range(25)]
+        BatchCoalescer(window=60, max_size=10)._dispatch(calls)
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertEqual([call for chunk in chunks for call in chunk], calls)
+    
+    def test_full_window_flushes_without_waiting(self):
+        chunks = []
+        coalescer = BatchCoalescer(window=60, max_size=3)
+        for i in range(3):
+            coalescer.submit(BatchCall(f'boards/{i}', execute=chunks.append))
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(len(chunks[0]), 3)
+    
+    def test_window_timer_flushes_partial_batch(self):
+        flushed = threading.Event()
+        chunks = []
+        
+        def execute(chunk):
+            chunks.append(chunk)
+            flushed.set()
+        
+        coalescer = BatchCoalescer(window=0.01, max_size=10)
+        coalescer.submit(BatchCall('boards/a', execute=execute))
+        coalescer.submit(BatchCall('boards/b', execute=execute))
+        self.assertTrue(flushed.wait(5))
+        self.assertEqual([call.endpoint for call in chunks[0]], ['boards/a', 'boards/b'])
+    
+    def test_shared_per_credentials_and_window(self):
+        first = BatchCoalescer.for_credentials('key', 'token', 0.05, 10)
+        self.assertIs(BatchCoalescer.for_credentials('key', 'token', 0.05, 10), first)
+        self.assertIsNot(BatchCoalescer.for_credentials('key', 'other', 0.05, 10), first)
+        self.assertIsNot(BatchCoalescer.for_credentials('key', 'token', 0.1, 10), first)
+
+
+class TestClientBatching(unittest.TestCase):
+    
+    def test_concurrent_callers_share_one_batch(self):
+        api_key, token = uuid.uuid4().hex, uuid.uuid4().hex
+        clients = [make_client(batch_handler, api_key, token, batch_window=60) for _ in range(2)]
+        session = clients[1].session = clients[0].session
+        
+        # Ten callers across two clients fill one window, which flushes immediately
+        results = {}
+        
+        def fetch(i):
+            results[i] = clients[i % 2].get_board(f'board{i}', fields='id')
+        
+        threads = [threading.Thread(target=fetch, args=(i,)) for i in range(TrelloAPIClient.MAX_BATCH_SIZE)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        
+        self.assertEqual(session.paths(), ['/1/batch'])
+        self.assertEqual(len(session.calls[0][2]['urls'].split(',')), TrelloAPIClient.MAX_BATCH_SIZE)
+        self.assertEqual({i: board['id'] for i, board in results.items()},
+                         {i: f'board{i}' for i in range(TrelloAPIClient.MAX_BATCH_SIZE)})
+    
+    def test_get_many_splits_into_batches_of_ten(self):
+        client = make_client(batch_handler)
+        responses = client.get_many([(f'boards/b{i}', {'fields': 'id,name'}) for i in range(25)])
+        
+        self.assertEqual(client.session.paths(), ['/1/batch'] * 3)
+        self.assertEqual([len(params['urls'].split(',')) for _, _, params in client.session.calls], [10, 10, 5])
+        self.assertEqual([response.json()['id'] for response in responses], [f'b{i}' for i in range(25)])
+        # Commas inside a projection stay inside their route
+        self.assertEqual(responses[0].json()['fields'], ['id,name'])
+    
+    def test_failed_route_maps_to_its_own_response(self):
+        client = make_client(batch_handler)
+        responses = client.get_many([('boards/b1', None), ('boards/missing', None), ('boards/b2', None)])
+        
+        self.assertEqual([response.status_code for response in responses], [200, 404, 200])
+        with self.assertRaises(requests.HTTPError):
+            responses[1].raise_for_status()
+    
+    def test_single_call_skips_batch_endpoint(self):
+        client = make_client(batch_handler)
+        responses = client.get_many([('boards/missing', None)])
+        
+        self.assertEqual(client.session.paths(), ['/1/boards/missing'])
+        self.assertEqual(responses[0].status_code, 404)
+    
+    def test_batch_failure_fails_every_call_in_chunk(self):
+        client = make_client(batch_handler)
+        client.session = FakeSession(lambda *args: (400, {'message': 'bad urls'}))
+        with client.batch() as batch:
+            futures = [batch.get('boards/a'), batch.get('boards/b')]
+        for future in futures:
+            with self.assertRaises(requests.HTTPError):
+                future.result()
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+import unittest
+
+from tests.fake_session import FakeTrello, make_client
+from utils.board_mirror import BoardMirror
+
+
+class TestBoardMirrorDeltas(unittest.TestCase):
+    
+    def setUp(self):
+        self.trello = FakeTrello()
+        self.todo = self.trello.add_list('To Do')
+        self.done = self.trello.add_list('Done')
+        self.bug = self.trello.add_label('bug')
+        self.open_card = self.trello.add_card('Open card', self.todo)
+        self.archived = self.trello.add_card('Archived card', self.done, idLabels=[self.bug], closed=True)
+        self.client = make_client(self.trello)
+        self.mirror = BoardMirror(self.client, self.trello.board_id)
+        self.mirror.sync()
+    
+    def card_requests(self):
+        return [path for path in self.client.session.paths('GET') if path.startswith('/1/cards/')]
+    
+    def test_snapshot_skips_archived_cards(self):
+        self.assertIsNotNone(self.mirror.get_card(self.open_card['id'], max_staleness=60))
+        self.assertIsNone(self.mirror.get_card(self.archived['id'], max_staleness=60))
+    
+    def test_move_of_known_card(self):
+        self.trello.add_action('updateCard', card={'id': self.open_card['id'], 'idList': self.done},
+                               old={'idList': self.todo}, listBefore={'id': self.todo}, listAfter={'id': self.done})
+        self.mirror.sync()
+        self.assertEqual(self.mirror.get_card(self.open_card['id'])['idList'], self.done)
+        self.assertEqual(self.card_requests(), [])
+    
+    def test_unarchived_card_is_fetched(self):
+        self.archived['closed'] = False
+        self.trello.add_action('updateCard', card={'id': self.archived['id'], 'name': 'Archived card', 'closed': False},
+                               old={'closed': True}, list={'id': self.done, 'name': 'Done'})
+        self.mirror.sync()
+        
+        card = self.mirror.get_card(self.archived['id'])
+        self.assertEqual(card['idList'], self.done)
+        self.assertEqual(card['idLabels'], [self.bug])
+        self.assertFalse(card['closed'])
+        self.assertEqual(self.card_requests(), [f"/1/cards/{self.archived['id']}"])
+        self.assertEqual([c['id'] for c in self.mirror.find_cards_by_name('archived card', self.done)],
+                         [self.archived['id']])
+    
+    def test_unknown_card_keeps_list_from_action_until_fetched(self):
+        failing = {self.archived['id']}
+        
+        def handler(method, path, params, data):
+            if path == f"/1/cards/{self.archived['id']}" and failing:
+                return 500, {'message': 'unavailable'}
+            return self.trello(method, path, params, data)
+        
+        self.client.session.handler = handler
+        self.client.max_retries = 0
+        self.trello.add_action('updateCard', card={'id': self.archived['id'], 'name': 'Archived card', 'closed': False},
+                               old={'closed': True}, list={'id': self.done, 'name': 'Done'})
+        self.mirror.sync()
+        self.assertEqual(self.mirror.get_card(self.archived['id'])['idList'], self.done)
+        self.assertEqual(self.mirror.get_card(self.archived['id'])['idLabels'], [])
+        
+        failing.clear()
+        self.mirror.sync()
+        self.assertEqual(self.mirror.get_card(self.archived['id'])['idLabels'], [self.bug])
+    
+    def test_unknown_card_deleted_in_same_delta_is_not_fetched(self):
+        self.trello.add_action('updateCard', card={'id': self.archived['id'], 'closed': False},
+                               old={'closed': True}, list={'id': self.done})
+        self.trello.add_action('deleteCard', card={'id': self.archived['id']}, list={'id': self.done})
+        self.mirror.sync()
+        self.assertIsNone(self.mirror.get_card(self.archived['id']))
+        self.assertEqual(self.card_requests(), [])
+    
+    def test_unknown_card_gone_from_trello_is_dropped(self):
+        ghost = 'f' * 24
+        self.trello.add_action('updateCard', card={'id': ghost, 'name': 'Ghost'}, old={'name': 'Old'},
+                               list={'id': self.todo})
+        self.mirror.sync()
+        self.assertIsNone(self.mirror.get_card(ghost))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,244 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+
+import requests
+
+from tests.fake_session import FakeTrello, make_client
+from utils.bulk_import import BulkImporter, ImportCheckpoint
+
+
+class Crash(Exception):
+    """
+    Stands in for the process dying mid-request
+    """
+
+
+class TestImportCheckpoint(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, 'import.checkpoint.json')
+    
+    def test_watermark_advances_over_finished_and_deferred_rows(self):
+        checkpoint = ImportCheckpoint(self.path, '/src.csv', 'board')
+        checkpoint.finish(2, 'created')
+        self.assertEqual(checkpoint.watermark, 0)
+        self.assertEqual(checkpoint.done, {2})
+        checkpoint.defer(1)
+        self.assertEqual(checkpoint.watermark, 2)
+        self.assertEqual(checkpoint.done, set())
+        self.assertFalse(checkpoint.is_done(1))
+        self.assertTrue(checkpoint.is_done(2))
+        
+        checkpoint.finish(1, 'reconciled')
+        self.assertTrue(checkpoint.is_done(1))
+        self.assertEqual(checkpoint.deferred, set())
+        self.assertEqual(checkpoint.stats, {'created': 1, 'reconciled': 1, 'failed': 0})
+    
+    def test_reload_marks_reserved_and_deferred_rows_pending(self):
+        checkpoint = ImportCheckpoint(self.path, '/src.csv', 'board')
+        checkpoint.reserved_through = 6
+        checkpoint.sent_since = 1234.5
+        for row in (1, 2, 4):
+            checkpoint.finish(row, 'created')
+        checkpoint.save()
+        checkpoint.defer(3)
+        checkpoint.save()
+        
+        resumed = ImportCheckpoint(self.path, '/src.csv', 'board')
+        self.assertEqual(resumed.watermark, 4)
+        self.assertEqual(resumed.deferred, {3})
+        self.assertEqual(resumed.pending, {3, 5, 6})
+        self.assertEqual(resumed.sent_since, 1234.5)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+    
+    def test_rejects_checkpoint_of_other_source(self):
+        ImportCheckpoint(self.path, '/src.csv', 'board').save()
+        with self.assertRaises(ValueError):
+            ImportCheckpoint(self.path, '/other.csv', 'board')
+        with self.assertRaises(ValueError):
+            ImportCheckpoint(self.path, '/src.csv', 'other-board')
+
+
+class TestBulkImporter(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.source = os.path.join(self.tmp, 'cards.csv')
+        self.checkpoint = self.source + '.checkpoint.json'
+        self.trello = FakeTrello()
+        self.todo = self.trello.add_list('To Do')
+        self.bug = self.trello.add_label('bug')
+        self.alice = self.trello.add_member('alice')
+        self.posts = 0
+    
+    def write_rows(self, titles):
+        with open(self.source, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, ['title', 'description', 'list', 'labels', 'assignee'])
+            writer.writeheader()
+            for title in titles:
+                writer.writerow({'title': title, 'description': f'About {title}', 'list': 'To Do',
+                                 'labels': 'bug', 'assignee': 'alice'})
+    
+    def run_import(self, on_post=None, **kwargs):
+        # Each run gets fresh credentials and therefore a fresh board mirror,
+        # as a new process would
+        def handler(method, path, params, data):
+            if method == 'POST' and path == '/1/cards':
+                self.posts += 1
+                if on_post:
+                    return on_post(self.posts, method, path, params, data)
+            return self.trello(method, path, params, data)
+        
+        client = make_client(handler)
+        importer = BulkImporter(client, self.trello.board_id, self.checkpoint, **kwargs)
+        return importer, importer.run(self.source)
+    
+    def card_names(self):
+        return Counter(card['name'] for card in self.trello.cards.values())
+    
+    def errors(self):
+        with open(self.checkpoint + '.errors.jsonl', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+    
+    def test_creates_every_row_once_and_rerun_skips(self):
+        titles = [f'Card {i}' for i in range(1, 13)]
+        self.write_rows(titles)
+        _, report = self.run_import(max_workers=3)
+        
+        self.assertEqual(report['created'], 12)
+        self.assertEqual(report['watermark'], 12)
+        self.assertEqual(self.card_names(), Counter(titles))
+        card = next(iter(self.trello.cards.values()))
+        self.assertEqual(card['idLabels'], [self.bug])
+        self.assertEqual(card['idMembers'], [self.alice])
+        
+        _, report = self.run_import()
+        self.assertEqual(report['skipped'], 12)
+        self.assertEqual(report['created'], 0)
+        self.assertEqual(self.posts, 12)
+    
+    def test_resume_after_crash_creates_no_duplicates(self):
+        # Repeated titles must each still get their own card
+        titles = ['Alpha', 'Beta', 'Beta', 'Gamma', 'Beta', 'Delta', 'Epsilon', 'Zeta']
+        self.write_rows(titles)
+        
+        def crash_after_sending(count, *request):
+            result = self.trello(*request)
+            if count == 4:
+                raise Crash('killed after the card was created')
+            return result
+        
+        with self.assertRaises(Crash):
+            self.run_import(on_post=crash_after_sending, max_workers=2)
+        created_before_resume = len(self.trello.cards)
+        self.assertGreaterEqual(created_before_resume, 4)
+        
+        _, report = self.run_import()
+        self.assertEqual(self.card_names(), Counter(titles))
+        self.assertEqual(report['reconciled'], created_before_resume)
+        self.assertEqual(report['created'], len(titles) - created_before_resume)
+        self.assertEqual(report['watermark'], len(titles))
+        reconciled = [entry['reconciled_card'] for entry in self.errors() if 'reconciled_card' in entry]
+        self.assertEqual(len(reconciled), len(set(reconciled)))
+    
+    def test_lost_response_is_deferred_and_reconciled(self):
+        titles = ['One', 'Two', 'Three', 'Four']
+        self.write_rows(titles)
+        
+        def lose_third_response(count, *request):
+            result = self.trello(*request)
+            if request[3]['name'] == 'Three':
+                raise requests.exceptions.ReadTimeout('response lost')
+            return result
+        
+        _, report = self.run_import(on_post=lose_third_response, max_workers=1)
+        # The POST was not retried, so Trello holds exactly one "Three"
+        self.assertEqual(self.posts, 4)
+        self.assertEqual(report['deferred'], 1)
+        self.assertEqual(report['watermark'], 4)
+        
+        _, report = self.run_import()
+        self.assertEqual(report['reconciled'], 1)
+        self.assertEqual(report['created'], 0)
+        self.assertEqual(self.posts, 4)
+        self.assertEqual(self.card_names(), Counter(titles))
+        self.assertFalse(ImportCheckpoint(self.checkpoint, self.source, self.trello.board_id).deferred)
+    
+    def test_transient_failure_is_deferred_and_retried(self):
+        titles = ['One', 'Two', 'Three']
+        self.write_rows(titles)
+        
+        def unavailable_for_two(count, *request):
+            if request[3]['name'] == 'Two':
+                return 503, {'message': 'unavailable'}
+            return self.trello(*request)
+        
+        _, report = self.run_import(on_post=unavailable_for_two, max_workers=1)
+        self.assertEqual(report['deferred'], 1)
+        self.assertEqual(report['created'], 2)
+        self.assertEqual(report['watermark'], 3)
+        
+        _, report = self.run_import()
+        self.assertEqual(report['created'], 1)
+        self.assertEqual(report['skipped'], 2)
+        self.assertEqual(self.card_names(), Counter(titles))
+    
+    def test_rejected_row_is_logged_not_deferred(self):
+        self.write_rows(['One', 'Two'])
+        
+        def reject_two(count, *request):
+            if request[3]['name'] == 'Two':
+                return 400, {'message': 'invalid value for idList'}
+            return self.trello(*request)
+        
+        _, report = self.run_import(on_post=reject_two)
+        self.assertEqual(report['failed'], 1)
+        self.assertEqual(report['deferred'], 0)
+        self.assertEqual(self.errors(), [{'row': 2, 'error': 'Trello rejected the card: HTTP 400'}])
+    
+    def test_cards_predating_the_import_are_not_reconciled(self):
+        self.trello.clock -= 3600
+        self.trello.add_card('One', self.todo, idLabels=[self.bug], idMembers=[self.alice])
+        self.trello.clock += 3600
+        self.write_rows(['One', 'Two'])
+        
+        def crash_on_first(count, *request):
+            raise Crash('killed before sending')
+        
+        with self.assertRaises(Crash):
+            self.run_import(on_post=crash_on_first, max_workers=1)
+        _, report = self.run_import()
+        self.assertEqual(report['reconciled'], 0)
+        self.assertEqual(report['created'], 2)
+        self.assertEqual(self.card_names(), Counter({'One': 2, 'Two': 1}))
+    
+    def test_claimed_cards_stay_bounded(self):
+        titles = [f'Card {i}' for i in range(1, 31)]
+        self.write_rows(titles)
+        # A deferred row at the end keeps reconciliation active for the whole run
+        checkpoint = ImportCheckpoint(self.checkpoint, os.path.abspath(self.source), self.trello.board_id)
+        checkpoint.sent_since = self.trello.clock
+        checkpoint.defer(30)
+        checkpoint.save()
+        
+        def advance_clock(count, *request):
+            if count == 5:
+                self.trello.clock += 3600
+            return self.trello(*request)
+        
+        importer, report = self.run_import(on_post=advance_clock, max_workers=1)
+        self.assertEqual(report['created'], 30)
+        self.assertEqual(self.card_names(), Counter(titles))
+        self.assertLessEqual(len(importer._claimed), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
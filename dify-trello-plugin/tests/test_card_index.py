@@ -0,0 +1,68 @@
+import threading
+import time
+import unittest
+
+from utils.card_index import CardIndex, content_hash
+
+
+class TestCardIndex(unittest.TestCase):
+    
+    def setUp(self):
+        self.index = CardIndex(':memory:')
+    
+    def test_put_get_delete(self):
+        fields = {'name': 'Card', 'idList': 'l' * 24}
+        self.index.put('board', 'key', 'card', fields, 'https://trello.com/c/x')
+        entry = self.index.get('board', 'key')
+        self.assertEqual(entry['card_id'], 'card')
+        self.assertEqual(entry['fields'], fields)
+        self.assertEqual(entry['content_hash'], content_hash(dict(reversed(list(fields.items())))))
+        self.assertIsNone(self.index.get('other-board', 'key'))
+        
+        self.index.delete('board', 'key')
+        self.assertIsNone(self.index.get('board', 'key'))
+    
+    def test_key_lock_prevents_duplicate_create(self):
+        created = []
+        
+        def upsert():
+            with self.index.key_lock('board', 'key'):
+                if self.index.get('board', 'key') is None:
+                    # Stand-in for the card POST round trip
+                    time.sleep(0.02)
+                    created.append(threading.get_ident())
+                    self.index.put('board', 'key', f'card{len(created)}', {'name': 'Card'})
+        
+        threads = [threading.Thread(target=upsert) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        
+        self.assertEqual(len(created), 1)
+        self.assertEqual(self.index.get('board', 'key')['card_id'], 'card1')
+        self.assertEqual(self.index._key_locks, {})
+    
+    def test_key_lock_does_not_block_other_keys(self):
+        entered = threading.Event()
+        with self.index.key_lock('board', 'a'):
+            def other():
+                with self.index.key_lock('board', 'b'):
+                    entered.set()
+            
+            thread = threading.Thread(target=other)
+            thread.start()
+            self.assertTrue(entered.wait(5))
+            thread.join(5)
+    
+    def test_key_lock_released_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.index.key_lock('board', 'key'):
+                raise RuntimeError('boom')
+        with self.index.key_lock('board', 'key'):
+            pass
+        self.assertEqual(self.index._key_locks, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,159 @@
+import unittest
+from unittest.mock import patch
+
+from tests.fake_session import make_client
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('utils.circuit_breaker.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker('test', window_size=4, min_calls=4, failure_rate_threshold=0.5,
+                                      slow_call_duration=1.0, slow_call_rate_threshold=0.75,
+                                      open_duration=30.0, half_open_max_calls=2)
+    
+    def call(self, success, duration=0.1):
+        self.breaker.before_call()
+        self.breaker.record(success, duration)
+    
+    def trip(self):
+        for success in (True, True, False, False):
+            self.call(success)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+    
+    def test_stays_closed_below_min_calls(self):
+        for _ in range(3):
+            self.call(False)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_stays_closed_below_failure_rate(self):
+        for success in (True, True, True, False, True, True):
+            self.call(success)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_opens_on_failure_rate(self):
+        self.trip()
+        self.assertEqual(self.breaker.snapshot()['opened'], 1)
+    
+    def test_opens_on_slow_call_rate(self):
+        for duration in (0.1, 2.0, 2.0, 2.0):
+            self.call(True, duration)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+    
+    def test_open_rejects_until_open_duration_passes(self):
+        self.trip()
+        self.clock.now += 10
+        with self.assertRaises(CircuitOpenError) as raised:
+            self.breaker.before_call()
+        self.assertAlmostEqual(raised.exception.retry_after, 20.0)
+        self.assertEqual(self.breaker.snapshot()['rejected'], 1)
+        
+        self.clock.now += 20
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+    
+    def test_half_open_limits_probes(self):
+        self.trip()
+        self.clock.now += 30
+        self.breaker.before_call()
+        self.breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+    
+    def test_half_open_closes_after_successful_probes(self):
+        self.trip()
+        self.clock.now += 30
+        self.call(True)
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.call(True)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        # The window starts empty again, so old failures do not re-trip it
+        self.call(False)
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+    
+    def test_half_open_reopens_on_failed_probe(self):
+        self.trip()
+        self.clock.now += 30
+        self.call(True)
+        self.call(False)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.snapshot()['opened'], 2)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+    
+    def test_half_open_reopens_on_slow_probe(self):
+        self.trip()
+        self.clock.now += 30
+        self.call(True, duration=5.0)
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+    
+    def test_release_returns_probe_permit(self):
+        self.trip()
+        self.clock.now += 30
+        self.breaker.before_call()
+        self.breaker.before_call()
+        self.breaker.release()
+        self.breaker.before_call()
+
+
+class TestClientBreakers(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('utils.circuit_breaker.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = make_client(lambda *args: (200, {'id': 'b' * 24}))
+        self.host_breaker = CircuitBreaker('host:test', min_calls=1, open_duration=30.0, half_open_max_calls=1)
+        self.credential_breaker = CircuitBreaker('credential:test', min_calls=1, open_duration=60.0)
+        self.client._breakers = [self.host_breaker, self.credential_breaker]
+    
+    def test_rejected_call_releases_acquired_permits(self):
+        # Host breaker half-open with a single probe; credential breaker still open
+        for breaker in self.client._breakers:
+            breaker.before_call()
+            breaker.record(False, 0.1)
+        self.clock.now += 30
+        self.assertEqual(self.host_breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(self.credential_breaker.state, CircuitBreaker.OPEN)
+        
+        for _ in range(3):
+            with self.assertRaises(CircuitOpenError):
+                self.client.get_board('b' * 24)
+        
+        # The host probe reserved before each rejection was handed back
+        self.assertEqual(self.client.session.calls, [])
+        self.assertEqual(self.client.get_metrics()['circuit_rejections'], 3)
+        self.host_breaker.before_call()
+    
+    def test_server_errors_open_host_breaker(self):
+        self.client.session.handler = lambda *args: (503, {'message': 'unavailable'})
+        self.client.max_retries = 0
+        self.client._make_request('GET', 'boards/' + 'b' * 24)
+        self.assertEqual(self.host_breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.client.get_board('b' * 24)
+        self.assertEqual(len(self.client.session.calls), 1)
+    
+    def test_rate_limiting_only_counts_against_credential(self):
+        self.client.session.handler = lambda *args: (429, {'message': 'rate limited'})
+        self.client.max_retries = 0
+        self.client._make_request('GET', 'boards/' + 'b' * 24)
+        self.assertEqual(self.host_breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.credential_breaker.state, CircuitBreaker.OPEN)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
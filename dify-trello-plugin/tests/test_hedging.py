@@ -0,0 +1,95 @@
+import threading
+import time
+import unittest
+
+import requests
+
+from tests.fake_session import make_client
+from utils.hedging import HedgePolicy, route_template
+
+
+class TestRouteTemplate(unittest.TestCase):
+    
+    def test_ids_collapse(self):
+        self.assertEqual(route_template('/boards/' + 'a1' * 12 + '/labels?limit=5'), 'boards/:id/labels')
+
+
+class TestHedgedGet(unittest.TestCase):
+    
+    def test_primary_legs_are_not_bounded_by_hedge_pool(self):
+        # Every GET blocks until eight are in flight at once, which a
+        # two-worker pool could never allow
+        in_flight = threading.Barrier(8, timeout=5)
+        
+        def handler(method, path, params, data):
+            in_flight.wait()
+            return 200, {'id': 'b' * 24}
+        
+        policy = HedgePolicy(95, initial_delay=5.0, max_workers=2)
+        client = make_client(handler, hedge_policy=policy)
+        errors = []
+        
+        def fetch():
+            try:
+                client.get_board('b' * 24)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(client.session.calls), 8)
+        self.assertEqual(policy.snapshot()['outstanding'], 0)
+    
+    def test_hedge_wins_over_slow_primary(self):
+        release = threading.Event()
+        calls = []
+        
+        def handler(method, path, params, data):
+            calls.append(path)
+            if len(calls) == 1:
+                release.wait(5)
+            return 200, {'id': 'b' * 24}
+        
+        client = make_client(handler, hedge_policy=HedgePolicy(95, initial_delay=0.05))
+        start = time.monotonic()
+        self.assertEqual(client.get_board('b' * 24)['id'], 'b' * 24)
+        self.assertLess(time.monotonic() - start, 2)
+        release.set()
+        
+        metrics = client.get_metrics()
+        self.assertEqual(metrics['hedges_sent'], 1)
+        self.assertEqual(metrics['hedge_wins'], 1)
+    
+    def test_hedge_skipped_when_pool_busy(self):
+        release = threading.Event()
+        policy = HedgePolicy(95, initial_delay=0.01, max_workers=1)
+        blocker = policy.try_submit(release.wait, 5)
+        self.addCleanup(release.set)
+        
+        def handler(method, path, params, data):
+            time.sleep(0.1)
+            return 200, {'id': 'b' * 24}
+        
+        client = make_client(handler, hedge_policy=policy)
+        client.get_board('b' * 24)
+        release.set()
+        blocker.result(5)
+        
+        metrics = client.get_metrics()
+        self.assertEqual(len(client.session.calls), 1)
+        self.assertEqual(metrics['hedges_skipped'], 1)
+        # The hedge's rate limit token was handed back
+        self.assertGreaterEqual(metrics['rate_limiters'][client._rate_limiters[1].name]['available'], 9)
+    
+    def test_primary_error_propagates(self):
+        client = make_client(lambda *args: (404, 'not found'), hedge_policy=HedgePolicy(95, initial_delay=5.0))
+        with self.assertRaises(requests.HTTPError):
+            client.get_board('b' * 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch
+
+from utils.rate_limiter import API_KEY_LIMIT, TOKEN_LIMIT, TokenBucket
+
+
+class FakeClock:
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('utils.rate_limiter.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def admitted_per_window(self, rate, capacity, window=10.0, step=0.01, duration=60.0):
+        # Greedy caller taking every token as soon as it exists; returns the
+        # largest number admitted in any sliding window
+        bucket = TokenBucket('test', rate, capacity)
+        admitted = []
+        start = self.clock.now
+        while self.clock.now - start < duration:
+            while bucket.try_acquire():
+                admitted.append(self.clock.now)
+            self.clock.now += step
+        busiest, first = 0, 0
+        for last, at in enumerate(admitted):
+            while at - admitted[first] >= window:
+                first += 1
+            busiest = max(busiest, last - first + 1)
+        return busiest
+    
+    def test_token_bucket_stays_within_trello_limit(self):
+        self.assertLessEqual(self.admitted_per_window(*TOKEN_LIMIT), 100)
+    
+    def test_api_key_bucket_stays_within_trello_limit(self):
+        self.assertLessEqual(self.admitted_per_window(*API_KEY_LIMIT), 300)
+    
+    def test_burst_then_refill(self):
+        bucket = TokenBucket('test', rate=9.0, capacity=10)
+        self.assertEqual(sum(bucket.try_acquire() for _ in range(20)), 10)
+        self.clock.now += 1.0
+        self.assertEqual(sum(bucket.try_acquire() for _ in range(20)), 9)
+    
+    def test_release_is_capped_at_capacity(self):
+        bucket = TokenBucket('test', rate=9.0, capacity=10)
+        self.assertTrue(bucket.try_acquire())
+        bucket.release(5)
+        self.assertEqual(bucket.snapshot()['available'], 10)
+    
+    @patch('utils.rate_limiter.time.sleep')
+    def test_acquire_waits_for_refill(self, sleep):
+        sleep.side_effect = lambda seconds: setattr(self.clock, 'now', self.clock.now + seconds)
+        bucket = TokenBucket('test', rate=10.0, capacity=1)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""
+Trello Bulk Card Update Tool
+"""
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from core.tools.entities.tool_entities import ToolInvokeMessage
+from core.tools.tool.base_tool import BaseTool
+
+from utils.api_client import TrelloAPIClient
+from utils.circuit_breaker import CircuitOpenError
+from utils.validators import TrelloValidator
+
+
+class BulkUpdateTrelloCardsTool(BaseTool):
+    """
+    Tool for moving, archiving and relabeling many Trello cards at once
+    """
+    
+    MAX_CARDS = 100
+    
+    def _invoke(self, user_id: str, tool_parameters: Dict[str, Any]) -> Union[ToolInvokeMessage, List[ToolInvokeMessage]]:
+        """
+        Invoke the Trello bulk card update tool
+        
+        Args:
+            user_id: The user ID
+            tool_parameters: Card IDs and the operations to apply
+            
+        Returns:
+            ToolInvokeMessage with per-card outcomes
+        """
+        try:
+            # Get credentials
+            credentials = self.runtime.credentials
+            api_key = credentials.get('trello_api_key')
+            token = credentials.get('trello_token')
+            
+            if not api_key or not token:
+                return self.create_text_message('Error: Trello API credentials not configured')
+            
+            card_ids, error = self._parse_ids(tool_parameters.get('card_ids', ''), 'Card ID')
+            if error:
+                return self.create_text_message(f'Error: {error}')
+            if not card_ids:
+                return self.create_text_message('Error: At least one card ID is required')
+            if len(card_ids) > self.MAX_CARDS:
+                return self.create_text_message(f'Error: At most {self.MAX_CARDS} cards can be updated at once')
+            
+            operations, error = self._parse_operations(tool_parameters)
+            if error:
+                return self.create_text_message(f'Error: {error}')
+            if not operations and not tool_parameters.get('add_labels') and not tool_parameters.get('remove_labels'):
+                return self.create_text_message('Error: No operation specified')
+            
+            client = TrelloAPIClient(api_key, token)
+            add_label_ids, remove_label_ids, warnings, error = self._resolve_labels(
+                client,
+                (tool_parameters.get('board_id') or '').strip().lower(),
+                tool_parameters.get('add_labels', ''),
+                tool_parameters.get('remove_labels', '')
+            )
+            if error:
+                return self.create_text_message(f'Error: {error}')
+            if not operations and not add_label_ids and not remove_label_ids:
+                return self.create_text_message('❌ No matching labels found on the board; nothing to update')
+            
+            outcomes = client.bulk_update_cards(
+                card_ids,
+                add_label_ids=add_label_ids,
+                remove_label_ids=remove_label_ids,
+                **operations
+            )
+            
+            updated = [o for o in outcomes if o['success'] and not o.get('unchanged')]
+            unchanged = [o for o in outcomes if o['success'] and o.get('unchanged')]
+            failed = [o for o in outcomes if not o['success']]
+            
+            headline = "✅" if not failed else ("⚠️" if updated or unchanged else "❌")
+            message = f"{headline} Bulk update finished: {len(updated)} updated, "
+            message += f"{len(unchanged)} already up to date, {len(failed)} failed\n"
+            for outcome in outcomes:
+                if not outcome['success']:
+                    message += f"\n❌ {outcome['card_id']}: {outcome['error']}"
+                elif outcome.get('unchanged'):
+                    message += f"\n➖ {outcome['card_id']}: unchanged"
+                else:
+                    message += f"\n✅ {outcome['card_id']}: {', '.join(sorted(outcome['fields']))}"
+            for warning in warnings:
+                message += f"\n⚠️ {warning}"
+            
+            return self.create_text_message(message)
+        
+        except CircuitOpenError as e:
+            return self.create_text_message(f"❌ {str(e)}. Please try again later.")
+        except Exception as e:
+            return self.create_text_message(f"❌ Unexpected error: {str(e)}")
+    
+    def _parse_ids(self, value: str, field_name: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Split and validate a comma-separated list of Trello IDs, dropping duplicates
+        
+        IDs are only trimmed and lowercased; anything that is not 24 hex
+        characters is rejected rather than rewritten, since these IDs select
+        the cards that get modified.
+        
+        Args:
+            value: Comma-separated IDs
+            field_name: Field name used in error messages
+            
+        Returns:
+            Tuple of (ids, error_message)
+        """
+        ids = []
+        for raw_id in (value or '').split(','):
+            trello_id = raw_id.strip().lower()
+            if not trello_id:
+                continue
+            is_valid, error = TrelloValidator.validate_trello_id(trello_id, field_name)
+            if not is_valid:
+                return [], error
+            if trello_id not in ids:
+                ids.append(trello_id)
+        return ids, None
+    
+    def _parse_operations(self, tool_parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Validate the move, archive, due date and member operations
+        
+        Args:
+            tool_parameters: Tool parameters
+            
+        Returns:
+            Tuple of (bulk_update_cards keyword arguments, error_message)
+        """
+        operations: Dict[str, Any] = {}
+        
+        list_id = (tool_parameters.get('list_id') or '').strip().lower()
+        if list_id:
+            is_valid, error = TrelloValidator.validate_trello_id(list_id, 'List ID')
+            if not is_valid:
+                return {}, error
+            operations['id_list'] = list_id
+        
+        archive = tool_parameters.get('archive')
+        if archive not in (None, ''):
+            if isinstance(archive, str):
+                archive = archive.strip().lower() in ('true', '1', 'yes')
+            if archive:
+                operations['closed'] = True
+        
+        due_date = tool_parameters.get('due_date', '')
+        if due_date:
+            is_valid, iso_date, error = TrelloValidator.validate_due_date(due_date)
+            if not is_valid:
+                return {}, error
+            operations['due'] = iso_date
+        
+        member_ids = tool_parameters.get('member_ids', '')
+        if member_ids:
+            ids, error = self._parse_ids(member_ids, 'Member ID')
+            if error:
+                return {}, error
+            operations['id_members'] = ids
+        
+        return operations, None
+    
+    def _resolve_labels(self, client: TrelloAPIClient, board_id: str, add_labels: str,
+                        remove_labels: str) -> Tuple[List[str], List[str], List[str], Optional[str]]:
+        """
+        Turn label names or IDs into label IDs
+        
+        Label IDs are used as given; names are looked up on the board, which is
+        only fetched when a name is present.
+        
+        Args:
+            client: Trello API client
+            board_id: Board whose labels names refer to
+            add_labels: Comma-separated label names or IDs to add
+            remove_labels: Comma-separated label names or IDs to remove
+            
+        Returns:
+            Tuple of (add_label_ids, remove_label_ids, warnings, error_message)
+        """
+        add_names = [label.strip() for label in (add_labels or '').split(',') if label.strip()]
+        remove_names = [label.strip() for label in (remove_labels or '').split(',') if label.strip()]
+        if not add_names and not remove_names:
+            return [], [], [], None
+        
+        ids_by_name: Dict[str, str] = {}
+        if any(not TrelloValidator.TRELLO_ID_PATTERN.match(name) for name in add_names + remove_names):
+            is_valid, error = TrelloValidator.validate_trello_id(board_id, 'Board ID')
+            if not is_valid:
+                return [], [], [], f"{error} (needed to look up labels by name)"
+            board_labels = client.get_board_labels(board_id, fields='id,name')
+            ids_by_name = {label.get('name', '').lower(): label['id'] for label in board_labels}
+        
+        warnings = []
+        resolved = []
+        for names in (add_names, remove_names):
+            label_ids = []
+            for name in names:
+                label_id = name if TrelloValidator.TRELLO_ID_PATTERN.match(name) else ids_by_name.get(name.lower())
+                if label_id is None:
+                    warnings.append(f"Label not found on board: {name}")
+                elif label_id not in label_ids:
+                    label_ids.append(label_id)
+            resolved.append(label_ids)
+        return resolved[0], resolved[1], warnings, None
\ No newline at end of file
@@ -2,20 +2,37 @@
 Trello Card Creation Tool
 """
 import json
+import os
 import requests
-import time
-from datetime import datetime
-from typing import Any, Dict, List, Union
+from concurrent.futures import Future
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from core.tools.entities.tool_entities import ToolInvokeMessage
 from core.tools.tool.base_tool import BaseTool
 
+from utils.api_client import TrelloAPIClient
+from utils.circuit_breaker import CircuitOpenError
+from utils.fingerprint import credential_fingerprint
+from utils.hedging import HedgePolicy
+from utils.negative_cache import negative_id_cache
+from utils.tracing import STATUS_ERROR, add_span_event, tracer
+from utils.validators import InputSanitizer, TrelloValidator
+
 
 class CreateTrelloCardTool(BaseTool):
     """
     Tool for creating Trello cards with AI-generated content
     """
     
+    # Name of the attachment holding an oversized description in 'attach' overflow mode
+    FULL_DESCRIPTION_ATTACHMENT = 'description.md'
+    
+    # Preflight GETs and label attaches make one short attempt; only the card
+    # POST gets the longer timeout and a single retry if it never reached Trello
+    REQUEST_TIMEOUT = 10  # seconds
+    CARD_POST_TIMEOUT = 30  # seconds
+    CARD_POST_RETRIES = 1
+    
     def _invoke(self, user_id: str, tool_parameters: Dict[str, Any]) -> Union[ToolInvokeMessage, List[ToolInvokeMessage]]:
         """
         Invoke the Trello card creation tool
@@ -27,153 +44,182 @@ class CreateTrelloCardTool(BaseTool):
         Returns:
             ToolInvokeMessage with creation result
         """
-        try:
-            # Get credentials
-            credentials = self.runtime.credentials
-            api_key = credentials.get('trello_api_key')
-            token = credentials.get('trello_token')
-            
-            if not api_key or not token:
-                return self.create_text_message('Error: Trello API credentials not configured')
-            
-            # Extract and validate parameters
-            card_title = tool_parameters.get('card_title', '').strip()
-            card_description = tool_parameters.get('card_description', '').strip()
-            board_id = tool_parameters.get('board_id', '').strip()
-            list_id = tool_parameters.get('list_id', '').strip()
-            labels = tool_parameters.get('labels', '').strip()
-            due_date = tool_parameters.get('due_date', '').strip()
-            assignee_id = tool_parameters.get('assignee_id', '').strip()
-            
-            # Validate required parameters
-            if not card_title:
-                return self.create_text_message('Error: Card title is required')
-            if not card_description:
-                return self.create_text_message('Error: Card description is required')
-            if not board_id:
-                return self.create_text_message('Error: Board ID is required')
-            if not list_id:
-                return self.create_text_message('Error: List ID is required')
-            
-            # Validate and truncate content
-            card_title = self._validate_and_truncate_title(card_title)
-            card_description = self._validate_and_truncate_description(card_description)
-            
-            # Validate due date format if provided
-            if due_date:
-                due_date = self._validate_due_date(due_date)
-                if not due_date:
-                    return self.create_text_message('Error: Due date must be in YYYY-MM-DD format')
-            
-            # Process labels
-            label_list = self._process_labels(labels)
-            
-            # Create the card
-            result = self._create_trello_card(
-                api_key=api_key,
-                token=token,
-                title=card_title,
-                description=card_description,
-                board_id=board_id,
-                list_id=list_id,
-                labels=label_list,
-                due_date=due_date,
-                assignee_id=assignee_id
-            )
-            
-            if result['success']:
-                card_url = result['card_url']
-                message = f"✅ Trello card created successfully!\n\n"
-                message += f"📋 Title: {card_title}\n"
-                message += f"🔗 URL: {card_url}\n"
-                message += f"📍 Board ID: {board_id}\n"
-                message += f"📝 List ID: {list_id}"
+        with tracer.span('trello.create_card', profile=True, **{'tool.name': 'create_trello_card'}) as span:
+            try:
+                # Get credentials
+                credentials = self.runtime.credentials
+                api_key = credentials.get('trello_api_key')
+                token = credentials.get('trello_token')
                 
-                if label_list:
-                    message += f"\n🏷️ Labels: {', '.join(label_list)}"
-                if due_date:
-                    message += f"\n📅 Due Date: {due_date}"
-                if assignee_id:
-                    message += f"\n👤 Assigned to: {assignee_id}"
-                    
-                return self.create_text_message(message)
-            else:
-                return self.create_text_message(f"❌ Failed to create Trello card: {result['error']}")
+                if not api_key or not token:
+                    return self.create_text_message('Error: Trello API credentials not configured')
                 
-        except Exception as e:
-            return self.create_text_message(f"❌ Unexpected error: {str(e)}")
-    
-    def _validate_and_truncate_title(self, title: str) -> str:
-        """
-        Validate and truncate title if necessary
-        
-        Args:
-            title: The card title
-            
-        Returns:
-            Validated and potentially truncated title
-        """
-        # Trello card titles have a limit of 16,384 characters, but we'll be more conservative
-        max_length = 512
-        if len(title) > max_length:
-            title = title[:max_length-3] + "..."
-        return title.strip()
+                # Extract parameters
+                card_title = tool_parameters.get('card_title', '')
+                card_description = tool_parameters.get('card_description', '')
+                board_id = tool_parameters.get('board_id', '')
+                list_id = tool_parameters.get('list_id', '')
+                labels = tool_parameters.get('labels', '')
+                due_date = tool_parameters.get('due_date', '')
+                assignee_id = tool_parameters.get('assignee_id', '')
+                attachment_paths = (tool_parameters.get('attachment_paths') or '').strip()
+                description_overflow = (tool_parameters.get('description_overflow') or 'truncate').strip()
+                
+                # Collect attachments before truncating, so 'attach' mode keeps the full text
+                attachments, error = self._process_attachment_paths(attachment_paths)
+                if error:
+                    span.set_status(STATUS_ERROR, error)
+                    return self.create_text_message(f'Error: {error}')
+                
+                overflow_note = None
+                overflow_warning = None
+                if description_overflow == 'attach' and self._description_overflows(card_description):
+                    full_description = InputSanitizer.sanitize_multiline_text(card_description)
+                    attachments.insert(0, {
+                        'source': self._iter_text_chunks(full_description),
+                        'name': self.FULL_DESCRIPTION_ATTACHMENT,
+                        'mime_type': 'text/markdown'
+                    })
+                    overflow_note = f"[Full description attached as {self.FULL_DESCRIPTION_ATTACHMENT}]"
+                    overflow_warning = (f"Description exceeds {TrelloValidator.MAX_DESCRIPTION_LENGTH} characters; "
+                                        f"the full text is attached as {self.FULL_DESCRIPTION_ATTACHMENT}")
+                
+                # Sanitize and validate everything locally before any HTTP request
+                with tracer.span('trello.validation') as validation_span:
+                    fields, warnings, error = TrelloValidator.validate_card_fields(
+                        card_title=card_title,
+                        card_description=card_description,
+                        board_id=board_id,
+                        list_id=list_id,
+                        labels=labels,
+                        due_date=due_date,
+                        assignee_id=assignee_id,
+                        truncation_note=overflow_note,
+                        truncation_warning=overflow_warning
+                    )
+                    validation_span.set_attribute('validation.warnings', len(warnings))
+                if error:
+                    span.set_status(STATUS_ERROR, error)
+                    return self.create_text_message(f'Error: {error}')
+                
+                card_title = fields['title']
+                board_id = fields['board_id']
+                list_id = fields['list_id']
+                label_list = fields['labels']
+                due_date = fields['due_date']
+                assignee_id = fields['assignee_id']
+                
+                # Create the card
+                result = self._create_trello_card(
+                    api_key=api_key,
+                    token=token,
+                    title=card_title,
+                    description=fields['description'],
+                    board_id=board_id,
+                    list_id=list_id,
+                    labels=label_list,
+                    due_date=due_date,
+                    assignee_id=assignee_id,
+                    attachments=attachments
+                )
+                
+                if result['success']:
+                    card_url = result['card_url']
+                    message = f"✅ Trello card created successfully!\n\n"
+                    message += f"📋 Title: {card_title}\n"
+                    message += f"🔗 URL: {card_url}\n"
+                    message += f"📍 Board ID: {board_id}\n"
+                    message += f"📝 List ID: {list_id}"
+                    
+                    if label_list:
+                        message += f"\n🏷️ Labels: {', '.join(label_list)}"
+                    if due_date:
+                        message += f"\n📅 Due Date: {due_date}"
+                    if assignee_id:
+                        message += f"\n👤 Assigned to: {assignee_id}"
+                    if attachments:
+                        uploaded = [a['name'] for a in result['attachments'] if a['success']]
+                        failed = [f"{a['name']} ({a['error']})" for a in result['attachments'] if not a['success']]
+                        if uploaded:
+                            message += f"\n📎 Attachments: {', '.join(uploaded)}"
+                        if failed:
+                            message += f"\n⚠️ Failed attachments: {', '.join(failed)}"
+                    for warning in warnings:
+                        message += f"\n⚠️ {warning}"
+                        
+                    return self.create_text_message(message)
+                else:
+                    span.set_status(STATUS_ERROR, result['error'])
+                    return self.create_text_message(f"❌ Failed to create Trello card: {result['error']}")
+                    
+            except Exception as e:
+                span.set_status(STATUS_ERROR, str(e))
+                return self.create_text_message(f"❌ Unexpected error: {str(e)}")
     
-    def _validate_and_truncate_description(self, description: str) -> str:
+    def _description_overflows(self, description: str) -> bool:
         """
-        Validate and truncate description if necessary
+        Check whether a description will be truncated
         
         Args:
             description: The card description
             
         Returns:
-            Validated and potentially truncated description
+            True if the description exceeds the length limit
         """
-        # Trello descriptions can be up to 16,384 characters, but we'll limit to 10,000 for performance
-        max_length = 10000
-        if len(description) > max_length:
-            description = description[:max_length-50] + "\n\n[Content truncated due to length limit]"
-        return description.strip()
+        return len(InputSanitizer.sanitize_multiline_text(description)) > TrelloValidator.MAX_DESCRIPTION_LENGTH
     
-    def _validate_due_date(self, due_date: str) -> str:
+    def _iter_text_chunks(self, text: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
         """
-        Validate due date format
+        Encode text as UTF-8 in chunks for streaming upload
         
         Args:
-            due_date: Date string in YYYY-MM-DD format
+            text: Text to encode
+            chunk_size: Characters per chunk
             
-        Returns:
-            Validated date string or empty string if invalid
+        Yields:
+            Encoded chunks
         """
-        try:
-            # Parse the date to validate format
-            parsed_date = datetime.strptime(due_date, '%Y-%m-%d')
-            # Return ISO format for Trello API
-            return parsed_date.isoformat()
-        except ValueError:
-            return ""
+        for start in range(0, len(text), chunk_size):
+            yield text[start:start + chunk_size].encode('utf-8')
     
-    def _process_labels(self, labels: str) -> List[str]:
+    def _process_attachment_paths(self, attachment_paths: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
-        Process comma-separated labels into a list
+        Process comma-separated local file paths into attachment specs
+        
+        Paths are resolved against TRELLO_ATTACHMENT_DIR, and after following
+        symlinks every file must lie inside it; without that setting no local
+        file can be attached.
         
         Args:
-            labels: Comma-separated label names
+            attachment_paths: Comma-separated file paths, relative to the attachment directory or absolute
             
         Returns:
-            List of label names
+            Tuple of (attachment dictionaries, error_message)
         """
-        if not labels:
-            return []
+        if not attachment_paths:
+            return [], None
+        
+        base_dir = os.getenv('TRELLO_ATTACHMENT_DIR', '').strip()
+        if not base_dir:
+            return [], "File attachments are disabled; set TRELLO_ATTACHMENT_DIR to allow them"
+        base_dir = os.path.realpath(base_dir)
         
-        label_list = [label.strip() for label in labels.split(',')]
-        # Filter out empty labels and limit to reasonable number
-        label_list = [label for label in label_list if label][:10]
-        return label_list
+        attachments = []
+        for path in (p.strip() for p in attachment_paths.split(',')):
+            if not path:
+                continue
+            resolved = os.path.realpath(os.path.join(base_dir, path))
+            if os.path.commonpath([base_dir, resolved]) != base_dir:
+                return [], f"Attachment path is outside the attachment directory: {path}"
+            if not os.path.isfile(resolved) or not os.access(resolved, os.R_OK):
+                return [], f"Attachment path must point to a readable file: {path}"
+            attachments.append({'source': resolved})
+        return attachments, None
     
     def _create_trello_card(self, api_key: str, token: str, title: str, description: str,
                            board_id: str, list_id: str, labels: List[str] = None,
-                           due_date: str = None, assignee_id: str = None) -> Dict[str, Any]:
+                           due_date: str = None, assignee_id: str = None,
+                           attachments: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Create a Trello card using the API
         
@@ -187,71 +233,106 @@ class CreateTrelloCardTool(BaseTool):
             labels: Optional list of label names
             due_date: Optional due date
             assignee_id: Optional assignee member ID
+            attachments: Optional attachment specs to upload after creation
             
         Returns:
             Dictionary with success status and result
         """
         try:
-            # Verify board and list exist
-            board_check = self._verify_board_access(api_key, token, board_id)
-            if not board_check['success']:
-                return board_check
+            # IDs Trello recently reported as missing fail without a round trip
+            scope = credential_fingerprint(api_key, token)
+            for kind, trello_id in (('board', board_id), ('list', list_id), ('member', assignee_id)):
+                if trello_id and negative_id_cache.contains(scope, kind, trello_id):
+                    add_span_event('negative_cache.hit', **{'trello.kind': kind})
+                    return {
+                        'success': False,
+                        'error': self._not_found_error(kind, trello_id)
+                    }
             
-            list_check = self._verify_list_access(api_key, token, board_id, list_id)
-            if not list_check['success']:
-                return list_check
+            # Fetch board, list, assignee and (if needed) labels in a single /batch round trip
+            client = TrelloAPIClient(api_key, token, batch_window=self._batch_window(),
+                                     hedge_policy=self._hedge_policy(), timeout=self.REQUEST_TIMEOUT,
+                                     max_retries=0)
+            # The board and list checks share this span's round trip; their own
+            # spans only cover evaluating the batched responses
+            with tracer.span('trello.preflight'), client.batch() as batch:
+                board_result = batch.get(f'boards/{board_id}', {'fields': 'id,name'})
+                list_result = batch.get(f'lists/{list_id}', {'fields': 'id,name,idBoard'})
+                member_result = batch.get(f'members/{assignee_id}', {'fields': 'id'}) if assignee_id else None
+                labels_result = batch.get(f'boards/{board_id}/labels', {'fields': 'id,name'}) if labels else None
             
-            # Prepare card data
-            url = "https://api.trello.com/1/cards"
-            params = {
-                'key': api_key,
-                'token': token,
-                'idList': list_id,
-                'name': title,
-                'desc': description
-            }
+            # Verify board, list and assignee exist
+            with tracer.span('trello.board_check', **{'trello.board_id': board_id}):
+                board_check = self._verify_board_access(board_id, board_result)
+            with tracer.span('trello.list_check', **{'trello.list_id': list_id}):
+                list_check = self._verify_list_access(board_id, list_id, list_result)
+            checks = [
+                ('board', board_id, board_check),
+                ('list', list_id, list_check)
+            ]
+            if member_result:
+                with tracer.span('trello.member_check'):
+                    checks.append(('member', assignee_id, self._verify_member_access(assignee_id, member_result)))
             
-            # Add optional parameters
-            if due_date:
-                params['due'] = due_date
+            for kind, trello_id, check in checks:
+                if not check['success']:
+                    if check.get('not_found'):
+                        negative_id_cache.add(scope, kind, trello_id)
+                    return {'success': False, 'error': check['error']}
             
-            if assignee_id:
-                params['idMembers'] = assignee_id
+            # Create the card (rate limiting and circuit breaking handled by the client)
+            with tracer.span('trello.card_post') as post_span:
+                try:
+                    card_data = client.create_card(
+                        list_id,
+                        title,
+                        desc=description,
+                        due=due_date,
+                        id_members=assignee_id,
+                        timeout=self.CARD_POST_TIMEOUT,
+                        max_retries=self.CARD_POST_RETRIES
+                    )
+                except requests.exceptions.HTTPError as e:
+                    if e.response is None:
+                        raise
+                    post_span.set_attribute('http.response.status_code', e.response.status_code)
+                    post_span.set_status(STATUS_ERROR, f'HTTP {e.response.status_code}')
+                    error_msg = f"HTTP {e.response.status_code}"
+                    try:
+                        error_data = e.response.json()
+                        error_msg = error_data.get('message', error_msg)
+                    except:
+                        pass
+                    return {
+                        'success': False,
+                        'error': f"Failed to create card: {error_msg}"
+                    }
             
-            # Create the card
-            response = requests.post(url, params=params, timeout=30)
+            card_id = card_data['id']
+            card_url = card_data['url']
             
-            if response.status_code == 429:
-                # Rate limited, wait and retry
-                time.sleep(2)
-                response = requests.post(url, params=params, timeout=30)
+            # Add labels if specified
+            if labels:
+                self._add_labels_to_card(client, card_id, labels, labels_result)
             
-            if response.status_code == 200:
-                card_data = response.json()
-                card_id = card_data['id']
-                card_url = card_data['url']
-                
-                # Add labels if specified
-                if labels:
-                    self._add_labels_to_card(api_key, token, card_id, labels, board_id)
-                
-                return {
-                    'success': True,
-                    'card_id': card_id,
-                    'card_url': card_url
-                }
-            else:
-                error_msg = f"HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get('message', error_msg)
-                except:
-                    pass
-                return {
-                    'success': False,
-                    'error': f"Failed to create card: {error_msg}"
-                }
+            # Stream attachments concurrently; failures are reported per file
+            attachment_results = []
+            if attachments:
+                with tracer.span('trello.attachments', **{'attachment.count': len(attachments)}):
+                    attachment_results = client.add_attachments(card_id, attachments)
+            
+            return {
+                'success': True,
+                'card_id': card_id,
+                'card_url': card_url,
+                'attachments': attachment_results
+            }
                 
+        except CircuitOpenError as e:
+            return {
+                'success': False,
+                'error': f"{str(e)}. Please try again later."
+            }
         except requests.exceptions.Timeout:
             return {
                 'success': False,
@@ -268,34 +349,70 @@ class CreateTrelloCardTool(BaseTool):
                 'error': f"Unexpected error: {str(e)}"
             }
     
-    def _verify_board_access(self, api_key: str, token: str, board_id: str) -> Dict[str, Any]:
+    def _batch_window(self) -> float:
+        """
+        Get the cross-invocation GET coalescing window
+        
+        Returns:
+            Window in seconds from TRELLO_BATCH_WINDOW_MS, or 0 to disable
+        """
+        try:
+            return max(0.0, float(os.getenv('TRELLO_BATCH_WINDOW_MS', '0')) / 1000)
+        except ValueError:
+            return 0.0
+    
+    def _hedge_policy(self) -> Optional[HedgePolicy]:
+        """
+        Get the shared hedge policy for preflight GETs
+        
+        Returns:
+            Policy for the TRELLO_HEDGE_PERCENTILE latency percentile, or None
+            when the setting is unset or outside (0, 100)
+        """
+        try:
+            percentile = float(os.getenv('TRELLO_HEDGE_PERCENTILE', '0'))
+        except ValueError:
+            return None
+        if not 0 < percentile < 100:
+            return None
+        return HedgePolicy.shared(percentile)
+    
+    def _not_found_error(self, kind: str, trello_id: str) -> str:
+        """
+        Build the error message for a missing or inaccessible resource
+        
+        Args:
+            kind: Resource kind ('board', 'list' or 'member')
+            trello_id: The missing ID
+            
+        Returns:
+            User-facing error message
+        """
+        if kind == 'member':
+            return f"Assignee not found. Please check the assignee ID: {trello_id}"
+        return f"{kind.capitalize()} not found or access denied. Please check the {kind} ID: {trello_id}"
+    
+    def _verify_board_access(self, board_id: str, board_result: Future) -> Dict[str, Any]:
         """
         Verify access to the specified board
         
         Args:
-            api_key: Trello API key
-            token: Trello token
             board_id: Board ID to verify
+            board_result: Pending batched GET of the board
             
         Returns:
             Dictionary with verification result
         """
         try:
-            url = f"https://api.trello.com/1/boards/{board_id}"
-            params = {
-                'key': api_key,
-                'token': token,
-                'fields': 'id,name'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = board_result.result()
             
             if response.status_code == 200:
                 return {'success': True}
             elif response.status_code == 404:
                 return {
                     'success': False,
-                    'error': f"Board not found or access denied. Please check the board ID: {board_id}"
+                    'not_found': True,
+                    'error': self._not_found_error('board', board_id)
                 }
             else:
                 return {
@@ -309,28 +426,20 @@ class CreateTrelloCardTool(BaseTool):
                 'error': f"Board verification failed: {str(e)}"
             }
     
-    def _verify_list_access(self, api_key: str, token: str, board_id: str, list_id: str) -> Dict[str, Any]:
+    def _verify_list_access(self, board_id: str, list_id: str, list_result: Future) -> Dict[str, Any]:
         """
         Verify access to the specified list
         
         Args:
-            api_key: Trello API key
-            token: Trello token
             board_id: Board ID
             list_id: List ID to verify
+            list_result: Pending batched GET of the list
             
         Returns:
             Dictionary with verification result
         """
         try:
-            url = f"https://api.trello.com/1/lists/{list_id}"
-            params = {
-                'key': api_key,
-                'token': token,
-                'fields': 'id,name,idBoard'
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = list_result.result()
             
             if response.status_code == 200:
                 list_data = response.json()
@@ -343,7 +452,8 @@ class CreateTrelloCardTool(BaseTool):
             elif response.status_code == 404:
                 return {
                     'success': False,
-                    'error': f"List not found or access denied. Please check the list ID: {list_id}"
+                    'not_found': True,
+                    'error': self._not_found_error('list', list_id)
                 }
             else:
                 return {
@@ -357,20 +467,56 @@ class CreateTrelloCardTool(BaseTool):
                 'error': f"List verification failed: {str(e)}"
             }
     
-    def _add_labels_to_card(self, api_key: str, token: str, card_id: str, labels: List[str], board_id: str):
+    def _verify_member_access(self, assignee_id: str, member_result: Future) -> Dict[str, Any]:
+        """
+        Verify the assignee exists
+        
+        Args:
+            assignee_id: Member ID to verify
+            member_result: Pending batched GET of the member
+            
+        Returns:
+            Dictionary with verification result
+        """
+        try:
+            response = member_result.result()
+            
+            if response.status_code == 200:
+                return {'success': True}
+            elif response.status_code == 404:
+                return {
+                    'success': False,
+                    'not_found': True,
+                    'error': self._not_found_error('member', assignee_id)
+                }
+            else:
+                return {
+                    'success': False,
+                    'error': f"Cannot access assignee: HTTP {response.status_code}"
+                }
+                
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Assignee verification failed: {str(e)}"
+            }
+    
+    def _add_labels_to_card(self, client: TrelloAPIClient, card_id: str, labels: List[str],
+                            labels_result: Future):
         """
         Add labels to a card
         
         Args:
-            api_key: Trello API key
-            token: Trello token
+            client: Trello API client for this invocation
             card_id: Card ID
             labels: List of label names
-            board_id: Board ID for label lookup
+            labels_result: Pending batched GET of the board labels
         """
         try:
             # Get board labels
-            board_labels = self._get_board_labels(api_key, token, board_id)
+            with tracer.span('trello.label_fetch') as fetch_span:
+                board_labels = self._get_board_labels(labels_result)
+                fetch_span.set_attribute('label.count', len(board_labels))
             
             for label_name in labels:
                 # Find matching label
@@ -382,38 +528,31 @@ class CreateTrelloCardTool(BaseTool):
                 
                 if matching_label:
                     # Add existing label to card
-                    url = f"https://api.trello.com/1/cards/{card_id}/idLabels"
-                    params = {
-                        'key': api_key,
-                        'token': token,
-                        'value': matching_label['id']
-                    }
-                    requests.post(url, params=params, timeout=10)
+                    with tracer.span('trello.label_attach', **{'label.name': label_name}) as attach_span:
+                        try:
+                            client.add_label_to_card(card_id, matching_label['id'])
+                        except requests.exceptions.HTTPError as e:
+                            if e.response is None:
+                                raise
+                            attach_span.set_attribute('http.response.status_code', e.response.status_code)
+                            attach_span.set_status(STATUS_ERROR, f'HTTP {e.response.status_code}')
                     
         except Exception:
             # Labels are optional, so we don't fail the entire operation
             pass
     
-    def _get_board_labels(self, api_key: str, token: str, board_id: str) -> List[Dict]:
+    def _get_board_labels(self, labels_result: Future) -> List[Dict]:
         """
         Get all labels for a board
         
         Args:
-            api_key: Trello API key
-            token: Trello token
-            board_id: Board ID
+            labels_result: Pending batched GET of the board labels
             
         Returns:
             List of board labels
         """
         try:
-            url = f"https://api.trello.com/1/boards/{board_id}/labels"
-            params = {
-                'key': api_key,
-                'token': token
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = labels_result.result()
             
             if response.status_code == 200:
                 return response.json()
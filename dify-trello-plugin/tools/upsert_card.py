@@ -0,0 +1,306 @@
+"""
+Trello Card Upsert Tool
+"""
+import requests
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from core.tools.entities.tool_entities import ToolInvokeMessage
+from core.tools.tool.base_tool import BaseTool
+
+from utils.api_client import TrelloAPIClient
+from utils.card_index import CardIndex, content_hash
+from utils.circuit_breaker import CircuitOpenError
+from utils.fingerprint import credential_fingerprint
+from utils.negative_cache import negative_id_cache
+from utils.validators import TrelloValidator
+
+
+class UpsertTrelloCardTool(BaseTool):
+    """
+    Tool for creating or updating a Trello card identified by an external key
+    """
+    
+    MAX_EXTERNAL_KEY_LENGTH = 256
+    
+    def _invoke(self, user_id: str, tool_parameters: Dict[str, Any]) -> Union[ToolInvokeMessage, List[ToolInvokeMessage]]:
+        """
+        Invoke the Trello card upsert tool
+        
+        Args:
+            user_id: The user ID
+            tool_parameters: Parameters for the upsert
+            
+        Returns:
+            ToolInvokeMessage with the upsert result
+        """
+        try:
+            # Get credentials
+            credentials = self.runtime.credentials
+            api_key = credentials.get('trello_api_key')
+            token = credentials.get('trello_token')
+            
+            if not api_key or not token:
+                return self.create_text_message('Error: Trello API credentials not configured')
+            
+            external_key = (tool_parameters.get('external_key') or '').strip()
+            if not external_key:
+                return self.create_text_message('Error: External key is required')
+            if len(external_key) > self.MAX_EXTERNAL_KEY_LENGTH:
+                return self.create_text_message(
+                    f'Error: External key must be at most {self.MAX_EXTERNAL_KEY_LENGTH} characters'
+                )
+            
+            # Sanitize and validate everything locally before any HTTP request
+            fields, warnings, error = TrelloValidator.validate_card_fields(
+                card_title=tool_parameters.get('card_title', ''),
+                card_description=tool_parameters.get('card_description', ''),
+                board_id=tool_parameters.get('board_id', ''),
+                list_id=tool_parameters.get('list_id', ''),
+                labels=tool_parameters.get('labels', ''),
+                due_date=tool_parameters.get('due_date', ''),
+                assignee_id=tool_parameters.get('assignee_id', '')
+            )
+            if error:
+                return self.create_text_message(f'Error: {error}')
+            
+            result = self._upsert_card(api_key, token, external_key, fields['board_id'],
+                                       self._desired_fields(fields))
+            
+            if not result['success']:
+                return self.create_text_message(f"❌ Failed to upsert Trello card: {result['error']}")
+            
+            headline = {
+                'created': "✅ Trello card created",
+                'updated': "✅ Trello card updated",
+                'unchanged': "✅ Trello card already up to date"
+            }[result['action']]
+            message = f"{headline}\n\n"
+            message += f"🔑 External Key: {external_key}\n"
+            message += f"📋 Title: {fields['title']}\n"
+            message += f"🔗 URL: {result['card_url']}"
+            if result.get('changed_fields'):
+                message += f"\n✏️ Changed: {', '.join(result['changed_fields'])}"
+            for warning in warnings + result.get('warnings', []):
+                message += f"\n⚠️ {warning}"
+            
+            return self.create_text_message(message)
+        
+        except Exception as e:
+            return self.create_text_message(f"❌ Unexpected error: {str(e)}")
+    
+    def _desired_fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the card state to converge on from validated inputs
+        
+        Optional inputs left empty are not managed, so an earlier due date,
+        assignee or label set is kept rather than cleared.
+        
+        Args:
+            fields: Output of TrelloValidator.validate_card_fields
+            
+        Returns:
+            Dictionary of logical card fields (labels by name)
+        """
+        desired = {
+            'name': fields['title'],
+            'desc': fields['description'],
+            'idList': fields['list_id']
+        }
+        if fields['due_date']:
+            desired['due'] = fields['due_date']
+        if fields['assignee_id']:
+            desired['idMembers'] = fields['assignee_id']
+        if fields['labels']:
+            desired['labels'] = sorted(label.lower() for label in fields['labels'])
+        return desired
+    
+    def _upsert_card(self, api_key: str, token: str, external_key: str, board_id: str,
+                     desired: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update the indexed card for a key, or create and index a new one
+        
+        Args:
+            api_key: Trello API key
+            token: Trello token
+            external_key: Caller-supplied key
+            board_id: Board the card lives on
+            desired: Logical card fields from _desired_fields
+            
+        Returns:
+            Dictionary with success status, action and card details
+        """
+        try:
+            # Missing IDs are cached per credential, since access differs between tokens
+            scope = credential_fingerprint(api_key, token)
+            for kind, trello_id in (('board', board_id), ('list', desired['idList']),
+                                    ('member', desired.get('idMembers'))):
+                if trello_id and negative_id_cache.contains(scope, kind, trello_id):
+                    return {
+                        'success': False,
+                        'error': f"{kind.capitalize()} not found or access denied. Please check the {kind} ID: {trello_id}"
+                    }
+            
+            # The index is keyed by board, so it survives token rotation; the key
+            # lock stops concurrent runs for a new key from creating two cards
+            index = CardIndex.shared()
+            with index.key_lock(board_id, external_key):
+                entry = index.get(board_id, external_key)
+                
+                # Fast path: identical content means no request at all
+                if entry and entry['content_hash'] == content_hash(desired):
+                    return self._result('unchanged', entry['card_id'], entry['card_url'])
+                
+                client = TrelloAPIClient(api_key, token)
+                
+                if entry:
+                    changed = {name: value for name, value in desired.items() if entry['fields'].get(name) != value}
+                    merged = dict(entry['fields'], **desired)
+                    if not changed:
+                        index.put(board_id, external_key, entry['card_id'], merged, entry['card_url'])
+                        return self._result('unchanged', entry['card_id'], entry['card_url'])
+                    
+                    trello_fields, warnings, missing_labels = self._to_trello_fields(client, board_id, changed)
+                    applied = self._applied_fields(merged, missing_labels)
+                    if applied == entry['fields']:
+                        # Only labels still missing from the board differ; there is nothing new to write
+                        return self._result('unchanged', entry['card_id'], entry['card_url'], warnings=warnings)
+                    try:
+                        card = client.update_card(entry['card_id'], trello_fields)
+                    except requests.exceptions.HTTPError as e:
+                        if e.response is None or e.response.status_code != 404:
+                            raise
+                        # The card was deleted in Trello; forget it and create a fresh one
+                        index.delete(board_id, external_key)
+                    else:
+                        card_url = card.get('url') or entry['card_url']
+                        index.put(board_id, external_key, entry['card_id'], applied, card_url)
+                        return self._result('updated', entry['card_id'], card_url, sorted(changed), warnings)
+                
+                trello_fields, warnings, missing_labels = self._to_trello_fields(client, board_id, desired)
+                card = client.create_card(
+                    list_id=trello_fields['idList'],
+                    name=trello_fields['name'],
+                    desc=trello_fields['desc'],
+                    due=trello_fields.get('due'),
+                    id_members=trello_fields.get('idMembers'),
+                    id_labels=trello_fields.get('idLabels')
+                )
+                index.put(board_id, external_key, card['id'], self._applied_fields(desired, missing_labels),
+                          card.get('url', ''))
+                return self._result('created', card['id'], card.get('url', ''), warnings=warnings)
+        
+        except CircuitOpenError as e:
+            return {
+                'success': False,
+                'error': f"{str(e)}. Please try again later."
+            }
+        except requests.exceptions.HTTPError as e:
+            return {
+                'success': False,
+                'error': self._http_error_message(e)
+            }
+        except requests.exceptions.Timeout:
+            return {
+                'success': False,
+                'error': "Request timeout. Please try again."
+            }
+        except requests.exceptions.ConnectionError:
+            return {
+                'success': False,
+                'error': "Connection error. Please check your network."
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Unexpected error: {str(e)}"
+            }
+    
+    def _to_trello_fields(self, client: TrelloAPIClient, board_id: str,
+                          fields: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str], List[str]]:
+        """
+        Convert logical fields to Trello API fields, resolving label names to IDs
+        
+        Board labels are only fetched when labels are part of the change.
+        
+        Args:
+            client: Trello API client
+            board_id: Board to resolve labels on
+            fields: Logical card fields
+            
+        Returns:
+            Tuple of (trello_fields, warnings, label names not found on the board)
+        """
+        trello_fields = {name: value for name, value in fields.items() if name != 'labels'}
+        warnings = []
+        missing = []
+        if 'labels' in fields:
+            board_labels = client.get_board_labels(board_id, fields='id,name')
+            ids_by_name = {label.get('name', '').lower(): label['id'] for label in board_labels}
+            label_ids = [ids_by_name[name] for name in fields['labels'] if name in ids_by_name]
+            missing = [name for name in fields['labels'] if name not in ids_by_name]
+            if missing:
+                warnings.append(f"Labels not found on board: {', '.join(missing)}")
+            trello_fields['idLabels'] = ','.join(label_ids)
+        return trello_fields, warnings, missing
+    
+    def _applied_fields(self, fields: Dict[str, Any], missing_labels: List[str]) -> Dict[str, Any]:
+        """
+        Get the fields actually written to the card, for the index
+        
+        Labels that were not found on the board are left out, so a later run
+        sees them as changed and retries once they exist.
+        
+        Args:
+            fields: Logical card fields that were sent
+            missing_labels: Label names that could not be resolved
+            
+        Returns:
+            Fields to record in the index
+        """
+        if not missing_labels or 'labels' not in fields:
+            return fields
+        return dict(fields, labels=[name for name in fields['labels'] if name not in missing_labels])
+    
+    def _result(self, action: str, card_id: str, card_url: str, changed_fields: Optional[List[str]] = None,
+                warnings: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Build a successful upsert result
+        
+        Args:
+            action: 'created', 'updated' or 'unchanged'
+            card_id: Card ID
+            card_url: Card URL
+            changed_fields: Logical fields sent in an update
+            warnings: Non-fatal warnings
+            
+        Returns:
+            Result dictionary
+        """
+        return {
+            'success': True,
+            'action': action,
+            'card_id': card_id,
+            'card_url': card_url,
+            'changed_fields': changed_fields or [],
+            'warnings': warnings or []
+        }
+    
+    def _http_error_message(self, error: requests.exceptions.HTTPError) -> str:
+        """
+        Extract a readable message from an HTTP error
+        
+        Args:
+            error: HTTPError raised by the client
+            
+        Returns:
+            Error message
+        """
+        response = error.response
+        if response is None:
+            return str(error)
+        error_msg = f"HTTP {response.status_code}"
+        try:
+            error_msg = response.json().get('message', error_msg)
+        except Exception:
+            pass
+        return f"Trello request failed: {error_msg}"
\ No newline at end of file
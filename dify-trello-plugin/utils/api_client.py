@@ -1,10 +1,44 @@
 """
 Trello API Client Utilities
 """
+import contextvars
+import json
+import os
 import requests
+import threading
 import time
-from typing import Any, Dict, Optional
-from urllib.parse import urljoin
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urljoin, urlparse
+from urllib3.exceptions import NewConnectionError
+
+from .batch import BatchCall, BatchCoalescer, BatchCollector, BatchResponse
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_breakers_for
+from .hedging import HedgePolicy, route_template
+from .multipart import AttachmentSource, FilePart, MultipartStream
+from .rate_limiter import get_rate_limiters_for
+from .tracing import add_span_event
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JsonDecoder = Callable[[bytes], Any]
+Fields = Union[str, Iterable[str], None]
+
+
+def default_json_decoder() -> JsonDecoder:
+    """
+    Get the fastest available JSON decoder
+    
+    Returns:
+        orjson.loads when orjson is installed, otherwise json.loads
+    """
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
 
 
 class TrelloAPIClient:
@@ -15,18 +49,69 @@ class TrelloAPIClient:
     BASE_URL = "https://api.trello.com/1/"
     RATE_LIMIT_DELAY = 2  # seconds
     MAX_RETRIES = 3
+    REQUEST_TIMEOUT = 30  # seconds
+    
+    # Default field projections - only what the plugin actually reads
+    MEMBER_FIELDS = 'id,username,fullName'
+    BOARD_FIELDS = 'id,name,url'
+    LIST_FIELDS = 'id,name,idBoard'
+    LABEL_FIELDS = 'id,name,color'
+    CARD_FIELDS = 'id,name,idBoard,idList,url'
+    ACTION_FIELDS = 'id,type,date,data'
     
-    def __init__(self, api_key: str, token: str):
+    # Trello caps card listing pages at 1000 items
+    MAX_PAGE_SIZE = 1000
+    
+    # Trello's /batch endpoint accepts at most 10 routes per request
+    MAX_BATCH_SIZE = 10
+    
+    # Concurrent uploads per add_attachments call
+    MAX_UPLOAD_WORKERS = 4
+    
+    # Concurrent PUTs per bulk_update_cards call
+    MAX_UPDATE_WORKERS = 8
+    
+    # Card fields bulk_update_cards compares against before sending a PUT
+    CARD_STATE_FIELDS = 'id,idList,idLabels,idMembers,closed'
+    
+    def __init__(self, api_key: str, token: str, json_decoder: Optional[JsonDecoder] = None,
+                 batch_window: Optional[float] = None, hedge_policy: Optional[HedgePolicy] = None,
+                 timeout: float = REQUEST_TIMEOUT, max_retries: int = MAX_RETRIES):
         """
         Initialize the Trello API client
         
         Args:
             api_key: Trello API key
             token: Trello token
+            json_decoder: Callable turning a raw response body into Python objects.
+                Defaults to orjson when available, falling back to json.
+            batch_window: When set, GETs issued by concurrent callers sharing these
+                credentials within this many seconds are merged into /batch calls
+            hedge_policy: When set, a GET still outstanding after the policy's
+                latency percentile is duplicated and the first response wins
+            timeout: Default per-attempt timeout in seconds
+            max_retries: Default number of retries after a failed or rate-limited attempt
         """
         self.api_key = api_key
         self.token = token
         self.session = requests.Session()
+        self.json_decoder = json_decoder or default_json_decoder()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            'requests': 0,
+            'bytes_received': 0,
+            'bytes_decoded': 0,
+            'decoded_responses': 0,
+            'decode_seconds': 0.0
+        }
+        self._breakers = get_breakers_for(urlparse(self.BASE_URL).hostname, api_key, token)
+        self._rate_limiters = get_rate_limiters_for(api_key, token)
+        self.hedge_policy = hedge_policy
+        self._coalescer = None
+        if batch_window:
+            self._coalescer = BatchCoalescer.for_credentials(api_key, token, batch_window, self.MAX_BATCH_SIZE)
         
     def _get_auth_params(self) -> Dict[str, str]:
         """
@@ -40,22 +125,164 @@ class TrelloAPIClient:
             'token': self.token
         }
     
+    @staticmethod
+    def _projection_params(fields: Fields = None, **nested: Fields) -> Dict[str, str]:
+        """
+        Build field projection query parameters
+        
+        Args:
+            fields: Top-level fields to return, as a comma-separated string or iterable
+            **nested: Nested projections and expansions, e.g. ``lists='open'`` and
+                ``list_fields=('id', 'name')``
+            
+        Returns:
+            Query parameters with every projection rendered as a comma-separated string
+        """
+        params = {}
+        if fields:
+            params['fields'] = fields if isinstance(fields, str) else ','.join(fields)
+        for name, value in nested.items():
+            if value:
+                params[name] = value if isinstance(value, str) else ','.join(value)
+        return params
+    
+    def _record(self, **deltas: Union[int, float]) -> None:
+        """
+        Add deltas to the client metrics counters
+        
+        Args:
+            **deltas: Counter names and the amounts to add
+        """
+        with self._metrics_lock:
+            for name, delta in deltas.items():
+                self._metrics[name] = self._metrics.get(name, 0) + delta
+    
+    @staticmethod
+    def _wire_bytes(response: requests.Response, body: bytes) -> int:
+        """
+        Count the bytes a response took on the wire, before gzip decoding
+        
+        Args:
+            response: Response whose body has been read
+            body: Decoded response body, used when the wire size is unknown
+            
+        Returns:
+            Compressed body size as received, or the decoded size as a fallback
+        """
+        tell = getattr(response.raw, 'tell', None)
+        if callable(tell):
+            try:
+                received = tell()
+            except (OSError, ValueError):
+                received = None
+            if isinstance(received, int) and (received or not body):
+                return received
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit():
+            return int(length)
+        return len(body)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the client metrics
+        
+        Returns:
+            Dictionary with request, payload size (on the wire and decoded) and
+            decode time counters plus per-call averages
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        requests_made = metrics['requests']
+        decoded = metrics['decoded_responses']
+        metrics['avg_bytes_per_request'] = metrics['bytes_received'] / requests_made if requests_made else 0.0
+        metrics['avg_decode_seconds'] = metrics['decode_seconds'] / decoded if decoded else 0.0
+        metrics['circuit_breakers'] = {breaker.name: breaker.snapshot() for breaker in self._breakers}
+        metrics['rate_limiters'] = {bucket.name: bucket.snapshot() for bucket in self._rate_limiters}
+        if self.hedge_policy is not None:
+            metrics['hedge_policy'] = self.hedge_policy.snapshot()
+        return metrics
+    
+    def _decode(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON response body with the configured decoder
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            Decoded JSON payload
+            
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if isinstance(response, BatchResponse):
+            return response.json()
+        body = response.content
+        start = time.perf_counter()
+        data = self.json_decoder(body)
+        self._record(decoded_responses=1, decode_seconds=time.perf_counter() - start)
+        return data
+    
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
-                     data: Optional[Dict] = None, retries: int = 0) -> requests.Response:
+                     data: Optional[Any] = None, retries: int = 0,
+                     headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+                     max_retries: Optional[int] = None) -> requests.Response:
         """
         Make an authenticated request to the Trello API with retry logic
         
+        GETs are hedged when a hedge policy is configured; other methods are
+        never duplicated.
+        
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint
             params: Query parameters
+            data: Request body data, either form fields or an iterable body stream
+            retries: Current retry count
+            headers: Extra request headers
+            timeout: Per-attempt timeout in seconds; defaults to the client's
+            max_retries: Retries allowed for this call; defaults to the client's
+            
+        Returns:
+            Response object
+            
+        Raises:
+            CircuitOpenError: If a circuit breaker is open; never retried
+            requests.RequestException: If request fails after all retries
+        """
+        timeout = self.timeout if timeout is None else timeout
+        max_retries = self.max_retries if max_retries is None else max_retries
+        if method == 'GET' and self.hedge_policy is not None and retries == 0:
+            return self._hedged_get(endpoint, params, headers, timeout, max_retries)
+        return self._send(method, endpoint, params, data, retries, headers, timeout=timeout, max_retries=max_retries)
+    
+    def _send(self, method: str, endpoint: str, params: Optional[Dict] = None,
+              data: Optional[Any] = None, retries: int = 0,
+              headers: Optional[Dict[str, str]] = None, reserved: bool = False,
+              timeout: float = REQUEST_TIMEOUT, max_retries: int = MAX_RETRIES) -> requests.Response:
+        """
+        Send a single request, retrying rate-limited and failed attempts
+        
+        GETs are retried on any request error. Other methods are retried only
+        on 429 and on errors raised before the request was sent, so a card
+        POST that timed out after reaching Trello is never sent twice.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Query parameters
             data: Request body data
             retries: Current retry count
+            headers: Extra request headers
+            reserved: Whether a rate limit token was already taken for this attempt
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries allowed before giving up
             
         Returns:
             Response object
             
         Raises:
+            CircuitOpenError: If a circuit breaker is open; never retried
             requests.RequestException: If request fails after all retries
         """
         url = urljoin(self.BASE_URL, endpoint)
@@ -65,48 +292,385 @@ class TrelloAPIClient:
         if params:
             request_params.update(params)
         
+        # Fail fast while Trello (or this credential) is failing
+        self._acquire_breakers()
+        
+        # Stay under Trello's per-key and per-token limits instead of collecting 429s
+        if not reserved:
+            self._acquire_rate_limit()
+        
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=request_params,
-                data=data,
-                timeout=30
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=request_params,
+                    data=data,
+                    headers=headers,
+                    timeout=timeout
+                )
+            except requests.exceptions.RequestException as e:
+                self._record_breaker_outcome(time.perf_counter() - start, server_ok=False, credential_ok=False)
+                self._trace_request(method, endpoint, retries, time.perf_counter() - start, error=type(e).__name__)
+                raise
+            duration = time.perf_counter() - start
+            self._record_breaker_outcome(
+                duration,
+                server_ok=response.status_code < 500,
+                credential_ok=response.status_code < 500 and response.status_code != 429
             )
+            body = response.content
+            self._record(requests=1, bytes_received=self._wire_bytes(response, body), bytes_decoded=len(body))
+            self._trace_request(method, endpoint, retries, duration, status_code=response.status_code)
             
             # Handle rate limiting
-            if response.status_code == 429 and retries < self.MAX_RETRIES:
-                time.sleep(self.RATE_LIMIT_DELAY * (2 ** retries))  # Exponential backoff
-                return self._make_request(method, endpoint, params, data, retries + 1)
+            if response.status_code == 429 and retries < max_retries:
+                backoff = self.RATE_LIMIT_DELAY * (2 ** retries)  # Exponential backoff
+                add_span_event('retry', **{'retry.reason': 'rate_limited', 'retry.attempt': retries + 1,
+                                           'backoff.seconds': float(backoff)})
+                time.sleep(backoff)
+                return self._send(method, endpoint, params, data, retries + 1, headers,
+                                  timeout=timeout, max_retries=max_retries)
             
             return response
             
+        except CircuitOpenError:
+            raise
         except requests.exceptions.RequestException as e:
-            if retries < self.MAX_RETRIES:
+            # A POST or PUT that timed out or dropped mid-response may already
+            # have been applied, so only GETs are retried on those errors
+            if retries < max_retries and (method == 'GET' or self._never_sent(e)):
+                add_span_event('retry', **{'retry.reason': type(e).__name__, 'retry.attempt': retries + 1,
+                                           'backoff.seconds': float(self.RATE_LIMIT_DELAY)})
                 time.sleep(self.RATE_LIMIT_DELAY)
-                return self._make_request(method, endpoint, params, data, retries + 1)
+                return self._send(method, endpoint, params, data, retries + 1, headers,
+                                  timeout=timeout, max_retries=max_retries)
             raise e
     
-    def get_user_info(self) -> Dict[str, Any]:
+    @staticmethod
+    def _never_sent(error: requests.exceptions.RequestException) -> bool:
+        """
+        Whether a request failed before any of it reached the server
+        
+        Args:
+            error: Exception raised by the session
+            
+        Returns:
+            True for connect timeouts and refused or unresolvable connections
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, (requests.exceptions.SSLError, requests.exceptions.ProxyError)):
+            return False
+        if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+            return isinstance(getattr(error.args[0], 'reason', None), NewConnectionError)
+        return False
+    
+    def _trace_request(self, method: str, endpoint: str, attempt: int, duration: float,
+                       status_code: Optional[int] = None, error: Optional[str] = None) -> None:
+        """
+        Record an HTTP attempt as an event on the current trace span
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            attempt: Retry count of this attempt (0 for the first)
+            duration: Attempt duration in seconds
+            status_code: Response status, if a response arrived
+            error: Exception type name, if the attempt failed
+        """
+        attributes = {
+            'http.request.method': method,
+            'http.route': route_template(endpoint),
+            'retry.attempt': attempt,
+            'duration_ms': round(duration * 1000, 3)
+        }
+        if status_code is not None:
+            attributes['http.response.status_code'] = status_code
+        if error:
+            attributes['error.type'] = error
+        add_span_event('http.request', **attributes)
+    
+    def _hedged_get(self, endpoint: str, params: Optional[Dict] = None,
+                    headers: Optional[Dict[str, str]] = None, timeout: float = REQUEST_TIMEOUT,
+                    max_retries: int = MAX_RETRIES) -> requests.Response:
+        """
+        Send a GET and, if it is still outstanding after the hedge delay, an
+        identical second GET; whichever completes successfully first is returned
+        
+        The first request runs on a thread of its own and is never queued. The
+        hedge draws a rate limit token like any other request and runs on the
+        policy's bounded pool; it is skipped when no token or no idle worker is
+        available immediately. The losing request is left to finish in the
+        background and its response is discarded.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            headers: Extra request headers
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries allowed for each leg
+            
+        Returns:
+            Response object
+            
+        Raises:
+            requests.RequestException: If every sent request fails
+        """
+        policy = self.hedge_policy
+        # Run legs in a copy of the caller's context so they annotate its trace span
+        primary = policy.start(contextvars.copy_context().run, self._timed_get,
+                               endpoint, params, headers, False, timeout, max_retries)
+        done, _ = wait([primary], timeout=policy.delay_for(endpoint))
+        if done:
+            return primary.result()
+        
+        if not self._try_acquire_rate_limit():
+            return self._skip_hedge(primary, endpoint, 'rate_limit')
+        hedge = policy.try_submit(contextvars.copy_context().run, self._timed_get,
+                                  endpoint, params, headers, True, timeout, max_retries)
+        if hedge is None:
+            self._release_rate_limit()
+            return self._skip_hedge(primary, endpoint, 'pool_busy')
+        
+        self._record(hedges_sent=1)
+        add_span_event('hedge.sent', **{'http.route': route_template(endpoint)})
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._record(hedge_wins=1)
+                        add_span_event('hedge.won', **{'http.route': route_template(endpoint)})
+                    return future.result()
+        return primary.result()
+    
+    def _skip_hedge(self, primary: Future, endpoint: str, reason: str) -> requests.Response:
+        """
+        Record a hedge that was not sent and wait for the first request
+        
+        Args:
+            primary: Future of the first request
+            endpoint: API endpoint
+            reason: 'rate_limit' or 'pool_busy'
+            
+        Returns:
+            Response of the first request
+        """
+        self._record(hedges_skipped=1)
+        add_span_event('hedge.skipped', **{'http.route': route_template(endpoint), 'hedge.skip_reason': reason})
+        return primary.result()
+    
+    def _timed_get(self, endpoint: str, params: Optional[Dict], headers: Optional[Dict[str, str]],
+                   reserved: bool, timeout: float, max_retries: int) -> requests.Response:
+        """
+        Send one leg of a hedged GET and feed its latency to the hedge policy
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            headers: Extra request headers
+            reserved: Whether a rate limit token was already taken
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries allowed for this leg
+            
+        Returns:
+            Response object
+        """
+        start = time.perf_counter()
+        response = self._send('GET', endpoint, params, headers=headers, reserved=reserved,
+                              timeout=timeout, max_retries=max_retries)
+        self.hedge_policy.observe(endpoint, time.perf_counter() - start)
+        return response
+    
+    def _acquire_rate_limit(self) -> None:
+        """
+        Take a token from the API key and token buckets, waiting if necessary
+        """
+        waited = sum(bucket.acquire() for bucket in self._rate_limiters)
+        if waited:
+            self._record(rate_limit_waits=1, rate_limit_wait_seconds=waited)
+            add_span_event('rate_limit.wait', **{'wait.seconds': waited})
+    
+    def _try_acquire_rate_limit(self) -> bool:
+        """
+        Take a token from every bucket only if all have one available now
+        
+        Returns:
+            True if the tokens were taken
+        """
+        acquired = []
+        for bucket in self._rate_limiters:
+            if not bucket.try_acquire():
+                for taken in acquired:
+                    taken.release()
+                return False
+            acquired.append(bucket)
+        return True
+    
+    def _release_rate_limit(self) -> None:
+        """
+        Return a token taken with _try_acquire_rate_limit that was not used
+        """
+        for bucket in self._rate_limiters:
+            bucket.release()
+    
+    def _acquire_breakers(self) -> None:
+        """
+        Reserve permission from the host and credential circuit breakers
+        
+        Raises:
+            CircuitOpenError: If either breaker rejects the call
+        """
+        acquired: List[CircuitBreaker] = []
+        try:
+            for breaker in self._breakers:
+                breaker.before_call()
+                acquired.append(breaker)
+        except requests.exceptions.RequestException:
+            self._record(circuit_rejections=1)
+            for breaker in acquired:
+                breaker.release()
+            raise
+    
+    def _record_breaker_outcome(self, duration: float, server_ok: bool, credential_ok: bool) -> None:
+        """
+        Report a call outcome to the circuit breakers
+        
+        Rate limiting (429) only counts against the credential breaker, since it
+        says nothing about the health of Trello as a whole.
+        
+        Args:
+            duration: Call duration in seconds
+            server_ok: Whether the host handled the call (no 5xx or transport error)
+            credential_ok: Whether the call succeeded for this credential
+        """
+        host_breaker, credential_breaker = self._breakers
+        host_breaker.record(server_ok, duration)
+        credential_breaker.record(credential_ok, duration)
+    
+    def _get(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Union[requests.Response, BatchResponse]:
+        """
+        Make a GET request, merging it into a /batch call when coalescing is enabled
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            
+        Returns:
+            Response object, or a BatchResponse when coalesced
+            
+        Raises:
+            requests.RequestException: If the request fails after all retries
+        """
+        if self._coalescer is None:
+            return self._make_request('GET', endpoint, params=params)
+        return self._coalescer.submit(BatchCall(endpoint, params, self._execute_batch)).result()
+    
+    def batch(self) -> BatchCollector:
+        """
+        Collect independent GETs and send them as /batch calls
+        
+        Returns:
+            BatchCollector usable as a context manager; its get() returns futures
+            resolving to BatchResponse objects when the block exits
+        """
+        submit = self._coalescer.submit if self._coalescer else None
+        return BatchCollector(submit, self._execute_batch)
+    
+    def get_many(self, calls: List[Tuple[str, Optional[Dict[str, str]]]]) -> List[BatchResponse]:
+        """
+        Execute several independent GETs with as few round trips as possible
+        
+        Args:
+            calls: (endpoint, params) pairs
+            
+        Returns:
+            BatchResponse objects in the same order as the calls
+            
+        Raises:
+            requests.RequestException: If a /batch request fails
+        """
+        with self.batch() as batch:
+            futures = [batch.get(endpoint, params) for endpoint, params in calls]
+        return [future.result() for future in futures]
+    
+    def _execute_batch(self, calls: List[BatchCall]) -> None:
+        """
+        Send calls in /batch requests of up to MAX_BATCH_SIZE routes and resolve their futures
+        
+        Args:
+            calls: Calls to send
+        """
+        for start in range(0, len(calls), self.MAX_BATCH_SIZE):
+            chunk = calls[start:start + self.MAX_BATCH_SIZE]
+            try:
+                if len(chunk) == 1:
+                    results = [self._single_batch_response(chunk[0])]
+                else:
+                    response = self._make_request('GET', 'batch', params={
+                        'urls': ','.join(call.route for call in chunk)
+                    })
+                    response.raise_for_status()
+                    items = self._decode(response)
+                    if not isinstance(items, list) or len(items) != len(chunk):
+                        raise ValueError('Unexpected /batch response format')
+                    results = [BatchResponse.from_batch_item(item, call.route) for item, call in zip(items, chunk)]
+                    self._record(batch_requests=1, batched_calls=len(chunk))
+            except Exception as e:
+                for call in chunk:
+                    call.future.set_exception(e)
+                continue
+            
+            for call, result in zip(chunk, results):
+                call.future.set_result(result)
+    
+    def _single_batch_response(self, call: BatchCall) -> BatchResponse:
+        """
+        Send a lone call directly, since a one-route /batch saves nothing
+        
+        Args:
+            call: Call to send
+            
+        Returns:
+            BatchResponse wrapping the direct response
+        """
+        response = self._make_request('GET', call.endpoint, params=call.params)
+        try:
+            payload = self._decode(response)
+        except ValueError:
+            payload = {'message': response.text}
+        return BatchResponse(response.status_code, payload, call.route)
+    
+    def get_user_info(self, fields: Fields = MEMBER_FIELDS, **nested: Fields) -> Dict[str, Any]:
         """
         Get current user information for credential validation
         
+        Args:
+            fields: Member fields to return, or 'all'
+            **nested: Nested projections, e.g. ``boards='open'``, ``board_fields='id,name'``
+            
         Returns:
             User information dictionary
             
         Raises:
             requests.RequestException: If request fails
         """
-        response = self._make_request('GET', 'members/me')
+        response = self._get('members/me', params=self._projection_params(fields, **nested))
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
     
-    def get_board(self, board_id: str) -> Dict[str, Any]:
+    def get_board(self, board_id: str, fields: Fields = BOARD_FIELDS, **nested: Fields) -> Dict[str, Any]:
         """
         Get board information
         
         Args:
             board_id: Board ID
+            fields: Board fields to return, or 'all'
+            **nested: Nested projections, e.g. ``lists='open'``, ``list_fields='id,name'``,
+                ``labels='all'``, ``label_fields='id,name'``
             
         Returns:
             Board information dictionary
@@ -114,16 +678,18 @@ class TrelloAPIClient:
         Raises:
             requests.RequestException: If request fails
         """
-        response = self._make_request('GET', f'boards/{board_id}')
+        response = self._get(f'boards/{board_id}', params=self._projection_params(fields, **nested))
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
     
-    def get_list(self, list_id: str) -> Dict[str, Any]:
+    def get_list(self, list_id: str, fields: Fields = LIST_FIELDS, **nested: Fields) -> Dict[str, Any]:
         """
         Get list information
         
         Args:
             list_id: List ID
+            fields: List fields to return, or 'all'
+            **nested: Nested projections, e.g. ``board='true'``, ``board_fields='id,name'``
             
         Returns:
             List information dictionary
@@ -131,12 +697,13 @@ class TrelloAPIClient:
         Raises:
             requests.RequestException: If request fails
         """
-        response = self._make_request('GET', f'lists/{list_id}')
+        response = self._get(f'lists/{list_id}', params=self._projection_params(fields, **nested))
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
     
     def create_card(self, list_id: str, name: str, desc: str = None,
-                   due: str = None, id_members: str = None) -> Dict[str, Any]:
+                   due: str = None, id_members: str = None, id_labels: str = None,
+                   timeout: Optional[float] = None, max_retries: Optional[int] = None) -> Dict[str, Any]:
         """
         Create a new card
         
@@ -146,6 +713,9 @@ class TrelloAPIClient:
             desc: Card description
             due: Due date
             id_members: Member IDs to assign
+            id_labels: Comma-separated label IDs to apply
+            timeout: Per-attempt timeout in seconds; defaults to the client's
+            max_retries: Retries allowed; defaults to the client's
             
         Returns:
             Created card information
@@ -164,17 +734,186 @@ class TrelloAPIClient:
             data['due'] = due
         if id_members:
             data['idMembers'] = id_members
+        if id_labels:
+            data['idLabels'] = id_labels
         
-        response = self._make_request('POST', 'cards', data=data)
+        response = self._make_request('POST', 'cards', data=data, timeout=timeout, max_retries=max_retries)
+        response.raise_for_status()
+        return self._decode(response)
+    
+    def update_card(self, card_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update a card with a single PUT carrying only the given fields
+        
+        Args:
+            card_id: Card ID
+            fields: Trello card fields to change (e.g. name, desc, idList, due,
+                idMembers, idLabels, closed); None clears a field
+            
+        Returns:
+            Updated card information
+            
+        Raises:
+            requests.RequestException: If request fails
+        """
+        data = {name: '' if value is None else value for name, value in fields.items()}
+        response = self._make_request('PUT', f'cards/{card_id}', data=data)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
     
-    def get_board_labels(self, board_id: str) -> list:
+    def get_cards(self, card_ids: Iterable[str], fields: Fields = CARD_FIELDS) -> Dict[str, BatchResponse]:
+        """
+        Fetch several cards through /batch
+        
+        Args:
+            card_ids: Card IDs; duplicates are fetched once
+            fields: Card fields to return
+            
+        Returns:
+            BatchResponse per card ID, in first-seen order
+            
+        Raises:
+            requests.RequestException: If a /batch request fails
+        """
+        card_ids = list(dict.fromkeys(card_ids))
+        params = self._projection_params(fields)
+        responses = self.get_many([(f'cards/{card_id}', params) for card_id in card_ids])
+        return dict(zip(card_ids, responses))
+    
+    def bulk_update_cards(self, card_ids: Iterable[str], id_list: Optional[str] = None,
+                          closed: Optional[bool] = None, add_label_ids: Iterable[str] = (),
+                          remove_label_ids: Iterable[str] = (), due: Optional[str] = None,
+                          id_members: Optional[Iterable[str]] = None,
+                          max_workers: int = MAX_UPDATE_WORKERS) -> List[Dict[str, Any]]:
+        """
+        Apply the same operations to many cards with one PUT per card
+        
+        Card IDs are deduplicated and every operation for a card is coalesced
+        into a single PUT. Label changes need the current labels, which are
+        fetched through /batch; those cards are also compared against the
+        requested state, and cards already in it are not written.
+        
+        Args:
+            card_ids: Cards to update
+            id_list: Move cards to this list
+            closed: True to archive, False to unarchive
+            add_label_ids: Label IDs to add
+            remove_label_ids: Label IDs to remove; removals apply before additions
+            due: Due date to set; '' clears it
+            id_members: Member IDs replacing the current members
+            max_workers: Maximum concurrent PUTs
+            
+        Returns:
+            One outcome per distinct card ID, in order, with 'card_id', 'success',
+            'fields' (as sent) and 'unchanged', or 'error'
+        """
+        card_ids = list(dict.fromkeys(card_id.strip() for card_id in card_ids if card_id and card_id.strip()))
+        add_label_ids = list(dict.fromkeys(add_label_ids))
+        remove_label_ids = set(remove_label_ids)
+        
+        requested: Dict[str, Any] = {}
+        if id_list:
+            requested['idList'] = id_list
+        if closed is not None:
+            requested['closed'] = 'true' if closed else 'false'
+        if due is not None:
+            requested['due'] = due or None
+        if id_members is not None:
+            requested['idMembers'] = ','.join(dict.fromkeys(id_members))
+        
+        current: Dict[str, BatchResponse] = {}
+        if add_label_ids or remove_label_ids:
+            try:
+                current = self.get_cards(card_ids, fields=self.CARD_STATE_FIELDS)
+            except requests.exceptions.RequestException as e:
+                return [{'card_id': card_id, 'success': False, 'error': str(e)} for card_id in card_ids]
+        
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        updates: Dict[str, Dict[str, Any]] = {}
+        for card_id in card_ids:
+            fields = dict(requested)
+            response = current.get(card_id)
+            if response is not None:
+                if not response.ok:
+                    outcomes[card_id] = {'card_id': card_id, 'success': False,
+                                         'error': self._response_error(response)}
+                    continue
+                card = response.json()
+                labels = [label_id for label_id in card.get('idLabels', []) if label_id not in remove_label_ids]
+                labels += [label_id for label_id in add_label_ids if label_id not in labels]
+                fields['idLabels'] = ','.join(labels)
+                fields = {name: value for name, value in fields.items() if not self._card_has(card, name, value)}
+            if fields:
+                updates[card_id] = fields
+            else:
+                outcomes[card_id] = {'card_id': card_id, 'success': True, 'unchanged': True, 'fields': {}}
+        
+        def update(card_id: str) -> Dict[str, Any]:
+            fields = updates[card_id]
+            try:
+                self.update_card(card_id, fields)
+                return {'card_id': card_id, 'success': True, 'unchanged': False, 'fields': fields}
+            except requests.exceptions.HTTPError as e:
+                error = self._response_error(e.response) if e.response is not None else str(e)
+                return {'card_id': card_id, 'success': False, 'error': error}
+            except requests.exceptions.RequestException as e:
+                return {'card_id': card_id, 'success': False, 'error': str(e)}
+        
+        if updates:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(updates)))) as executor:
+                futures = [executor.submit(contextvars.copy_context().run, update, card_id) for card_id in updates]
+                for future in futures:
+                    outcome = future.result()
+                    outcomes[outcome['card_id']] = outcome
+        return [outcomes[card_id] for card_id in card_ids]
+    
+    @staticmethod
+    def _card_has(card: Dict[str, Any], name: str, value: Any) -> bool:
+        """
+        Check whether a fetched card already holds a requested field value
+        
+        Args:
+            card: Card with CARD_STATE_FIELDS
+            name: Trello field name
+            value: Value as it would be sent
+            
+        Returns:
+            True if sending the field would change nothing; unknown fields are
+            never considered equal
+        """
+        if name in ('idLabels', 'idMembers') and name in card:
+            return set(card[name]) == set(filter(None, value.split(',')))
+        if name == 'idList' and name in card:
+            return card[name] == value
+        if name == 'closed' and name in card:
+            return ('true' if card[name] else 'false') == value
+        return False
+    
+    @staticmethod
+    def _response_error(response: Union[requests.Response, BatchResponse]) -> str:
+        """
+        Build a readable error from a failed response
+        
+        Args:
+            response: Failed response
+            
+        Returns:
+            'HTTP <status>: <message>' when Trello sent a message, else 'HTTP <status>'
+        """
+        try:
+            payload = response.json()
+            message = payload.get('message') if isinstance(payload, dict) else None
+        except ValueError:
+            message = getattr(response, 'text', '') or None
+        return f'HTTP {response.status_code}: {message}' if message else f'HTTP {response.status_code}'
+    
+    def get_board_labels(self, board_id: str, fields: Fields = LABEL_FIELDS) -> list:
         """
         Get all labels for a board
         
         Args:
             board_id: Board ID
+            fields: Label fields to return, or 'all'
             
         Returns:
             List of board labels
@@ -182,9 +921,42 @@ class TrelloAPIClient:
         Raises:
             requests.RequestException: If request fails
         """
-        response = self._make_request('GET', f'boards/{board_id}/labels')
+        response = self._get(f'boards/{board_id}/labels', params=self._projection_params(fields))
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
+    
+    def get_board_actions(self, board_id: str, since: Optional[str] = None, before: Optional[str] = None,
+                          action_filter: Optional[str] = None, fields: Fields = ACTION_FIELDS,
+                          limit: int = MAX_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """
+        Get a page of board actions, newest first
+        
+        Args:
+            board_id: Board ID
+            since: Only return actions after this action ID or date
+            before: Only return actions before this action ID or date
+            action_filter: Comma-separated action types, e.g. 'createCard,updateCard'
+            fields: Action fields to return
+            limit: Actions per page (capped at 1000)
+            
+        Returns:
+            List of action dictionaries
+            
+        Raises:
+            requests.RequestException: If request fails
+        """
+        params = self._projection_params(fields)
+        params['limit'] = str(max(1, min(limit, self.MAX_PAGE_SIZE)))
+        params['memberCreator'] = 'false'
+        if since:
+            params['since'] = since
+        if before:
+            params['before'] = before
+        if action_filter:
+            params['filter'] = action_filter
+        response = self._get(f'boards/{board_id}/actions', params=params)
+        response.raise_for_status()
+        return self._decode(response)
     
     def add_label_to_card(self, card_id: str, label_id: str) -> None:
         """
@@ -199,4 +971,190 @@ class TrelloAPIClient:
         """
         data = {'value': label_id}
         response = self._make_request('POST', f'cards/{card_id}/idLabels', data=data)
-        response.raise_for_status()
\ No newline at end of file
+        response.raise_for_status()
+    
+    def add_attachment(self, card_id: str, source: AttachmentSource, name: Optional[str] = None,
+                       mime_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Upload a file to a card as a streamed multipart body
+        
+        Args:
+            card_id: Card ID
+            source: Path on disk, bytes, or an iterable yielding bytes chunks
+            name: Attachment name; defaults to the file's base name
+            mime_type: Content type; guessed from the name when omitted
+            
+        Returns:
+            Created attachment information
+            
+        Raises:
+            requests.RequestException: If request fails
+        """
+        part = FilePart('file', source, filename=name, mime_type=mime_type)
+        body = MultipartStream(fields={'name': part.filename, 'mimeType': part.mime_type}, files=[part])
+        
+        # A body streamed from a generator cannot be re-sent, so it gets no retries
+        max_retries = None if body.replayable else 0
+        response = self._make_request('POST', f'cards/{card_id}/attachments', data=body,
+                                      headers={'Content-Type': body.content_type}, max_retries=max_retries)
+        response.raise_for_status()
+        return self._decode(response)
+    
+    def add_attachments(self, card_id: str, attachments: List[Dict[str, Any]],
+                        max_workers: int = MAX_UPLOAD_WORKERS) -> List[Dict[str, Any]]:
+        """
+        Upload several attachments to a card concurrently
+        
+        Args:
+            card_id: Card ID
+            attachments: Dictionaries with a 'source' and optional 'name' and 'mime_type'
+            max_workers: Maximum concurrent uploads
+            
+        Returns:
+            One result per attachment, in order, with 'name', 'success' and either
+            'attachment' or 'error'
+        """
+        if not attachments:
+            return []
+        
+        def upload(attachment: Dict[str, Any]) -> Dict[str, Any]:
+            source = attachment['source']
+            name = attachment.get('name') or (os.path.basename(os.fspath(source))
+                                              if isinstance(source, (str, os.PathLike)) else 'attachment')
+            try:
+                created = self.add_attachment(card_id, source, name=name, mime_type=attachment.get('mime_type'))
+                return {'name': name, 'success': True, 'attachment': created}
+            except (requests.exceptions.RequestException, OSError, ValueError) as e:
+                return {'name': name, 'success': False, 'error': str(e)}
+        
+        # Run uploads in copies of the caller's context so they annotate its trace span
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(attachments)))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, upload, attachment)
+                       for attachment in attachments]
+            return [future.result() for future in futures]
+    
+    def iter_list_cards(self, list_id: str, fields: Fields = CARD_FIELDS, page_size: int = MAX_PAGE_SIZE,
+                        since: Optional[str] = None, before: Optional[str] = None,
+                        card_filter: str = 'open', prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the cards of a list one page at a time
+        
+        Args:
+            list_id: List ID
+            fields: Card fields to return; 'id' is always included for paging
+            page_size: Cards per request (capped at 1000)
+            since: Only return cards created after this card ID or date
+            before: Only return cards created before this card ID or date
+            card_filter: Trello card filter (open, closed, all)
+            prefetch: Fetch the next page in the background while the caller
+                processes the current one
+            
+        Yields:
+            Card dictionaries containing only the projected fields
+            
+        Raises:
+            requests.RequestException: If a page request fails
+        """
+        yield from self._iter_cards(f'lists/{list_id}/cards', fields, page_size, since, before,
+                                    card_filter, prefetch)
+    
+    def iter_board_cards(self, board_id: str, fields: Fields = CARD_FIELDS, page_size: int = MAX_PAGE_SIZE,
+                         since: Optional[str] = None, before: Optional[str] = None,
+                         card_filter: str = 'open', prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the cards of a board one page at a time
+        
+        Args:
+            board_id: Board ID
+            fields: Card fields to return; 'id' is always included for paging
+            page_size: Cards per request (capped at 1000)
+            since: Only return cards created after this card ID or date
+            before: Only return cards created before this card ID or date
+            card_filter: Trello card filter (open, closed, all)
+            prefetch: Fetch the next page in the background while the caller
+                processes the current one
+            
+        Yields:
+            Card dictionaries containing only the projected fields
+            
+        Raises:
+            requests.RequestException: If a page request fails
+        """
+        yield from self._iter_cards(f'boards/{board_id}/cards', fields, page_size, since, before,
+                                    card_filter, prefetch)
+    
+    def _get_card_page(self, endpoint: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Fetch a single page of cards
+        
+        Args:
+            endpoint: Card collection endpoint
+            params: Query parameters including the paging cursor
+            
+        Returns:
+            List of card dictionaries
+            
+        Raises:
+            requests.RequestException: If request fails
+        """
+        response = self._make_request('GET', endpoint, params=params)
+        response.raise_for_status()
+        return self._decode(response)
+    
+    def _iter_cards(self, endpoint: str, fields: Fields, page_size: int, since: Optional[str],
+                    before: Optional[str], card_filter: str, prefetch: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Page backwards through a card collection using Trello's before/since cursors
+        
+        At most two pages are held in memory at once: the page being yielded and,
+        when prefetching, the one being fetched.
+        
+        Args:
+            endpoint: Card collection endpoint
+            fields: Card fields to return
+            page_size: Cards per request
+            since: Lower bound cursor
+            before: Initial upper bound cursor
+            card_filter: Trello card filter
+            prefetch: Whether to fetch the next page concurrently
+            
+        Yields:
+            Card dictionaries
+        """
+        field_list = fields.split(',') if isinstance(fields, str) else list(fields or [])
+        if field_list != ['all'] and 'id' not in field_list:
+            field_list.insert(0, 'id')
+        page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        
+        base_params = self._projection_params(field_list)
+        base_params['limit'] = str(page_size)
+        base_params['filter'] = card_filter
+        if since:
+            base_params['since'] = since
+        
+        def page_params(cursor: Optional[str]) -> Dict[str, str]:
+            params = dict(base_params)
+            if cursor:
+                params['before'] = cursor
+            return params
+        
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = self._get_card_page(endpoint, page_params(before))
+            while page:
+                # Card IDs are time-ordered, so the oldest card on the page is the next cursor
+                cursor = min(card['id'] for card in page)
+                is_last = len(page) < page_size
+                pending = None
+                if executor and not is_last:
+                    pending = executor.submit(self._get_card_page, endpoint, page_params(cursor))
+                
+                for card in page:
+                    yield card
+                
+                if is_last:
+                    break
+                page = pending.result() if pending else self._get_card_page(endpoint, page_params(cursor))
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
\ No newline at end of file
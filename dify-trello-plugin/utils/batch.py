@@ -0,0 +1,296 @@
+"""
+Batch GET utilities for the Trello /1/batch endpoint
+"""
+import contextvars
+import requests
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from .fingerprint import credential_fingerprint
+
+
+class BatchResponse:
+    """
+    Response-like result of a single GET executed inside a /batch call
+    
+    Exposes the parts of requests.Response that callers rely on
+    (status_code, ok, json(), raise_for_status()) so batched results can be
+    handled exactly like direct responses.
+    """
+    
+    def __init__(self, status_code: int, payload: Any, url: str):
+        """
+        Initialize the batch response
+        
+        Args:
+            status_code: HTTP status reported by Trello for this route
+            payload: Decoded response body, or the error object on failure
+            url: Batched route this response belongs to
+        """
+        self.status_code = status_code
+        self.payload = payload
+        self.url = url
+    
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the batched route succeeded
+        """
+        return self.status_code < 400
+    
+    def json(self) -> Any:
+        """
+        Get the decoded response body
+        
+        Returns:
+            Decoded JSON payload
+        """
+        return self.payload
+    
+    def raise_for_status(self) -> None:
+        """
+        Raise an HTTPError if the batched route failed
+        
+        Raises:
+            requests.HTTPError: If the status code indicates an error
+        """
+        if not self.ok:
+            message = self.payload.get('message', '') if isinstance(self.payload, dict) else self.payload
+            raise requests.HTTPError(f'{self.status_code} Error for batched route {self.url}: {message}',
+                                     response=self)
+    
+    @classmethod
+    def from_batch_item(cls, item: Any, url: str) -> 'BatchResponse':
+        """
+        Build a response from one element of a /batch result array
+        
+        Successful routes come back as ``{"200": <body>}``; failed routes as an
+        error object carrying ``statusCode``.
+        
+        Args:
+            item: Element of the /batch response array
+            url: Route the element belongs to
+            
+        Returns:
+            BatchResponse for the route
+        """
+        if isinstance(item, dict) and len(item) == 1:
+            key = next(iter(item))
+            if key.isdigit():
+                return cls(int(key), item[key], url)
+        if isinstance(item, dict):
+            return cls(int(item.get('statusCode', 500)), item, url)
+        return cls(500, item, url)
+
+
+class BatchCall:
+    """
+    A pending GET waiting to be sent as part of a /batch request
+    """
+    
+    def __init__(self, endpoint: str, params: Optional[Dict[str, str]] = None,
+                 execute: Optional['BatchExecutor'] = None):
+        """
+        Initialize the batch call
+        
+        Args:
+            endpoint: API endpoint relative to /1/
+            params: Query parameters, without authentication
+            execute: Executor of the client that issued the call, used to send
+                the /batch request the call ends up in
+        """
+        self.endpoint = endpoint.lstrip('/')
+        self.params = params or {}
+        self.execute = execute
+        # Context of the issuing caller, so a timer flush still annotates its trace span
+        self.context = contextvars.copy_context()
+        self.future = Future()
+    
+    @property
+    def route(self) -> str:
+        """
+        Route as expected by the /batch ``urls`` parameter
+        
+        Query strings are percent-encoded so commas inside field projections
+        are not mistaken for route separators.
+        """
+        route = f'/{self.endpoint}'
+        if self.params:
+            route += '?' + urlencode(self.params)
+        return route
+
+
+BatchExecutor = Callable[[List[BatchCall]], None]
+
+
+class BatchCollector:
+    """
+    Collects independent GETs within one invocation and sends them together
+    
+    Usage:
+        with client.batch() as batch:
+            board = batch.get('boards/<id>', {'fields': 'id,name'})
+            lst = batch.get('lists/<id>', {'fields': 'id,idBoard'})
+        board.result().status_code
+    """
+    
+    def __init__(self, submit: Callable[[BatchCall], None], flush: Callable[[List[BatchCall]], None]):
+        """
+        Initialize the collector
+        
+        Args:
+            submit: Hands a single call to a shared coalescer, if one is in use
+            flush: Executes a list of calls directly when no coalescer is in use
+        """
+        self._submit = submit
+        self._flush = flush
+        self._calls: List[BatchCall] = []
+    
+    def get(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Future:
+        """
+        Queue a GET request
+        
+        Args:
+            endpoint: API endpoint relative to /1/
+            params: Query parameters, without authentication
+            
+        Returns:
+            Future resolving to a BatchResponse once the batch is sent
+        """
+        call = BatchCall(endpoint, params, self._flush)
+        self._calls.append(call)
+        return call.future
+    
+    def send(self) -> None:
+        """
+        Send every queued call and clear the queue
+        """
+        calls, self._calls = self._calls, []
+        if not calls:
+            return
+        if self._submit:
+            for call in calls:
+                self._submit(call)
+        else:
+            self._flush(calls)
+    
+    def __enter__(self) -> 'BatchCollector':
+        """
+        Start collecting calls
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Send the collected calls when the block exits
+        """
+        self.send()
+
+
+class BatchCoalescer:
+    """
+    Merges GETs issued by concurrent callers within a short window into /batch calls
+    
+    One coalescer is shared per set of credentials and window, because a
+    /batch request is authenticated with a single key and token. The coalescer
+    holds no client of its own: each /batch request is sent through the client
+    that issued its first call, so clients are not kept alive past their calls.
+    """
+    
+    _registry: Dict[Tuple[str, float, int], 'BatchCoalescer'] = {}
+    _registry_lock = threading.Lock()
+    
+    def __init__(self, window: float, max_size: int):
+        """
+        Initialize the coalescer
+        
+        Args:
+            window: Seconds to wait for more calls after the first one arrives
+            max_size: Calls per /batch request; reaching it flushes immediately
+        """
+        self.window = window
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._pending: List[BatchCall] = []
+        self._timer: Optional[threading.Timer] = None
+    
+    @classmethod
+    def for_credentials(cls, api_key: str, token: str, window: float, max_size: int) -> 'BatchCoalescer':
+        """
+        Get the shared coalescer for a set of credentials and window, creating it if needed
+        
+        Args:
+            api_key: Trello API key
+            token: Trello token
+            window: Coalescing window in seconds
+            max_size: Calls per /batch request
+            
+        Returns:
+            Shared BatchCoalescer instance
+        """
+        key = (credential_fingerprint(api_key, token), window, max_size)
+        with cls._registry_lock:
+            coalescer = cls._registry.get(key)
+            if coalescer is None:
+                coalescer = cls(window, max_size)
+                cls._registry[key] = coalescer
+            return coalescer
+    
+    def submit(self, call: BatchCall) -> Future:
+        """
+        Add a call to the current window
+        
+        Args:
+            call: Call to send; must carry the executor of the issuing client
+            
+        Returns:
+            Future resolving to the call's BatchResponse
+        """
+        ready = None
+        with self._lock:
+            self._pending.append(call)
+            if len(self._pending) >= self.max_size:
+                ready = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if ready:
+            self._dispatch(ready)
+        return call.future
+    
+    def flush(self) -> None:
+        """
+        Send everything queued in the current window
+        """
+        with self._lock:
+            ready = self._take_pending()
+        if ready:
+            self._dispatch(ready)
+    
+    def _dispatch(self, calls: List[BatchCall]) -> None:
+        """
+        Send calls in groups of up to max_size, each through the client and in
+        the context of the caller that issued the group's first call
+        
+        Args:
+            calls: Calls to send
+        """
+        for start in range(0, len(calls), self.max_size):
+            chunk = calls[start:start + self.max_size]
+            chunk[0].context.run(chunk[0].execute, chunk)
+    
+    def _take_pending(self) -> List[BatchCall]:
+        """
+        Detach the pending calls and cancel the window timer; caller holds the lock
+        
+        Returns:
+            Calls that were pending
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        ready, self._pending = self._pending, []
+        return ready
\ No newline at end of file
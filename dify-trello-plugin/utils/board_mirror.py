@@ -0,0 +1,517 @@
+"""
+Local mirror of Trello boards kept current from board action deltas
+"""
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .api_client import TrelloAPIClient
+from .fingerprint import credential_fingerprint
+
+
+class BoardMirror:
+    """
+    In-memory copy of a board's lists, labels, members and card summaries
+    
+    The mirror starts from a full snapshot and then pulls only
+    ``boards/{id}/actions?since=<cursor>`` deltas. Query methods take a
+    ``max_staleness`` in seconds and sync first only when the mirror is older
+    than that, so callers can trade freshness for API calls explicitly.
+    """
+    
+    LIST_FIELDS = 'id,name,closed,pos'
+    LABEL_FIELDS = 'id,name,color'
+    MEMBER_FIELDS = 'id,username,fullName'
+    CARD_FIELDS = 'id,name,idList,idLabels,idMembers,due,closed,pos,shortLink'
+    
+    # Action types that change mirrored state
+    ACTION_FILTER = ','.join([
+        'createCard', 'copyCard', 'convertToCardFromCheckItem', 'updateCard', 'deleteCard',
+        'moveCardToBoard', 'moveCardFromBoard', 'addLabelToCard', 'removeLabelFromCard',
+        'addMemberToCard', 'removeMemberFromCard', 'createList', 'updateList',
+        'moveListToBoard', 'moveListFromBoard', 'createLabel', 'updateLabel', 'deleteLabel',
+        'addMemberToBoard', 'removeMemberFromBoard'
+    ])
+    
+    # More pending actions than this are cheaper to replace with a fresh snapshot
+    MAX_DELTA_ACTIONS = 5000
+    
+    DEFAULT_MAX_STALENESS = 60.0
+    
+    _instances: Dict[Tuple[str, str], 'BoardMirror'] = {}
+    _instances_lock = threading.Lock()
+    
+    def __init__(self, client: TrelloAPIClient, board_id: str,
+                 max_staleness: float = DEFAULT_MAX_STALENESS):
+        """
+        Initialize an empty mirror; nothing is fetched until the first query or sync
+        
+        Args:
+            client: Trello API client used for snapshots and deltas
+            board_id: Board to mirror
+            max_staleness: Default staleness bound in seconds for queries
+        """
+        self.client = client
+        self.board_id = board_id
+        self.max_staleness = max_staleness
+        self._lock = threading.RLock()
+        self._board: Dict[str, Any] = {}
+        self._lists: Dict[str, Dict[str, Any]] = {}
+        self._labels: Dict[str, Dict[str, Any]] = {}
+        self._members: Dict[str, Dict[str, Any]] = {}
+        self._cards: Dict[str, Dict[str, Any]] = {}
+        # Cards first seen in an updateCard action, whose labels and members are unknown
+        self._incomplete: Set[str] = set()
+        self._cursor: Optional[str] = None
+        self._synced_at: Optional[float] = None
+        self.stats = {'snapshots': 0, 'delta_syncs': 0, 'actions_applied': 0}
+    
+    @classmethod
+    def shared(cls, client: TrelloAPIClient, board_id: str,
+               max_staleness: float = DEFAULT_MAX_STALENESS) -> 'BoardMirror':
+        """
+        Get the process-wide mirror of a board for the client's credentials
+        
+        Args:
+            client: Trello API client
+            board_id: Board to mirror
+            max_staleness: Default staleness bound used if a new mirror is created
+            
+        Returns:
+            Shared BoardMirror instance
+        """
+        key = (credential_fingerprint(client.api_key, client.token), board_id)
+        with cls._instances_lock:
+            mirror = cls._instances.get(key)
+            if mirror is None:
+                mirror = cls(client, board_id, max_staleness)
+                cls._instances[key] = mirror
+            return mirror
+    
+    @property
+    def age(self) -> Optional[float]:
+        """
+        Seconds since the last successful sync, or None if never synced
+        """
+        return None if self._synced_at is None else time.monotonic() - self._synced_at
+    
+    def ensure_fresh(self, max_staleness: Optional[float] = None) -> None:
+        """
+        Sync if the mirror is older than the staleness bound
+        
+        Args:
+            max_staleness: Staleness bound in seconds; defaults to the mirror's
+            
+        Raises:
+            requests.RequestException: If a sync request fails
+        """
+        bound = self.max_staleness if max_staleness is None else max_staleness
+        age = self.age
+        if age is not None and age <= bound:
+            return
+        with self._lock:
+            age = self.age
+            if age is None or age > bound:
+                self.sync()
+    
+    def sync(self, full: bool = False) -> None:
+        """
+        Bring the mirror up to date
+        
+        Args:
+            full: Force a full snapshot instead of a delta sync
+            
+        Raises:
+            requests.RequestException: If a sync request fails
+        """
+        with self._lock:
+            if full or self._synced_at is None:
+                self._load_snapshot()
+            else:
+                self._sync_deltas()
+    
+    def _load_snapshot(self) -> None:
+        """
+        Replace the mirror contents with a full snapshot of the board
+        """
+        # Take the cursor before reading state, so actions racing the snapshot
+        # are replayed by the next delta sync rather than lost
+        latest = self.client.get_board_actions(self.board_id, fields='id', limit=1)
+        cursor = latest[0]['id'] if latest else datetime.now(timezone.utc).isoformat()
+        
+        board = self.client.get_board(
+            self.board_id,
+            fields='id,name,url,closed',
+            lists='all', list_fields=self.LIST_FIELDS,
+            labels='all', label_fields=self.LABEL_FIELDS, labels_limit='1000',
+            members='all', member_fields=self.MEMBER_FIELDS
+        )
+        cards = {
+            card['id']: self._card_summary(card)
+            for card in self.client.iter_board_cards(self.board_id, fields=self.CARD_FIELDS,
+                                                     card_filter='open', prefetch=True)
+        }
+        
+        self._board = {key: board.get(key) for key in ('id', 'name', 'url', 'closed')}
+        self._lists = {item['id']: dict(item) for item in board.get('lists', [])}
+        self._labels = {item['id']: dict(item) for item in board.get('labels', [])}
+        self._members = {item['id']: dict(item) for item in board.get('members', [])}
+        self._cards = cards
+        self._incomplete = set()
+        self._cursor = cursor
+        self._synced_at = time.monotonic()
+        self.stats['snapshots'] += 1
+    
+    def _sync_deltas(self) -> None:
+        """
+        Apply the board actions recorded since the cursor, oldest first
+        """
+        pending: List[Dict[str, Any]] = []
+        before = None
+        while True:
+            page = self.client.get_board_actions(self.board_id, since=self._cursor, before=before,
+                                                 action_filter=self.ACTION_FILTER)
+            pending.extend(page)
+            if len(pending) > self.MAX_DELTA_ACTIONS:
+                self._load_snapshot()
+                return
+            if len(page) < TrelloAPIClient.MAX_PAGE_SIZE:
+                break
+            before = page[-1]['id']
+        
+        for action in reversed(pending):
+            self._apply_action(action)
+        if pending:
+            self._cursor = pending[0]['id']
+        self._complete_cards()
+        self._synced_at = time.monotonic()
+        self.stats['delta_syncs'] += 1
+        self.stats['actions_applied'] += len(pending)
+    
+    def _apply_action(self, action: Dict[str, Any]) -> None:
+        """
+        Apply a single board action to the mirrored state
+        
+        Args:
+            action: Trello action with type and data
+        """
+        action_type = action.get('type')
+        data = action.get('data') or {}
+        card_data = data.get('card') or {}
+        card_id = card_data.get('id')
+        
+        if action_type in ('createCard', 'copyCard', 'convertToCardFromCheckItem', 'moveCardToBoard'):
+            list_id = (data.get('list') or {}).get('id') or card_data.get('idList')
+            card = self._cards.setdefault(card_id, self._card_summary({'id': card_id}))
+            card.update({key: value for key, value in card_data.items() if key in card})
+            if list_id:
+                card['idList'] = list_id
+        elif action_type == 'updateCard' and card_id:
+            card = self._cards.get(card_id)
+            if card is None:
+                # Not in the snapshot, e.g. unarchived since; the rest is fetched after the sync
+                card = self._cards[card_id] = self._card_summary(card_data)
+                self._incomplete.add(card_id)
+            for key in (data.get('old') or {}):
+                if key in card_data:
+                    card[key] = card_data[key]
+            if 'name' in card_data:
+                card['name'] = card_data['name']
+            # Moves carry listAfter; other updates name the card's current list
+            list_id = (data.get('listAfter') or data.get('list') or {}).get('id') or card_data.get('idList')
+            if list_id:
+                card['idList'] = list_id
+        elif action_type in ('deleteCard', 'moveCardFromBoard') and card_id:
+            self._cards.pop(card_id, None)
+            self._incomplete.discard(card_id)
+        elif action_type in ('addLabelToCard', 'removeLabelFromCard') and card_id in self._cards:
+            label_id = (data.get('label') or {}).get('id')
+            self._toggle(self._cards[card_id]['idLabels'], label_id, action_type == 'addLabelToCard')
+        elif action_type in ('addMemberToCard', 'removeMemberFromCard') and card_id in self._cards:
+            member_id = data.get('idMember') or (data.get('member') or {}).get('id')
+            self._toggle(self._cards[card_id]['idMembers'], member_id, action_type == 'addMemberToCard')
+        elif action_type in ('createList', 'updateList', 'moveListToBoard'):
+            list_data = data.get('list') or {}
+            if list_data.get('id'):
+                entry = self._lists.setdefault(list_data['id'], {'id': list_data['id'], 'closed': False})
+                entry.update({key: value for key, value in list_data.items() if key in ('name', 'closed', 'pos')})
+        elif action_type == 'moveListFromBoard':
+            self._lists.pop((data.get('list') or {}).get('id'), None)
+        elif action_type in ('createLabel', 'updateLabel'):
+            label_data = data.get('label') or {}
+            if label_data.get('id'):
+                entry = self._labels.setdefault(label_data['id'], {'id': label_data['id']})
+                entry.update({key: value for key, value in label_data.items() if key in ('name', 'color')})
+        elif action_type == 'deleteLabel':
+            label_id = (data.get('label') or {}).get('id')
+            self._labels.pop(label_id, None)
+            for card in self._cards.values():
+                self._toggle(card['idLabels'], label_id, False)
+        elif action_type == 'addMemberToBoard':
+            member = data.get('member') or action.get('member') or {}
+            member_id = data.get('idMember') or member.get('id')
+            if member_id:
+                self._members.setdefault(member_id, {'id': member_id, **{
+                    key: member.get(key) for key in ('username', 'fullName') if member.get(key)
+                }})
+        elif action_type == 'removeMemberFromBoard':
+            self._members.pop(data.get('idMember') or (data.get('member') or {}).get('id'), None)
+    
+    def _complete_cards(self) -> None:
+        """
+        Replace summaries built from updateCard actions with the cards themselves
+        
+        Cards that fail to load for a reason other than 404 are retried on the
+        next sync.
+        """
+        if not self._incomplete:
+            return
+        responses = self.client.get_cards(sorted(self._incomplete), fields=self.CARD_FIELDS)
+        for card_id, response in responses.items():
+            if response.ok:
+                self._cards[card_id] = self._card_summary(response.json())
+            elif response.status_code == 404:
+                self._cards.pop(card_id, None)
+            else:
+                continue
+            self._incomplete.discard(card_id)
+    
+    @staticmethod
+    def _toggle(values: List[str], value: Optional[str], present: bool) -> None:
+        """
+        Add or remove a value from an ID list in place
+        
+        Args:
+            values: ID list to modify
+            value: ID to add or remove
+            present: True to add, False to remove
+        """
+        if not value:
+            return
+        if present and value not in values:
+            values.append(value)
+        elif not present and value in values:
+            values.remove(value)
+    
+    @staticmethod
+    def _card_summary(card: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce a card to the fields the mirror keeps
+        
+        Args:
+            card: Card dictionary from the API or an action
+            
+        Returns:
+            Compact card summary
+        """
+        return {
+            'id': card['id'],
+            'name': card.get('name', ''),
+            'idList': card.get('idList'),
+            'idLabels': list(card.get('idLabels') or []),
+            'idMembers': list(card.get('idMembers') or []),
+            'due': card.get('due'),
+            'closed': bool(card.get('closed', False)),
+            'pos': card.get('pos'),
+            'shortLink': card.get('shortLink')
+        }
+    
+    def get_board(self, max_staleness: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get board information, as TrelloAPIClient.get_board would
+        
+        Args:
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Board information dictionary
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            return dict(self._board)
+    
+    def get_list(self, list_id: str, max_staleness: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get list information, as TrelloAPIClient.get_list would
+        
+        Args:
+            list_id: List ID
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            List information dictionary including idBoard, or None if unknown
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            item = self._lists.get(list_id)
+            return dict(item, idBoard=self.board_id) if item else None
+    
+    def get_lists(self, include_closed: bool = False, max_staleness: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get the board's lists in board order
+        
+        Args:
+            include_closed: Include archived lists
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            List dictionaries
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            lists = [dict(item) for item in self._lists.values() if include_closed or not item.get('closed')]
+        return sorted(lists, key=lambda item: item.get('pos') or 0)
+    
+    def get_board_labels(self, max_staleness: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get the board's labels, as TrelloAPIClient.get_board_labels would
+        
+        Args:
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Label dictionaries
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            return [dict(label) for label in self._labels.values()]
+    
+    def get_members(self, max_staleness: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get the board's members
+        
+        Args:
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Member dictionaries
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            return [dict(member) for member in self._members.values()]
+    
+    def find_label(self, name: str, max_staleness: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a label by case-insensitive name
+        
+        Args:
+            name: Label name
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Label dictionary, or None
+        """
+        wanted = name.strip().lower()
+        for label in self.get_board_labels(max_staleness):
+            if (label.get('name') or '').lower() == wanted:
+                return label
+        return None
+    
+    def find_member(self, username: str, max_staleness: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a member by username, with or without a leading '@'
+        
+        Args:
+            username: Member username
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Member dictionary, or None
+        """
+        wanted = username.strip().lstrip('@').lower()
+        for member in self.get_members(max_staleness):
+            if (member.get('username') or '').lower() == wanted:
+                return member
+        return None
+    
+    def get_card(self, card_id: str, max_staleness: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a card summary
+        
+        Args:
+            card_id: Card ID
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Card summary dictionary, or None if not on the board
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            card = self._cards.get(card_id)
+            return self._copy_card(card) if card else None
+    
+    def get_cards(self, list_id: Optional[str] = None, include_closed: bool = False,
+                  max_staleness: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get card summaries, optionally for a single list
+        
+        Args:
+            list_id: Restrict to this list
+            include_closed: Include archived cards
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Card summary dictionaries
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            return [
+                self._copy_card(card) for card in self._cards.values()
+                if (list_id is None or card['idList'] == list_id) and (include_closed or not card['closed'])
+            ]
+    
+    def list_counts(self, max_staleness: Optional[float] = None) -> Dict[str, int]:
+        """
+        Count open cards per open list
+        
+        Args:
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Mapping of list ID to open card count
+        """
+        self.ensure_fresh(max_staleness)
+        with self._lock:
+            counts = {list_id: 0 for list_id, item in self._lists.items() if not item.get('closed')}
+            for card in self._cards.values():
+                if not card['closed'] and card['idList'] in counts:
+                    counts[card['idList']] += 1
+            return counts
+    
+    def find_cards_by_name(self, name: str, list_id: Optional[str] = None,
+                           max_staleness: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Find open cards whose name matches, ignoring case and surrounding whitespace
+        
+        Useful for duplicate checks before creating a card.
+        
+        Args:
+            name: Card name
+            list_id: Restrict to this list
+            max_staleness: Staleness bound in seconds
+            
+        Returns:
+            Matching card summaries
+        """
+        wanted = ' '.join(name.split()).lower()
+        return [
+            card for card in self.get_cards(list_id, max_staleness=max_staleness)
+            if ' '.join((card['name'] or '').split()).lower() == wanted
+        ]
+    
+    @staticmethod
+    def _copy_card(card: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a card summary so callers cannot mutate mirror state
+        
+        Args:
+            card: Card summary
+            
+        Returns:
+            Independent copy
+        """
+        copy = dict(card)
+        copy['idLabels'] = list(card['idLabels'])
+        copy['idMembers'] = list(card['idMembers'])
+        return copy
\ No newline at end of file
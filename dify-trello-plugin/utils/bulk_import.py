@@ -0,0 +1,673 @@
+"""
+Streaming bulk import of cards from CSV or JSONL files
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import requests
+
+from .api_client import TrelloAPIClient
+from .board_mirror import BoardMirror
+from .circuit_breaker import CircuitOpenError
+from .validators import TrelloValidator
+
+# (row number, payload, error) flowing through the import pipeline
+PipelineItem = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+SUPPORTED_FORMATS = ('csv', 'jsonl')
+
+# Accepted source column names for each card field
+COLUMN_ALIASES = {
+    'card_title': ('card_title', 'title', 'name'),
+    'card_description': ('card_description', 'description', 'desc'),
+    'list': ('list_id', 'list', 'list_name'),
+    'labels': ('labels', 'label_names'),
+    'due_date': ('due_date', 'due'),
+    'assignee': ('assignee_id', 'assignee', 'member', 'username')
+}
+
+
+def detect_format(path: str) -> str:
+    """
+    Infer the source format from a file extension
+    
+    Args:
+        path: Source file path
+        
+    Returns:
+        'csv' or 'jsonl'
+        
+    Raises:
+        ValueError: If the extension is not recognized
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.csv', '.tsv'):
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    raise ValueError(f"Cannot infer format of '{path}'; use one of: {', '.join(SUPPORTED_FORMATS)}")
+
+
+def iter_rows(path: str, fmt: Optional[str] = None) -> Iterator[PipelineItem]:
+    """
+    Stream records from a CSV or JSONL file one at a time
+    
+    Rows are numbered from 1 in file order, so numbering is stable across runs
+    over the same file.
+    
+    Args:
+        path: Source file path
+        fmt: 'csv' or 'jsonl'; inferred from the extension when omitted
+        
+    Yields:
+        (row number, record, error) with exactly one of record and error set
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported format '{fmt}'; use one of: {', '.join(SUPPORTED_FORMATS)}")
+    
+    with open(path, newline='' if fmt == 'csv' else None, encoding='utf-8-sig') as f:
+        if fmt == 'csv':
+            dialect = 'excel-tab' if path.lower().endswith('.tsv') else 'excel'
+            for row_number, record in enumerate(csv.DictReader(f, dialect=dialect), start=1):
+                yield row_number, record, None
+            return
+        
+        row_number = 0
+        for line in f:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield row_number, None, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield row_number, None, "Each JSONL line must be an object"
+                continue
+            yield row_number, record, None
+
+
+class ImportCheckpoint:
+    """
+    Durable progress of an import, small enough to rewrite often
+    
+    ``watermark`` is the highest row number such that every row up to it is
+    finished or deferred; ``done`` holds finished rows above it and
+    ``deferred`` the rows whose creation failed transiently. Before a row is
+    sent, the checkpoint is saved with ``reserved_through`` at or beyond it,
+    so on resume every unfinished row up to ``reserved_through`` may already
+    exist in Trello and is reconciled before being created again.
+    ``sent_since`` is when the oldest of those rows could first have been
+    sent; cards created before it cannot belong to them.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, path: str, source: str, board_id: str):
+        """
+        Load the checkpoint at path, or start a new one
+        
+        Args:
+            path: Checkpoint file path
+            source: Absolute source file path the checkpoint belongs to
+            board_id: Target board ID
+            
+        Raises:
+            ValueError: If an existing checkpoint belongs to another source or board
+        """
+        self.path = path
+        self.source = source
+        self.board_id = board_id
+        self.watermark = 0
+        self.reserved_through = 0
+        self.sent_since: Optional[float] = None
+        self.done: Set[int] = set()
+        self.deferred: Set[int] = set()
+        self.stats: Dict[str, int] = {'created': 0, 'reconciled': 0, 'failed': 0}
+        
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('source') != source or state.get('board_id') != board_id:
+                raise ValueError(f"Checkpoint {path} belongs to {state.get('source')} "
+                                 f"on board {state.get('board_id')}")
+            self.watermark = state['watermark']
+            self.reserved_through = state['reserved_through']
+            self.sent_since = state.get('sent_since')
+            self.done = set(state['done'])
+            self.deferred = set(state.get('deferred', []))
+            self.stats.update(state.get('stats', {}))
+        
+        # Rows that may have been sent by an interrupted run
+        self.pending = self.deferred | {
+            row for row in range(self.watermark + 1, self.reserved_through + 1) if row not in self.done
+        }
+    
+    def is_done(self, row: int) -> bool:
+        """
+        Check whether a row was already finished
+        
+        Args:
+            row: Row number
+            
+        Returns:
+            True if the row needs no further work
+        """
+        return row not in self.deferred and (row <= self.watermark or row in self.done)
+    
+    def finish(self, row: int, outcome: str) -> None:
+        """
+        Mark a row finished and advance the watermark
+        
+        Args:
+            row: Row number
+            outcome: 'created', 'reconciled' or 'failed'
+        """
+        self.stats[outcome] = self.stats.get(outcome, 0) + 1
+        self.deferred.discard(row)
+        self._settle(row)
+    
+    def defer(self, row: int) -> None:
+        """
+        Set a row aside for the next run after a transient failure
+        
+        Deferred rows do not hold back the watermark, so one bad stretch of
+        network does not make the checkpoint grow with every later row.
+        
+        Args:
+            row: Row number
+        """
+        self.deferred.add(row)
+        self._settle(row)
+    
+    def _settle(self, row: int) -> None:
+        """
+        Stop tracking a row as in progress and advance the watermark
+        
+        Args:
+            row: Row number
+        """
+        self.pending.discard(row)
+        if row > self.watermark:
+            self.done.add(row)
+        while self.watermark + 1 in self.done:
+            self.watermark += 1
+            self.done.discard(self.watermark)
+    
+    def save(self) -> None:
+        """
+        Atomically write the checkpoint to disk
+        """
+        state = {
+            'version': self.VERSION,
+            'source': self.source,
+            'board_id': self.board_id,
+            'watermark': self.watermark,
+            'reserved_through': self.reserved_through,
+            'sent_since': self.sent_since,
+            'done': sorted(self.done),
+            'deferred': sorted(self.deferred),
+            'stats': self.stats
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+
+class BulkImporter:
+    """
+    Creates cards from a row stream with bounded memory and concurrency
+    
+    Rows flow through generator stages (parse, resolve names, validate,
+    resolve labels) and are created by a thread pool with a bounded number of
+    rows in flight. Lists, labels and members are resolved from a
+    ``BoardMirror`` instead of per-row API calls, and every request draws
+    from the client's shared rate limiter.
+    """
+    
+    DEFAULT_WORKERS = 8
+    
+    # Rows reserved in the checkpoint ahead of submission, trading a few
+    # extra reconciliation lookups on resume for fewer checkpoint writes
+    RESERVATION_SIZE = 50
+    
+    CHECKPOINT_INTERVAL = 2.0  # seconds
+    
+    # Allowed difference between the local clock and Trello's when comparing
+    # card creation times against the checkpoint
+    CLOCK_SKEW = 300.0  # seconds
+    
+    def __init__(self, client: TrelloAPIClient, board_id: str, checkpoint_path: str,
+                 max_workers: int = DEFAULT_WORKERS, mirror_staleness: float = 300.0,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the importer
+        
+        Args:
+            client: Trello API client
+            board_id: Board to import into
+            checkpoint_path: File recording progress for resume
+            max_workers: Concurrent card creations
+            mirror_staleness: Staleness bound in seconds for board lookups
+            progress: Called with a progress report whenever the checkpoint is saved
+        """
+        self.client = client
+        self.board_id = board_id
+        self.checkpoint_path = checkpoint_path
+        self.errors_path = f'{checkpoint_path}.errors.jsonl'
+        self.max_workers = max(1, max_workers)
+        self.mirror_staleness = mirror_staleness
+        self.progress = progress
+        self.mirror = BoardMirror.shared(client, board_id, mirror_staleness)
+    
+    def run(self, path: str, fmt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Import every row of a source file, resuming from its checkpoint
+        
+        Rows that fail validation or are rejected by Trello are logged to the
+        errors file and not retried. Rows hit by transient failures are
+        deferred and retried, after reconciliation, on the next run. If the
+        board cannot be read, the run stops early with a saved checkpoint and
+        the reason in the report's 'aborted' entry.
+        
+        Args:
+            path: CSV or JSONL source file
+            fmt: 'csv' or 'jsonl'; inferred from the extension when omitted
+            
+        Returns:
+            Report with row counts, elapsed time and throughput
+        """
+        checkpoint = ImportCheckpoint(self.checkpoint_path, os.path.abspath(path), self.board_id)
+        self._checkpoint = checkpoint
+        self._started = time.monotonic()
+        self._last_save = self._started
+        self._counts = {'rows_read': 0, 'skipped': 0, 'created': 0, 'reconciled': 0, 'failed': 0,
+                        'deferred': 0, 'missing_labels': 0}
+        self._aborted: Optional[str] = None
+        # Cards that must not reconcile a pending row: ones already matched to
+        # a row, and ones this run created near its first creation (see _note_created)
+        self._claimed: Set[str] = set()
+        self._first_created: Optional[int] = None
+        if not checkpoint.pending:
+            checkpoint.sent_since = None
+        
+        items = self._resolve_labels(self._validate(self._resolve_names(self._parse(iter_rows(path, fmt)))))
+        in_flight: Dict[Future, int] = {}
+        with open(self.errors_path, 'a', encoding='utf-8') as errors, \
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='trello-import') as executor:
+            self._errors = errors
+            try:
+                for row, fields, error in items:
+                    if self._aborted:
+                        break
+                    if error:
+                        self._fail(row, error)
+                        self._maybe_save()
+                        continue
+                    card = None
+                    if row in checkpoint.pending:
+                        # Earlier creations must be noted before matching against the board
+                        self._collect(in_flight, list(in_flight))
+                        card = self._find_created(fields)
+                    if card is not None:
+                        self._reconcile(row, card)
+                    else:
+                        if row > checkpoint.reserved_through:
+                            if checkpoint.sent_since is None:
+                                checkpoint.sent_since = time.time()
+                            checkpoint.reserved_through = row + self.RESERVATION_SIZE
+                            checkpoint.save()
+                        in_flight[executor.submit(self._create, fields)] = row
+                        # Bound memory: never hold more than a few rows per worker
+                        while len(in_flight) >= self.max_workers * 2:
+                            self._collect(in_flight, wait(in_flight, return_when=FIRST_COMPLETED).done)
+                    self._maybe_save()
+            except requests.exceptions.RequestException as e:
+                # Board lookups failed (including an open circuit breaker); the
+                # current row is not finished, so the next run picks it up again
+                self._aborted = f"Board lookup failed: {e}"
+            while in_flight:
+                self._collect(in_flight, wait(in_flight, return_when=FIRST_COMPLETED).done)
+        
+        checkpoint.save()
+        report = self._report()
+        if self.progress:
+            self.progress(report)
+        return report
+    
+    def _parse(self, rows: Iterable[PipelineItem]) -> Iterator[PipelineItem]:
+        """
+        Skip finished rows and map source columns to card fields
+        
+        Args:
+            rows: Output of iter_rows
+            
+        Yields:
+            Pipeline items with card fields keyed as in COLUMN_ALIASES
+        """
+        for row, record, error in rows:
+            self._counts['rows_read'] += 1
+            if self._checkpoint.is_done(row):
+                self._counts['skipped'] += 1
+                continue
+            if error:
+                yield row, None, error
+                continue
+            fields = {}
+            for field, aliases in COLUMN_ALIASES.items():
+                value = next((record[alias] for alias in aliases if record.get(alias) not in (None, '')), '')
+                if isinstance(value, list):
+                    value = ','.join(str(item) for item in value)
+                fields[field] = value if isinstance(value, str) else str(value)
+            yield row, fields, None
+    
+    def _resolve_names(self, items: Iterable[PipelineItem]) -> Iterator[PipelineItem]:
+        """
+        Turn list names and member usernames into IDs using the board mirror
+        
+        Args:
+            items: Parsed pipeline items
+            
+        Yields:
+            Pipeline items with list_id and assignee_id set
+        """
+        for row, fields, error in items:
+            if error:
+                yield row, fields, error
+                continue
+            
+            list_value = fields.pop('list').strip()
+            if TrelloValidator.TRELLO_ID_PATTERN.match(list_value):
+                board_list = self.mirror.get_list(list_value, self.mirror_staleness)
+            else:
+                board_list = next((item for item in self.mirror.get_lists(max_staleness=self.mirror_staleness)
+                                   if item['name'].strip().lower() == list_value.lower()), None)
+            if not list_value or board_list is None:
+                yield row, None, f"List not found on board: {list_value or '(empty)'}"
+                continue
+            fields['list_id'] = board_list['id']
+            
+            assignee = fields.pop('assignee').strip()
+            if assignee and not TrelloValidator.TRELLO_ID_PATTERN.match(assignee):
+                member = self.mirror.find_member(assignee, self.mirror_staleness)
+                if member is None:
+                    yield row, None, f"Member not found on board: {assignee}"
+                    continue
+                assignee = member['id']
+            fields['assignee_id'] = assignee
+            yield row, fields, None
+    
+    def _validate(self, items: Iterable[PipelineItem]) -> Iterator[PipelineItem]:
+        """
+        Sanitize and validate card fields
+        
+        Args:
+            items: Pipeline items with resolved IDs
+            
+        Yields:
+            Pipeline items holding TrelloValidator.validate_card_fields output
+        """
+        for row, fields, error in items:
+            if error:
+                yield row, fields, error
+                continue
+            validated, _, validation_error = TrelloValidator.validate_card_fields(
+                card_title=fields['card_title'],
+                card_description=fields['card_description'],
+                board_id=self.board_id,
+                list_id=fields['list_id'],
+                labels=fields['labels'],
+                due_date=fields['due_date'],
+                assignee_id=fields['assignee_id']
+            )
+            yield row, validated, validation_error
+    
+    def _resolve_labels(self, items: Iterable[PipelineItem]) -> Iterator[PipelineItem]:
+        """
+        Turn label names into board label IDs; unknown labels are dropped
+        
+        Args:
+            items: Validated pipeline items
+            
+        Yields:
+            Pipeline items with a label_ids list
+        """
+        for row, fields, error in items:
+            if error:
+                yield row, fields, error
+                continue
+            label_ids = []
+            for name in fields['labels']:
+                label = self.mirror.find_label(name, self.mirror_staleness)
+                if label is None:
+                    self._counts['missing_labels'] += 1
+                else:
+                    label_ids.append(label['id'])
+            fields['label_ids'] = label_ids
+            yield row, fields, None
+    
+    def _find_created(self, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Find a card an interrupted run may have created for a pending row
+        
+        A card matches if it is open in the row's list with the same title,
+        labels and members, was created no earlier than the checkpoint's
+        ``sent_since``, was not created by this run, and has not been matched
+        to another row. Rows with a repeated title therefore only reconcile as
+        many cards as exist, and cards that predate the import are never
+        matched.
+        
+        Args:
+            fields: Validated card fields
+            
+        Returns:
+            Matching card summary, or None if the row still needs creating
+        """
+        created_after = (self._checkpoint.sent_since or 0) - self.CLOCK_SKEW
+        label_ids = set(fields['label_ids'])
+        member_ids = {fields['assignee_id']} if fields['assignee_id'] else set()
+        for card in self.mirror.find_cards_by_name(fields['title'], fields['list_id'], self.mirror_staleness):
+            # The first 8 hex digits of a Trello ID are its creation time in Unix seconds
+            created = int(card['id'][:8], 16)
+            if card['id'] in self._claimed or created < created_after:
+                continue
+            if self._first_created is not None and created > self._first_created + self.CLOCK_SKEW:
+                # Created well after this run's first card, so by this run
+                continue
+            if set(card['idLabels']) == label_ids and set(card['idMembers']) == member_ids:
+                return card
+        return None
+    
+    def _reconcile(self, row: int, card: Dict[str, Any]) -> None:
+        """
+        Finish a row as already created and log the card it was matched to
+        
+        Args:
+            row: Row number
+            card: Matched card summary
+        """
+        self._claimed.add(card['id'])
+        self._errors.write(json.dumps({'row': row, 'reconciled_card': card['id']}) + '\n')
+        self._checkpoint.finish(row, 'reconciled')
+        self._counts['reconciled'] += 1
+    
+    def _create(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create one card; runs on a worker thread
+        
+        Args:
+            fields: Validated card fields
+            
+        Returns:
+            Created card information
+        """
+        # The client only resends a card POST that never reached Trello, so
+        # its retries cannot create a second card for the row
+        return self.client.create_card(
+            list_id=fields['list_id'],
+            name=fields['title'],
+            desc=fields['description'],
+            due=fields['due_date'] or None,
+            id_members=fields['assignee_id'] or None,
+            id_labels=','.join(fields['label_ids']) or None
+        )
+    
+    def _collect(self, in_flight: Dict[Future, int], done: Iterable[Future]) -> None:
+        """
+        Record the outcome of completed creations
+        
+        Args:
+            in_flight: Outstanding futures by row number; completed ones are removed
+            done: Completed futures
+        """
+        for future in done:
+            row = in_flight.pop(future)
+            try:
+                card = future.result()
+            except CircuitOpenError as e:
+                self._defer(row)
+                self._aborted = str(e)
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and 400 <= status < 500 and status != 429:
+                    self._fail(row, f"Trello rejected the card: HTTP {status}")
+                else:
+                    self._defer(row)
+            except requests.exceptions.RequestException:
+                self._defer(row)
+            else:
+                self._note_created(card['id'])
+                self._checkpoint.finish(row, 'created')
+                self._counts['created'] += 1
+    
+    def _note_created(self, card_id: str) -> None:
+        """
+        Keep a card created by this run from reconciling a pending row
+        
+        Cards created more than CLOCK_SKEW after this run's first card are
+        recognized by their ID timestamp in _find_created, so only those
+        created around the start of the run are remembered, and nothing is
+        once no pending rows are left. Memory stays bounded however many rows
+        the import has.
+        
+        Args:
+            card_id: ID of the created card
+        """
+        if not self._checkpoint.pending:
+            self._claimed.clear()
+            return
+        created = int(card_id[:8], 16)
+        if self._first_created is None or created < self._first_created:
+            self._first_created = created
+        if created <= self._first_created + self.CLOCK_SKEW:
+            self._claimed.add(card_id)
+    
+    def _fail(self, row: int, error: str) -> None:
+        """
+        Finish a row as failed and log the reason
+        
+        Args:
+            row: Row number
+            error: Failure reason
+        """
+        self._errors.write(json.dumps({'row': row, 'error': error}, ensure_ascii=False) + '\n')
+        self._checkpoint.finish(row, 'failed')
+        self._counts['failed'] += 1
+    
+    def _defer(self, row: int) -> None:
+        """
+        Defer a row so the next run reconciles and retries it
+        
+        Args:
+            row: Row number
+        """
+        self._checkpoint.defer(row)
+        self._counts['deferred'] += 1
+    
+    def _maybe_save(self) -> None:
+        """
+        Save the checkpoint and report progress if the interval has elapsed
+        """
+        now = time.monotonic()
+        if now - self._last_save < self.CHECKPOINT_INTERVAL:
+            return
+        self._last_save = now
+        self._checkpoint.save()
+        self._errors.flush()
+        if self.progress:
+            self.progress(self._report())
+    
+    def _report(self) -> Dict[str, Any]:
+        """
+        Build a progress report for this run
+        
+        Returns:
+            Row counts, elapsed seconds, cards per second and limiter wait time
+        """
+        elapsed = time.monotonic() - self._started
+        report = dict(self._counts)
+        report['elapsed_seconds'] = round(elapsed, 3)
+        report['cards_per_second'] = round(self._counts['created'] / elapsed, 2) if elapsed else 0.0
+        report['rows_per_second'] = round(self._counts['rows_read'] / elapsed, 2) if elapsed else 0.0
+        report['rate_limit_wait_seconds'] = round(self.client.get_metrics().get('rate_limit_wait_seconds', 0.0), 3)
+        report['watermark'] = self._checkpoint.watermark
+        report['errors_file'] = self.errors_path
+        if self._aborted:
+            report['aborted'] = self._aborted
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point: python -m utils.bulk_import FILE --board BOARD_ID
+    
+    Credentials are read from TRELLO_API_KEY and TRELLO_TOKEN.
+    
+    Args:
+        argv: Command-line arguments
+        
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description='Bulk import Trello cards from CSV or JSONL')
+    parser.add_argument('file', help='CSV or JSONL source file')
+    parser.add_argument('--board', required=True, help='Target board ID')
+    parser.add_argument('--format', choices=SUPPORTED_FORMATS, help='Source format (default: from extension)')
+    parser.add_argument('--checkpoint', help='Checkpoint file (default: FILE.checkpoint.json)')
+    parser.add_argument('--workers', type=int, default=BulkImporter.DEFAULT_WORKERS,
+                        help='Concurrent card creations')
+    args = parser.parse_args(argv)
+    
+    api_key = os.getenv('TRELLO_API_KEY')
+    token = os.getenv('TRELLO_TOKEN')
+    if not api_key or not token:
+        print('Error: TRELLO_API_KEY and TRELLO_TOKEN must be set', file=sys.stderr)
+        return 2
+    
+    def print_progress(report: Dict[str, Any]) -> None:
+        print(f"rows {report['rows_read']} | created {report['created']} | reconciled {report['reconciled']} | "
+              f"failed {report['failed']} | {report['cards_per_second']} cards/s", file=sys.stderr)
+    
+    importer = BulkImporter(TrelloAPIClient(api_key, token), args.board,
+                            args.checkpoint or f'{args.file}.checkpoint.json',
+                            max_workers=args.workers, progress=print_progress)
+    report = importer.run(args.file, args.format)
+    print(json.dumps(report, indent=2))
+    return 1 if report.get('aborted') or report['deferred'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Durable local index mapping external keys to Trello cards
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .data_dir import default_data_dir
+
+
+def content_hash(fields: Dict[str, Any]) -> str:
+    """
+    Hash card fields independently of key order
+    
+    Args:
+        fields: Card fields
+        
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(fields, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class CardIndex:
+    """
+    SQLite-backed index of external key -> card id and last written fields
+    
+    Lookups are primary-key reads, so they are O(1) with respect to the size
+    of the board and never touch the Trello API. Entries are keyed by board
+    rather than by credentials, so regenerating a Trello token keeps them.
+    """
+    
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS card_index (
+            board_id TEXT NOT NULL,
+            external_key TEXT NOT NULL,
+            card_id TEXT NOT NULL,
+            card_url TEXT NOT NULL DEFAULT '',
+            fields TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (board_id, external_key)
+        )
+    '''
+    
+    _instances: Dict[str, 'CardIndex'] = {}
+    _instances_lock = threading.Lock()
+    
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the index database
+        
+        Args:
+            path: SQLite database file path, or ':memory:'
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], List[Any]] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(self.SCHEMA)
+    
+    @classmethod
+    def shared(cls, path: Optional[str] = None) -> 'CardIndex':
+        """
+        Get the process-wide index for a path, opening it on first use
+        
+        Args:
+            path: Database path; defaults to card_index.sqlite3 in the data directory
+            
+        Returns:
+            Shared CardIndex instance
+        """
+        path = path or os.path.join(default_data_dir(), 'card_index.sqlite3')
+        with cls._instances_lock:
+            index = cls._instances.get(path)
+            if index is None:
+                index = cls(path)
+                cls._instances[path] = index
+            return index
+    
+    @contextmanager
+    def key_lock(self, board_id: str, external_key: str) -> Iterator[None]:
+        """
+        Serialize callers working on the same key within this process
+        
+        Hold it across a lookup, the Trello call and the write of its result,
+        so two concurrent upserts of a new key cannot both create a card. Locks
+        are dropped once no caller holds or waits for them.
+        
+        Args:
+            board_id: Board the card lives on
+            external_key: Caller-supplied key
+        """
+        key = (board_id, external_key)
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+    
+    def get(self, board_id: str, external_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an indexed card
+        
+        Args:
+            board_id: Board the card lives on
+            external_key: Caller-supplied key
+            
+        Returns:
+            Dictionary with card_id, card_url, fields and content_hash, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT card_id, card_url, fields, content_hash FROM card_index '
+                'WHERE board_id = ? AND external_key = ?',
+                (board_id, external_key)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'card_id': row[0],
+            'card_url': row[1],
+            'fields': json.loads(row[2]),
+            'content_hash': row[3]
+        }
+    
+    def put(self, board_id: str, external_key: str, card_id: str,
+            fields: Dict[str, Any], card_url: str = '') -> None:
+        """
+        Insert or replace an index entry
+        
+        Args:
+            board_id: Board the card lives on
+            external_key: Caller-supplied key
+            card_id: Trello card ID
+            fields: Fields last written to the card
+            card_url: Card URL
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO card_index '
+                '(board_id, external_key, card_id, card_url, fields, content_hash, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (board_id, external_key, card_id, card_url,
+                 json.dumps(fields, ensure_ascii=False), content_hash(fields), time.time())
+            )
+    
+    def delete(self, board_id: str, external_key: str) -> None:
+        """
+        Remove an index entry
+        
+        Args:
+            board_id: Board the card lives on
+            external_key: Caller-supplied key
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                'DELETE FROM card_index WHERE board_id = ? AND external_key = ?',
+                (board_id, external_key)
+            )
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""
+Circuit breaker for Trello API calls
+"""
+import requests
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from .fingerprint import credential_fingerprint
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """
+    Raised instead of making a request while a circuit breaker is open
+    """
+    
+    def __init__(self, breaker_name: str, retry_after: float):
+        """
+        Initialize the error
+        
+        Args:
+            breaker_name: Name of the open breaker
+            retry_after: Seconds until the breaker allows a probe request
+        """
+        super().__init__(
+            f"Trello API temporarily unavailable (circuit '{breaker_name}' open, "
+            f"retry in {retry_after:.0f}s)"
+        )
+        self.breaker_name = breaker_name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker tracking failure and slow-call rates
+    
+    Closed: calls flow and their outcomes are recorded.
+    Open: calls fail immediately with CircuitOpenError until open_duration passes.
+    Half-open: a limited number of probe calls are let through; if they all
+    succeed the breaker closes, any failure re-opens it.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, name: str, window_size: int = 20, min_calls: int = 10,
+                 failure_rate_threshold: float = 0.5, slow_call_duration: float = 10.0,
+                 slow_call_rate_threshold: float = 0.8, open_duration: float = 30.0,
+                 half_open_max_calls: int = 2):
+        """
+        Initialize the circuit breaker
+        
+        Args:
+            name: Breaker name used in errors and metrics
+            window_size: Number of recent calls considered
+            min_calls: Calls required in the window before the breaker can trip
+            failure_rate_threshold: Failure ratio that opens the breaker
+            slow_call_duration: Seconds after which a call counts as slow
+            slow_call_rate_threshold: Slow call ratio that opens the breaker
+            open_duration: Seconds to stay open before allowing probes
+            half_open_max_calls: Probe calls allowed while half-open
+        """
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._counters = {
+            'calls': 0,
+            'failures': 0,
+            'slow_calls': 0,
+            'rejected': 0,
+            'opened': 0
+        }
+    
+    @property
+    def state(self) -> str:
+        """
+        Current breaker state, moving from open to half-open once open_duration has passed
+        """
+        with self._lock:
+            self._refresh_state()
+            return self._state
+    
+    def _refresh_state(self) -> None:
+        """
+        Move an open breaker to half-open when its open period is over; caller holds the lock
+        """
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+    
+    def before_call(self) -> None:
+        """
+        Reserve permission for a call
+        
+        Raises:
+            CircuitOpenError: If the breaker is open or its probe budget is used up
+        """
+        with self._lock:
+            self._refresh_state()
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return
+            self._counters['rejected'] += 1
+            retry_after = max(0.0, self.open_duration - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(self.name, retry_after)
+    
+    def release(self) -> None:
+        """
+        Give back a permission reserved by before_call without recording an outcome
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+    
+    def record(self, success: bool, duration: float) -> None:
+        """
+        Record the outcome of a call allowed by before_call
+        
+        Args:
+            success: Whether the call succeeded
+            duration: Call duration in seconds
+        """
+        slow = duration >= self.slow_call_duration
+        with self._lock:
+            self._counters['calls'] += 1
+            if not success:
+                self._counters['failures'] += 1
+            if slow:
+                self._counters['slow_calls'] += 1
+            
+            if self._state == self.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if not success or slow:
+                    self._trip()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_max_calls:
+                        self._state = self.CLOSED
+                        self._outcomes.clear()
+                return
+            
+            if self._state == self.OPEN:
+                return
+            
+            self._outcomes.append((success, slow))
+            if len(self._outcomes) >= self.min_calls:
+                total = len(self._outcomes)
+                failure_rate = sum(1 for ok, _ in self._outcomes if not ok) / total
+                slow_rate = sum(1 for _, is_slow in self._outcomes if is_slow) / total
+                if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+                    self._trip()
+    
+    def _trip(self) -> None:
+        """
+        Open the breaker; caller holds the lock
+        """
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._counters['opened'] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the breaker state and counters for metrics
+        
+        Returns:
+            Dictionary with state, window rates and lifetime counters
+        """
+        with self._lock:
+            self._refresh_state()
+            total = len(self._outcomes)
+            return {
+                'name': self.name,
+                'state': self._state,
+                'window_calls': total,
+                'failure_rate': sum(1 for ok, _ in self._outcomes if not ok) / total if total else 0.0,
+                'slow_call_rate': sum(1 for _, slow in self._outcomes if slow) / total if total else 0.0,
+                **self._counters
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """
+    Get the shared breaker with the given name, creating it if needed
+    
+    Args:
+        name: Breaker name, e.g. 'host:api.trello.com'
+        
+    Returns:
+        Shared CircuitBreaker instance
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        return breaker
+
+
+def get_breakers_for(host: str, api_key: str, token: str) -> List[CircuitBreaker]:
+    """
+    Get the host-wide and per-credential breakers guarding a request
+    
+    Args:
+        host: API host name
+        api_key: Trello API key
+        token: Trello token
+        
+    Returns:
+        [host breaker, credential breaker]
+    """
+    return [
+        get_breaker(f'host:{host}'),
+        get_breaker(f'credential:{host}:{credential_fingerprint(api_key, token)}')
+    ]
+
+
+def get_breaker_states(names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get snapshots of shared breakers for metrics export
+    
+    Args:
+        names: Breaker names to include; all breakers when omitted
+        
+    Returns:
+        Mapping of breaker name to snapshot
+    """
+    with _breakers_lock:
+        breakers = [b for name, b in _breakers.items() if names is None or name in names]
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""
+Location of the plugin's local state
+"""
+import os
+
+
+def default_data_dir() -> str:
+    """
+    Get the directory for the plugin's local state
+    
+    Returns:
+        TRELLO_PLUGIN_DATA_DIR if set, otherwise ~/.dify-trello-plugin
+    """
+    return os.getenv('TRELLO_PLUGIN_DATA_DIR') or os.path.join(os.path.expanduser('~'), '.dify-trello-plugin')
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Non-reversible identifiers for Trello credentials
+"""
+import hashlib
+
+
+def fingerprint(*secrets: str) -> str:
+    """
+    Get a short non-reversible identifier for one or more secrets
+    
+    Used to key shared state (breakers, rate limiters, caches) by credential
+    without keeping the credential itself in names, logs or metrics.
+    
+    Args:
+        *secrets: API key, token, or both
+        
+    Returns:
+        First 12 hex characters of the SHA-256 of the secrets joined with ':'
+    """
+    return hashlib.sha256(':'.join(secrets).encode('utf-8')).hexdigest()[:12]
+
+
+def credential_fingerprint(api_key: str, token: str) -> str:
+    """
+    Get a short non-reversible identifier for a set of credentials
+    
+    Args:
+        api_key: Trello API key
+        token: Trello token
+        
+    Returns:
+        Fingerprint of the key and token together
+    """
+    return fingerprint(api_key, token)
\ No newline at end of file
@@ -0,0 +1,218 @@
+"""
+Latency-based request hedging for idempotent Trello GETs
+"""
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+
+_ID_PATTERN = re.compile(r'\b[0-9a-fA-F]{24}\b')
+
+
+def route_template(endpoint: str) -> str:
+    """
+    Collapse Trello IDs in an endpoint so latencies are tracked per route
+    
+    Args:
+        endpoint: API endpoint, e.g. 'boards/5f0c.../labels'
+        
+    Returns:
+        Route template, e.g. 'boards/:id/labels'
+    """
+    return _ID_PATTERN.sub(':id', endpoint.split('?', 1)[0].strip('/'))
+
+
+class HedgePolicy:
+    """
+    Decides when to send a duplicate GET, based on observed latencies
+    
+    A hedge is sent once the first request has been outstanding longer than
+    the configured percentile of recent latencies for the same route. Until a
+    route has ``min_samples`` observations, ``initial_delay`` is used. Each
+    first request runs on a thread of its own, so hedging never limits how
+    many GETs are in flight. Hedges run on a bounded pool and are only sent
+    when one of its workers is free, so they never queue and add no load
+    once the pool is saturated.
+    """
+    
+    _instances: Dict[float, 'HedgePolicy'] = {}
+    _instances_lock = threading.Lock()
+    
+    def __init__(self, percentile: float = 95.0, window_size: int = 200, min_samples: int = 20,
+                 initial_delay: float = 1.0, min_delay: float = 0.05, max_delay: float = 5.0,
+                 max_workers: int = 16):
+        """
+        Initialize the policy
+        
+        Args:
+            percentile: Latency percentile (0-100) after which a hedge is sent
+            window_size: Recent latencies kept per route
+            min_samples: Observations needed before the percentile is trusted
+            initial_delay: Hedge delay in seconds while samples are scarce
+            min_delay: Lower bound for the hedge delay in seconds
+            max_delay: Upper bound for the hedge delay in seconds
+            max_workers: Threads available for in-flight hedges
+        """
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be between 0 and 100')
+        self.percentile = percentile
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='trello-hedge')
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._outstanding = 0
+    
+    @classmethod
+    def shared(cls, percentile: float) -> 'HedgePolicy':
+        """
+        Get the process-wide policy for a percentile, so latency history
+        survives across clients and tool invocations
+        
+        Args:
+            percentile: Latency percentile (0-100)
+            
+        Returns:
+            Shared HedgePolicy instance
+        """
+        with cls._instances_lock:
+            policy = cls._instances.get(percentile)
+            if policy is None:
+                policy = cls(percentile)
+                cls._instances[percentile] = policy
+            return policy
+    
+    def start(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Run the first leg of a hedged request on a thread of its own
+        
+        The calling thread only waits on this leg, so giving it a dedicated
+        thread adds no concurrency, and unlike a pool it cannot make callers
+        wait for each other.
+        
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            
+        Returns:
+            Future of the call
+        """
+        future: Future = Future()
+        
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        
+        threading.Thread(target=run, name='trello-request', daemon=True).start()
+        return future
+    
+    def try_submit(self, fn: Callable[..., Any], *args: Any) -> Optional[Future]:
+        """
+        Run a hedge on the pool only if a worker is free right now
+        
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            
+        Returns:
+            Future of the call, or None if every worker is busy or already claimed
+        """
+        with self._lock:
+            if self._outstanding >= self.max_workers:
+                return None
+            self._outstanding += 1
+        return self._submit(fn, *args)
+    
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Submit a hedge already counted as outstanding
+        
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            
+        Returns:
+            Future of the call
+        """
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self._leg_done(None)
+            raise
+        future.add_done_callback(self._leg_done)
+        return future
+    
+    def _leg_done(self, future: Optional[Future]) -> None:
+        """
+        Stop counting a finished hedge as outstanding
+        
+        Args:
+            future: Finished future
+        """
+        with self._lock:
+            self._outstanding -= 1
+    
+    def observe(self, endpoint: str, duration: float) -> None:
+        """
+        Record the latency of a completed request
+        
+        Args:
+            endpoint: API endpoint that was called
+            duration: Request duration in seconds
+        """
+        route = route_template(endpoint)
+        with self._lock:
+            window = self._latencies.get(route)
+            if window is None:
+                window = self._latencies[route] = deque(maxlen=self.window_size)
+            window.append(duration)
+    
+    def delay_for(self, endpoint: str) -> float:
+        """
+        Get how long to wait for a response before hedging
+        
+        Args:
+            endpoint: API endpoint about to be called
+            
+        Returns:
+            Hedge delay in seconds
+        """
+        with self._lock:
+            window = self._latencies.get(route_template(endpoint))
+            samples = sorted(window) if window and len(window) >= self.min_samples else None
+        if samples is None:
+            delay = self.initial_delay
+        else:
+            delay = samples[min(len(samples) - 1, int(len(samples) * self.percentile / 100))]
+        return min(self.max_delay, max(self.min_delay, delay))
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current hedge delay per observed route
+        
+        Returns:
+            Dictionary with the percentile, outstanding hedges and a per-route
+            delay and sample count
+        """
+        with self._lock:
+            routes = {route: len(window) for route, window in self._latencies.items()}
+            outstanding = self._outstanding
+        return {
+            'percentile': self.percentile,
+            'outstanding': outstanding,
+            'routes': {
+                route: {'samples': count, 'delay': round(self.delay_for(route), 4)}
+                for route, count in routes.items()
+            }
+        }
\ No newline at end of file
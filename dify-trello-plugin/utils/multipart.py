@@ -0,0 +1,167 @@
+"""
+Streaming multipart/form-data encoding for file uploads
+"""
+import mimetypes
+import os
+import uuid
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+AttachmentSource = Union[str, os.PathLike, bytes, Iterable[bytes]]
+
+
+class FilePart:
+    """
+    A file field of a multipart body, read lazily in chunks
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, field_name: str, source: AttachmentSource, filename: Optional[str] = None,
+                 mime_type: Optional[str] = None):
+        """
+        Initialize the file part
+        
+        Args:
+            field_name: Form field name
+            source: Path on disk, bytes, or an iterable yielding bytes chunks
+            filename: File name sent to the server; defaults to the path's base name
+            mime_type: Content type; guessed from the file name when omitted
+        """
+        self.field_name = field_name
+        self.source = source
+        self.is_path = isinstance(source, (str, os.PathLike))
+        if filename is None:
+            filename = os.path.basename(os.fspath(source)) if self.is_path else 'attachment'
+        self.filename = filename
+        self.mime_type = mime_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    
+    @property
+    def size(self) -> Optional[int]:
+        """
+        Size in bytes when known up front (paths and bytes), otherwise None
+        """
+        if self.is_path:
+            return os.path.getsize(self.source)
+        if isinstance(self.source, (bytes, bytearray)):
+            return len(self.source)
+        return None
+    
+    @property
+    def replayable(self) -> bool:
+        """
+        Whether the part can be read more than once, e.g. for a retry
+        """
+        return self.is_path or isinstance(self.source, (bytes, bytearray))
+    
+    def iter_content(self) -> Iterator[bytes]:
+        """
+        Read the part content in chunks
+        
+        Yields:
+            Chunks of file content
+        """
+        if self.is_path:
+            with open(self.source, 'rb') as f:
+                while True:
+                    chunk = f.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+        elif isinstance(self.source, (bytes, bytearray)):
+            yield bytes(self.source)
+        else:
+            for chunk in self.source:
+                yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+class MultipartStream:
+    """
+    Iterable multipart/form-data body that never holds a whole file in memory
+    
+    When every part has a known size the stream reports its total length, so
+    requests sends a Content-Length header; otherwise the body is sent with
+    chunked transfer encoding.
+    """
+    
+    def __init__(self, fields: Optional[Dict[str, str]] = None, files: Optional[List[FilePart]] = None):
+        """
+        Initialize the multipart body
+        
+        Args:
+            fields: Plain form fields
+            files: File parts
+        """
+        self.boundary = uuid.uuid4().hex
+        self.fields = fields or {}
+        self.files = files or []
+    
+    @property
+    def content_type(self) -> str:
+        """
+        Content-Type header value including the boundary
+        """
+        return f'multipart/form-data; boundary={self.boundary}'
+    
+    @property
+    def replayable(self) -> bool:
+        """
+        Whether the body can be iterated more than once
+        """
+        return all(part.replayable for part in self.files)
+    
+    def _field_header(self, name: str) -> bytes:
+        """
+        Encode the boundary and headers preceding a plain form field
+        """
+        return (f'--{self.boundary}\r\n'
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n').encode('utf-8')
+    
+    def _file_header(self, part: FilePart) -> bytes:
+        """
+        Encode the boundary and headers preceding a file part
+        """
+        filename = part.filename.replace('"', '%22')
+        return (f'--{self.boundary}\r\n'
+                f'Content-Disposition: form-data; name="{part.field_name}"; filename="{filename}"\r\n'
+                f'Content-Type: {part.mime_type}\r\n\r\n').encode('utf-8')
+    
+    def _closing(self) -> bytes:
+        """
+        Encode the closing boundary
+        """
+        return f'--{self.boundary}--\r\n'.encode('utf-8')
+    
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Produce the encoded body chunk by chunk
+        
+        Yields:
+            Encoded body chunks
+        """
+        for name, value in self.fields.items():
+            yield self._field_header(name) + str(value).encode('utf-8') + b'\r\n'
+        for part in self.files:
+            yield self._file_header(part)
+            for chunk in part.iter_content():
+                if chunk:
+                    yield chunk
+            yield b'\r\n'
+        yield self._closing()
+    
+    @property
+    def len(self) -> Optional[int]:
+        """
+        Total body length in bytes, or None when a part is streamed from a generator
+        
+        requests reads this attribute to decide between a Content-Length header
+        and chunked transfer encoding.
+        """
+        total = len(self._closing())
+        for name, value in self.fields.items():
+            total += len(self._field_header(name)) + len(str(value).encode('utf-8')) + 2
+        for part in self.files:
+            size = part.size
+            if size is None:
+                return None
+            total += len(self._file_header(part)) + size + 2
+        return total
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Short-lived cache of Trello IDs recently reported as not found
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+
+class NegativeIDCache:
+    """
+    Remembers well-formed IDs that Trello answered with 404, so repeated lookups
+    of the same missing board, list or member fail without a network round trip
+    
+    Entries are scoped by credential, since a 404 can also mean "no access".
+    """
+    
+    def __init__(self, ttl: float = 300.0, max_entries: int = 10000):
+        """
+        Initialize the cache
+        
+        Args:
+            ttl: Seconds an entry stays valid
+            max_entries: Maximum entries kept; the oldest are evicted first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[str, str, str], float]' = OrderedDict()
+    
+    def add(self, scope: str, kind: str, trello_id: str) -> None:
+        """
+        Record an ID as missing
+        
+        Args:
+            scope: Credential fingerprint the 404 was observed with
+            kind: Resource kind, e.g. 'board', 'list' or 'member'
+            trello_id: The missing ID
+        """
+        key = (scope, kind, trello_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = time.monotonic() + self.ttl
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def contains(self, scope: str, kind: str, trello_id: str) -> bool:
+        """
+        Check whether an ID was recently reported missing
+        
+        Args:
+            scope: Credential fingerprint
+            kind: Resource kind
+            trello_id: ID to check
+            
+        Returns:
+            True if a live entry exists
+        """
+        key = (scope, kind, trello_id)
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False
+            return True
+    
+    def discard(self, scope: str, kind: str, trello_id: str) -> None:
+        """
+        Forget an ID, e.g. after it was seen to exist
+        
+        Args:
+            scope: Credential fingerprint
+            kind: Resource kind
+            trello_id: ID to forget
+        """
+        with self._lock:
+            self._entries.pop((scope, kind, trello_id), None)
+    
+    def __len__(self) -> int:
+        """
+        Number of entries currently stored, including expired ones not yet evicted
+        """
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide cache shared by all tools
+negative_id_cache = NegativeIDCache()
\ No newline at end of file
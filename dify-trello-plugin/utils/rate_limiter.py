@@ -0,0 +1,151 @@
+"""
+Client-side token bucket rate limiting for Trello API calls
+"""
+import threading
+import time
+from typing import Any, Dict, List
+
+from .fingerprint import fingerprint
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every client using the same credentials
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    short bursts are allowed while the sustained rate stays under the limit.
+    """
+    
+    def __init__(self, name: str, rate: float, capacity: float):
+        """
+        Initialize a full bucket
+        
+        Args:
+            name: Bucket name used in metrics
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """
+        Add the tokens accrued since the last update; caller holds the lock
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Take tokens only if they are available right now
+        
+        Args:
+            tokens: Tokens to take
+            
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+    
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens, sleeping until they are available
+        
+        Args:
+            tokens: Tokens to take
+            
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+    
+    def release(self, tokens: float = 1) -> None:
+        """
+        Return tokens that were taken but not used
+        
+        Args:
+            tokens: Tokens to return
+        """
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current bucket state
+        
+        Returns:
+            Dictionary with available tokens, rate and capacity
+        """
+        with self._lock:
+            self._refill()
+            return {
+                'available': round(self._tokens, 2),
+                'rate': self.rate,
+                'capacity': self.capacity
+            }
+
+
+# Trello allows 300 requests per 10 seconds per API key and 100 per 10 seconds per token.
+# A bucket admits up to capacity + rate * 10 requests in any 10 second window, so
+# a tenth of each limit is burst and the rest refills over the window.
+API_KEY_LIMIT = (27.0, 30)
+TOKEN_LIMIT = (9.0, 10)
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(name: str, rate: float, capacity: float) -> TokenBucket:
+    """
+    Get the shared bucket with the given name, creating it if needed
+    
+    Args:
+        name: Bucket name, e.g. 'token:1a2b3c4d5e6f'
+        rate: Tokens per second for a new bucket
+        capacity: Burst size for a new bucket
+        
+    Returns:
+        Shared TokenBucket instance
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(name, rate, capacity)
+            _buckets[name] = bucket
+        return bucket
+
+
+def get_rate_limiters_for(api_key: str, token: str) -> List[TokenBucket]:
+    """
+    Get the per-API-key and per-token buckets a request must draw from
+    
+    Args:
+        api_key: Trello API key
+        token: Trello token
+        
+    Returns:
+        [api key bucket, token bucket]
+    """
+    return [
+        get_bucket(f'key:{fingerprint(api_key)}', *API_KEY_LIMIT),
+        get_bucket(f'token:{fingerprint(token)}', *TOKEN_LIMIT)
+    ]
\ No newline at end of file
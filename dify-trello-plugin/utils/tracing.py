@@ -0,0 +1,379 @@
+"""
+In-process trace spans and sampled profiling for plugin invocations
+"""
+import contextvars
+import cProfile
+import json
+import os
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from .data_dir import default_data_dir
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# OTLP span kind for in-process work
+SPAN_KIND_INTERNAL = 1
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar('trello_current_span', default=None)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """
+    Encode an attribute value as an OTLP/JSON AnyValue
+    
+    Args:
+        value: Attribute value
+        
+    Returns:
+        AnyValue dictionary
+    """
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Encode attributes as an OTLP/JSON KeyValue list
+    
+    Args:
+        attributes: Attribute mapping
+        
+    Returns:
+        List of key/value dictionaries
+    """
+    return [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items()]
+
+
+class Span:
+    """
+    A timed unit of work with attributes, events and a status
+    """
+    
+    def __init__(self, name: str, trace_id: str, parent: Optional['Span'] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        """
+        Start a span
+        
+        Args:
+            name: Span name, e.g. 'trello.card_post'
+            trace_id: 32 hex character trace ID
+            parent: Parent span, or None for a root span
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent else ''
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.status_code = STATUS_UNSET
+        self.status_message = ''
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set an attribute
+        
+        Args:
+            key: Attribute name
+            value: str, bool, int or float value
+        """
+        self.attributes[key] = value
+    
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a timestamped event, e.g. a retry or backoff
+        
+        Args:
+            name: Event name
+            attributes: Event attributes
+        """
+        self.events.append({
+            'name': name,
+            'time_ns': time.time_ns(),
+            'attributes': dict(attributes or {})
+        })
+    
+    def set_status(self, code: int, message: str = '') -> None:
+        """
+        Set the span status
+        
+        Args:
+            code: STATUS_OK or STATUS_ERROR
+            message: Error description
+        """
+        self.status_code = code
+        self.status_message = message
+    
+    def end(self) -> None:
+        """
+        End the span; later calls are ignored
+        """
+        if self.end_time_ns is None:
+            self.duration = time.perf_counter() - self._start
+            self.end_time_ns = self.start_time_ns + int(self.duration * 1e9)
+    
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Encode the span as an OTLP/JSON Span
+        
+        Returns:
+            Span dictionary
+        """
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': SPAN_KIND_INTERNAL,
+            'startTimeUnixNano': str(self.start_time_ns),
+            'endTimeUnixNano': str(self.end_time_ns or self.start_time_ns),
+            'attributes': _otlp_attributes(self.attributes),
+            'events': [
+                {
+                    'timeUnixNano': str(event['time_ns']),
+                    'name': event['name'],
+                    'attributes': _otlp_attributes(event['attributes'])
+                }
+                for event in self.events
+            ],
+            'status': {'code': self.status_code}
+        }
+        if self.parent_span_id:
+            span['parentSpanId'] = self.parent_span_id
+        if self.status_message:
+            span['status']['message'] = self.status_message
+        return span
+
+
+class Tracer:
+    """
+    Collects spans per trace and exports each finished trace as an OTLP/JSON
+    ``resourceSpans`` document
+    
+    Finished traces are kept in a bounded in-memory buffer and, when an export
+    path is set, appended to it as one JSON line per trace. Root spans opened
+    with ``profile=True`` are sampled for a cProfile CPU profile and a
+    tracemalloc allocation summary written to ``profile_dir``.
+    """
+    
+    SCOPE_NAME = 'dify-trello-plugin'
+    TOP_ALLOCATIONS = 25
+    
+    def __init__(self, service_name: str = 'dify-trello-plugin', max_traces: int = 100,
+                 export_path: Optional[str] = None, profile_sample_rate: float = 0.0,
+                 profile_dir: Optional[str] = None):
+        """
+        Initialize the tracer
+        
+        Args:
+            service_name: service.name resource attribute
+            max_traces: Finished traces kept in memory
+            export_path: JSONL file to append finished traces to
+            profile_sample_rate: Fraction (0-1) of profiled root spans to capture
+            profile_dir: Directory for profile files; defaults to profiles/ in the data directory
+        """
+        self.service_name = service_name
+        self.export_path = export_path
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_dir = profile_dir or os.path.join(default_data_dir(), 'profiles')
+        self._lock = threading.Lock()
+        self._open_traces: Dict[str, List[Span]] = {}
+        self._finished: Deque[Dict[str, Any]] = deque(maxlen=max_traces)
+        # cProfile and tracemalloc are process-wide, so capture one profile at a time
+        self._profile_lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls) -> 'Tracer':
+        """
+        Create a tracer configured from TRELLO_TRACE_FILE, TRELLO_PROFILE_SAMPLE_RATE
+        and TRELLO_PROFILE_DIR
+        
+        Returns:
+            Configured Tracer
+        """
+        try:
+            sample_rate = min(1.0, max(0.0, float(os.getenv('TRELLO_PROFILE_SAMPLE_RATE', '0'))))
+        except ValueError:
+            sample_rate = 0.0
+        return cls(
+            export_path=os.getenv('TRELLO_TRACE_FILE') or None,
+            profile_sample_rate=sample_rate,
+            profile_dir=os.getenv('TRELLO_PROFILE_DIR') or None
+        )
+    
+    @contextmanager
+    def span(self, name: str, profile: bool = False, **attributes: Any) -> Iterator[Span]:
+        """
+        Open a span as a child of the current span, or as a new trace
+        
+        Exceptions escaping the block mark the span as an error and are re-raised.
+        
+        Args:
+            name: Span name
+            profile: Sample this span for CPU/allocation profiling
+            **attributes: Initial attributes
+            
+        Yields:
+            The open span
+        """
+        parent = _current_span.get()
+        span = Span(name, parent.trace_id if parent else os.urandom(16).hex(), parent, attributes)
+        with self._lock:
+            self._open_traces.setdefault(span.trace_id, []).append(span)
+        token = _current_span.set(span)
+        try:
+            if profile and self.profile_sample_rate and random.random() < self.profile_sample_rate:
+                with self._profile(span):
+                    yield span
+            else:
+                yield span
+        except BaseException as e:
+            span.set_status(STATUS_ERROR, f'{type(e).__name__}: {e}')
+            span.add_event('exception', {'exception.type': type(e).__name__, 'exception.message': str(e)})
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            if parent is None:
+                self._finish_trace(span.trace_id)
+    
+    @contextmanager
+    def _profile(self, span: Span) -> Iterator[None]:
+        """
+        Capture a CPU profile and allocation summary of the block
+        
+        cProfile only sees the calling thread; work on pool threads (hedged
+        GETs, concurrent uploads) shows up as time spent waiting.
+        
+        Args:
+            span: Span to annotate with the profile file paths
+        """
+        if not self._profile_lock.acquire(blocking=False):
+            span.set_attribute('profile.skipped', 'busy')
+            yield
+            return
+        try:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiler is already active in this process
+                span.set_attribute('profile.skipped', 'profiler_active')
+                yield
+                return
+            started_tracemalloc = not tracemalloc.is_tracing()
+            if started_tracemalloc:
+                tracemalloc.start()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                snapshot = tracemalloc.take_snapshot()
+                if started_tracemalloc:
+                    tracemalloc.stop()
+                self._write_profile(span, profiler, snapshot)
+        finally:
+            self._profile_lock.release()
+    
+    def _write_profile(self, span: Span, profiler: cProfile.Profile, snapshot: tracemalloc.Snapshot) -> None:
+        """
+        Write captured profile data and record the paths on the span
+        
+        Args:
+            span: Profiled span
+            profiler: Stopped CPU profiler
+            snapshot: Allocation snapshot
+        """
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            base = os.path.join(self.profile_dir, f'{span.name}-{span.trace_id[:16]}')
+            profiler.dump_stats(f'{base}.prof')
+            with open(f'{base}.alloc.txt', 'w', encoding='utf-8') as f:
+                for stat in snapshot.statistics('lineno')[:self.TOP_ALLOCATIONS]:
+                    f.write(f'{stat}\n')
+            span.set_attribute('profile.cpu_path', f'{base}.prof')
+            span.set_attribute('profile.alloc_path', f'{base}.alloc.txt')
+        except OSError as e:
+            span.set_attribute('profile.error', str(e))
+    
+    def _finish_trace(self, trace_id: str) -> None:
+        """
+        Export a trace once its root span has ended
+        
+        Args:
+            trace_id: Trace to export
+        """
+        with self._lock:
+            spans = self._open_traces.pop(trace_id, [])
+        document = {
+            'resourceSpans': [{
+                'resource': {'attributes': _otlp_attributes({'service.name': self.service_name})},
+                'scopeSpans': [{
+                    'scope': {'name': self.SCOPE_NAME},
+                    'spans': [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+        with self._lock:
+            self._finished.append(document)
+            if self.export_path:
+                try:
+                    with open(self.export_path, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(document, separators=(',', ':')) + '\n')
+                except OSError:
+                    # Tracing must never break an invocation
+                    pass
+    
+    def recent_traces(self) -> List[Dict[str, Any]]:
+        """
+        Get the most recently finished traces
+        
+        Returns:
+            OTLP/JSON resourceSpans documents, oldest first
+        """
+        with self._lock:
+            return list(self._finished)
+
+
+def current_span() -> Optional[Span]:
+    """
+    Get the span open in the current context
+    
+    Returns:
+        Current span, or None outside any span
+    """
+    return _current_span.get()
+
+
+def add_span_event(name: str, **attributes: Any) -> None:
+    """
+    Record an event on the current span, if any
+    
+    Args:
+        name: Event name
+        **attributes: Event attributes
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.add_event(name, attributes)
+
+
+# Process-wide tracer shared by the provider and tools
+tracer = Tracer.from_env()
\ No newline at end of file
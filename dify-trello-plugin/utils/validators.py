@@ -3,7 +3,7 @@ Input validation utilities for Trello plugin
 """
 import re
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class TrelloValidator:
@@ -18,6 +18,7 @@ class TrelloValidator:
     MAX_TITLE_LENGTH = 512
     MAX_DESCRIPTION_LENGTH = 10000
     MAX_LABELS = 10
+    MAX_LABEL_LENGTH = 50
     
     @classmethod
     def validate_trello_id(cls, trello_id: str, field_name: str = "ID") -> Tuple[bool, str]:
@@ -72,12 +73,15 @@ class TrelloValidator:
         return cleaned_title, warning
     
     @classmethod
-    def validate_and_clean_description(cls, description: str) -> Tuple[str, Optional[str]]:
+    def validate_and_clean_description(cls, description: str, truncation_note: Optional[str] = None,
+                                       truncation_warning: Optional[str] = None) -> Tuple[str, Optional[str]]:
         """
         Validate and clean card description
         
         Args:
             description: Card description to validate
+            truncation_note: Note appended in place of the default truncation notice
+            truncation_warning: Warning returned in place of the default truncation warning
             
         Returns:
             Tuple of (cleaned_description, warning_message)
@@ -94,8 +98,8 @@ class TrelloValidator:
         
         if len(cleaned_description) > cls.MAX_DESCRIPTION_LENGTH:
             cleaned_description = cleaned_description[:cls.MAX_DESCRIPTION_LENGTH - 50]
-            cleaned_description += "\n\n[Content truncated due to length limit]"
-            warning = f"Description was truncated to {cls.MAX_DESCRIPTION_LENGTH} characters"
+            cleaned_description += "\n\n" + (truncation_note or "[Content truncated due to length limit]")
+            warning = truncation_warning or f"Description was truncated to {cls.MAX_DESCRIPTION_LENGTH} characters"
         
         return cleaned_description, warning
     
@@ -156,22 +160,21 @@ class TrelloValidator:
         label_list = [label.strip() for label in labels.split(',')]
         label_list = [label for label in label_list if label]  # Remove empty labels
         
-        warning = None
+        warnings = []
+        
+        # Names are matched against the board's labels, so they are kept intact;
+        # a shortened or stripped name would silently never match
+        too_long = [label for label in label_list if len(label) > cls.MAX_LABEL_LENGTH]
+        if too_long:
+            label_list = [label for label in label_list if len(label) <= cls.MAX_LABEL_LENGTH]
+            warnings.append(f"Labels longer than {cls.MAX_LABEL_LENGTH} characters were ignored: {', '.join(too_long)}")
         
         # Limit number of labels
         if len(label_list) > cls.MAX_LABELS:
             label_list = label_list[:cls.MAX_LABELS]
-            warning = f"Only the first {cls.MAX_LABELS} labels will be used"
-        
-        # Clean individual labels (remove special characters, limit length)
-        cleaned_labels = []
-        for label in label_list:
-            # Remove special characters and limit length
-            cleaned_label = re.sub(r'[^\w\s-]', '', label)[:50]
-            if cleaned_label:
-                cleaned_labels.append(cleaned_label)
+            warnings.append(f"Only the first {cls.MAX_LABELS} labels will be used")
         
-        return cleaned_labels, warning
+        return label_list, '; '.join(warnings) or None
     
     @classmethod
     def validate_member_id(cls, member_id: str) -> Tuple[bool, str]:
@@ -188,6 +191,70 @@ class TrelloValidator:
             return True, ""  # Member ID is optional
         
         return cls.validate_trello_id(member_id, "Member ID")
+    
+    @classmethod
+    def validate_card_fields(cls, card_title: str, card_description: str, board_id: str, list_id: str,
+                             labels: str = '', due_date: str = '', assignee_id: str = '',
+                             truncation_note: Optional[str] = None,
+                             truncation_warning: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], List[str], Optional[str]]:
+        """
+        Sanitize and validate every card creation input without touching the network
+        
+        Args:
+            card_title: Card title
+            card_description: Card description
+            board_id: Board ID
+            list_id: List ID
+            labels: Comma-separated label names
+            due_date: Due date string
+            assignee_id: Optional assignee member ID
+            truncation_note: Note used if the description has to be truncated
+            truncation_warning: Warning reported if the description has to be truncated
+            
+        Returns:
+            Tuple of (cleaned_fields, warnings, error_message). cleaned_fields is None
+            when error_message is set; otherwise it holds title, description,
+            board_id, list_id, labels (list), due_date (ISO or '') and assignee_id.
+        """
+        board_id = board_id.strip() if isinstance(board_id, str) else board_id
+        list_id = list_id.strip() if isinstance(list_id, str) else list_id
+        assignee_id = assignee_id.strip() if isinstance(assignee_id, str) else assignee_id
+        
+        for value, field_name in ((board_id, "Board ID"), (list_id, "List ID")):
+            is_valid, error = cls.validate_trello_id(value, field_name)
+            if not is_valid:
+                return None, [], error
+        
+        is_valid, error = cls.validate_member_id(assignee_id)
+        if not is_valid:
+            return None, [], error.replace("Member ID", "Assignee ID")
+        
+        title, title_warning = cls.validate_and_clean_title(InputSanitizer.sanitize_text(card_title))
+        if not title:
+            return None, [], title_warning
+        
+        description, description_warning = cls.validate_and_clean_description(
+            InputSanitizer.sanitize_multiline_text(card_description), truncation_note, truncation_warning
+        )
+        if not description:
+            return None, [], description_warning
+        
+        is_valid, iso_due_date, error = cls.validate_due_date(due_date)
+        if not is_valid:
+            return None, [], error
+        
+        label_list, labels_warning = cls.validate_and_clean_labels(labels)
+        
+        warnings = [w for w in (title_warning, description_warning, labels_warning) if w]
+        return {
+            'title': title,
+            'description': description,
+            'board_id': board_id,
+            'list_id': list_id,
+            'labels': label_list,
+            'due_date': iso_due_date,
+            'assignee_id': assignee_id or ''
+        }, warnings, None
 
 
 class InputSanitizer:
@@ -217,6 +284,28 @@ class InputSanitizer:
         
         return sanitized.strip()
     
+    @staticmethod
+    def sanitize_multiline_text(text: str) -> str:
+        """
+        Sanitize multi-line text, keeping line breaks and indentation
+        
+        Args:
+            text: Text to sanitize
+            
+        Returns:
+            Sanitized text
+        """
+        if not isinstance(text, str):
+            return ""
+        
+        # Remove null bytes and control characters, but keep tabs and newlines
+        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        
+        # Normalize line endings
+        sanitized = sanitized.replace('\r\n', '\n').replace('\r', '\n')
+        
+        return sanitized.strip()
+    
     @staticmethod
     def sanitize_id(id_string: str) -> str:
         """